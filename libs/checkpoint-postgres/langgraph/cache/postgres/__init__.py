@@ -0,0 +1,4 @@
+from langgraph.cache.postgres.aio import AsyncPostgresCache
+from langgraph.cache.postgres.base import PostgresCache
+
+__all__ = ["AsyncPostgresCache", "PostgresCache"]
@@ -0,0 +1,108 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Mapping, Optional, Sequence, cast
+
+from psycopg import AsyncConnection
+from psycopg.errors import UndefinedTable
+from psycopg.rows import dict_row
+
+from langgraph.cache.base import FullKey, Namespace
+from langgraph.cache.postgres.base import BasePostgresCache
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+
+class AsyncPostgresCache(BasePostgresCache[AsyncConnection]):
+    """A cache of node results stored in a Postgres database, using an async connection."""
+
+    def __init__(
+        self,
+        conn: AsyncConnection[Any],
+        *,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.conn = conn
+        self.loop = asyncio.get_running_loop()
+
+    @classmethod
+    @asynccontextmanager
+    async def from_conn_string(
+        cls,
+        conn_string: str,
+    ) -> AsyncIterator["AsyncPostgresCache"]:
+        """Create a new AsyncPostgresCache instance from a connection string.
+
+        Args:
+            conn_string (str): The Postgres connection info string.
+
+        Returns:
+            AsyncPostgresCache: A new AsyncPostgresCache instance.
+        """
+        async with await AsyncConnection.connect(
+            conn_string, autocommit=True, prepare_threshold=0, row_factory=dict_row
+        ) as conn:
+            yield cls(conn=conn)
+
+    async def setup(self) -> None:
+        """Set up the cache database asynchronously.
+
+        This method creates the necessary tables in the Postgres database if they don't
+        already exist and runs database migrations. It MUST be called directly by the user
+        the first time the cache is used.
+        """
+        async with self.conn.cursor() as cur:
+            try:
+                await cur.execute(
+                    "SELECT v FROM cache_migrations ORDER BY v DESC LIMIT 1"
+                )
+                row = cast(dict, await cur.fetchone())
+                if row is None:
+                    version = -1
+                else:
+                    version = row["v"]
+            except UndefinedTable:
+                version = -1
+                # Create cache_migrations table if it doesn't exist
+                await cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS cache_migrations (
+                        v INTEGER PRIMARY KEY
+                    )
+                    """
+                )
+            for v, migration in enumerate(
+                self.MIGRATIONS[version + 1 :], start=version + 1
+            ):
+                await cur.execute(migration)
+                await cur.execute("INSERT INTO cache_migrations (v) VALUES (%s)", (v,))
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        if not keys:
+            return {}
+        query, params = self._get_query(keys)
+        async with self.conn.cursor(binary=True, row_factory=dict_row) as cur:
+            await cur.execute(query, params)
+            return self._load_rows(await cur.fetchall())
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        return asyncio.run_coroutine_threadsafe(self.aget(keys), self.loop).result()
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[Any, Optional[float]]]) -> None:
+        if not pairs:
+            return
+        query, params = self._set_query(pairs)
+        async with self.conn.cursor(binary=True) as cur:
+            await cur.execute(query, params)
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[float]]]) -> None:
+        return asyncio.run_coroutine_threadsafe(self.aset(pairs), self.loop).result()
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        query, params = self._clear_query(namespaces)
+        async with self.conn.cursor(binary=True) as cur:
+            await cur.execute(query, params)
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        return asyncio.run_coroutine_threadsafe(
+            self.aclear(namespaces), self.loop
+        ).result()
@@ -0,0 +1,188 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Any, Generic, Iterator, Mapping, Optional, Sequence, TypeVar, cast
+
+from psycopg import BaseConnection, Connection
+from psycopg.errors import UndefinedTable
+from psycopg.rows import dict_row
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+MIGRATIONS = [
+    """
+CREATE TABLE IF NOT EXISTS cache (
+    ns text NOT NULL,
+    key text NOT NULL,
+    expiry double precision,
+    encoding text NOT NULL,
+    val bytea NOT NULL,
+    PRIMARY KEY (ns, key)
+);
+""",
+]
+
+SELECT_SQL = """
+    SELECT ns, key, expiry, encoding, val
+    FROM cache
+    WHERE (ns, key) IN ({placeholders})
+"""
+
+UPSERT_SQL = """
+    INSERT INTO cache (ns, key, expiry, encoding, val)
+    VALUES {values}
+    ON CONFLICT (ns, key) DO UPDATE
+    SET expiry = EXCLUDED.expiry, encoding = EXCLUDED.encoding, val = EXCLUDED.val
+"""
+
+C = TypeVar("C", bound=BaseConnection)
+
+
+class BasePostgresCache(BaseCache[Any], Generic[C]):
+    MIGRATIONS = MIGRATIONS
+    conn: C
+
+    def _get_query(self, keys: Sequence[FullKey]) -> tuple[str, list[Any]]:
+        placeholders = ",".join(["(%s, %s)"] * len(keys))
+        params: list[Any] = []
+        for ns, key in keys:
+            params.extend((_ns_to_text(ns), key))
+        return SELECT_SQL.format(placeholders=placeholders), params
+
+    def _load_rows(self, rows: Sequence[dict[str, Any]]) -> dict[FullKey, Any]:
+        now = time.time()
+        return {
+            (_text_to_ns(row["ns"]), row["key"]): self.serde.loads_typed(
+                (row["encoding"], row["val"])
+            )
+            for row in rows
+            if row["expiry"] is None or row["expiry"] > now
+        }
+
+    def _set_query(
+        self, pairs: Mapping[FullKey, tuple[Any, Optional[float]]]
+    ) -> tuple[str, list[Any]]:
+        now = time.time()
+        params: list[Any] = []
+        for (ns, key), (value, ttl) in pairs.items():
+            params.extend(
+                (
+                    _ns_to_text(ns),
+                    key,
+                    now + ttl if ttl is not None else None,
+                    *self.serde.dumps_typed(value),
+                )
+            )
+        values = ",".join(["(%s, %s, %s, %s, %s)"] * len(pairs))
+        return UPSERT_SQL.format(values=values), params
+
+    def _clear_query(
+        self, namespaces: Optional[Sequence[Namespace]]
+    ) -> tuple[str, list[Any]]:
+        if namespaces is None:
+            return "DELETE FROM cache", []
+        return "DELETE FROM cache WHERE ns = ANY(%s)", [
+            [_ns_to_text(ns) for ns in namespaces]
+        ]
+
+
+class PostgresCache(BasePostgresCache[Connection]):
+    """A cache of node results stored in a Postgres database."""
+
+    def __init__(
+        self,
+        conn: Connection[Any],
+        *,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.conn = conn
+
+    @classmethod
+    @contextmanager
+    def from_conn_string(
+        cls,
+        conn_string: str,
+    ) -> Iterator["PostgresCache"]:
+        """Create a new PostgresCache instance from a connection string.
+
+        Args:
+            conn_string (str): The Postgres connection info string.
+
+        Returns:
+            PostgresCache: A new PostgresCache instance.
+        """
+        with Connection.connect(
+            conn_string, autocommit=True, prepare_threshold=0, row_factory=dict_row
+        ) as conn:
+            yield cls(conn=conn)
+
+    def setup(self) -> None:
+        """Set up the cache database.
+
+        This method creates the necessary tables in the Postgres database if they don't
+        already exist and runs database migrations. It MUST be called directly by the user
+        the first time the cache is used.
+        """
+        with self.conn.cursor(binary=True) as cur:
+            try:
+                cur.execute("SELECT v FROM cache_migrations ORDER BY v DESC LIMIT 1")
+                row = cast(dict, cur.fetchone())
+                if row is None:
+                    version = -1
+                else:
+                    version = row["v"]
+            except UndefinedTable:
+                self.conn.rollback()
+                version = -1
+                # Create cache_migrations table if it doesn't exist
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS cache_migrations (
+                        v INTEGER PRIMARY KEY
+                    )
+                """
+                )
+            for v, migration in enumerate(
+                self.MIGRATIONS[version + 1 :], start=version + 1
+            ):
+                cur.execute(migration)
+                cur.execute("INSERT INTO cache_migrations (v) VALUES (%s)", (v,))
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        if not keys:
+            return {}
+        query, params = self._get_query(keys)
+        with self.conn.cursor(binary=True, row_factory=dict_row) as cur:
+            cur.execute(query, params)
+            return self._load_rows(cur.fetchall())
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, keys)
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[float]]]) -> None:
+        if not pairs:
+            return
+        query, params = self._set_query(pairs)
+        with self.conn.cursor(binary=True) as cur:
+            cur.execute(query, params)
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[Any, Optional[float]]]) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.set, pairs)
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        query, params = self._clear_query(namespaces)
+        with self.conn.cursor(binary=True) as cur:
+            cur.execute(query, params)
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.clear, namespaces)
+
+
+def _ns_to_text(ns: Namespace) -> str:
+    return ",".join(ns)
+
+
+def _text_to_ns(text: str) -> Namespace:
+    return tuple(text.split(",")) if text else ()
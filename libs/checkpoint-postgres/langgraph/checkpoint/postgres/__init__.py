@@ -10,7 +10,6 @@ from psycopg.types.json import Jsonb
 from psycopg_pool import ConnectionPool
 
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
@@ -163,6 +162,9 @@ class PostgresSaver(BasePostgresSaver):
                         value["checkpoint"],
                         value["channel_values"],
                         value["pending_sends"],
+                        value["channel_prefixes"],
+                        value["thread_id"],
+                        value["checkpoint_ns"],
                     ),
                     self._load_metadata(value["metadata"]),
                     (
@@ -244,6 +246,9 @@ class PostgresSaver(BasePostgresSaver):
                         value["checkpoint"],
                         value["channel_values"],
                         value["pending_sends"],
+                        value["channel_prefixes"],
+                        value["thread_id"],
+                        value["checkpoint_ns"],
                     ),
                     self._load_metadata(value["metadata"]),
                     (
@@ -308,16 +313,10 @@ class PostgresSaver(BasePostgresSaver):
             }
         }
 
+        channel_values = copy.pop("channel_values")  # type: ignore[misc]
+        blobs = self._dump_blobs(thread_id, checkpoint_ns, channel_values, new_versions)
         with self._cursor(pipeline=True) as cur:
-            cur.executemany(
-                self.UPSERT_CHECKPOINT_BLOBS_SQL,
-                self._dump_blobs(
-                    thread_id,
-                    checkpoint_ns,
-                    copy.pop("channel_values"),  # type: ignore[misc]
-                    new_versions,
-                ),
-            )
+            cur.executemany(self.UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
             cur.execute(
                 self.UPSERT_CHECKPOINTS_SQL,
                 (
@@ -329,6 +328,7 @@ class PostgresSaver(BasePostgresSaver):
                     self._dump_metadata(metadata),
                 ),
             )
+        self._save_segments(channel_values, blobs)
         return next_config
 
     def put_writes(
@@ -346,22 +346,27 @@ class PostgresSaver(BasePostgresSaver):
             writes (List[Tuple[str, Any]]): List of writes to store.
             task_id (str): Identifier for the task creating the writes.
         """
-        query = (
-            self.UPSERT_CHECKPOINT_WRITES_SQL
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else self.INSERT_CHECKPOINT_WRITES_SQL
-        )
+        self.put_writes_batch(config, [(task_id, writes)])
+
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        This method saves the writes of all tasks to the Postgres database in a single round-trip.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[tuple[str, Sequence[tuple[str, Any]]]]): Pairs of task id and the list of writes of that task.
+        """
+        upserts, inserts = self._dump_task_writes(config, task_writes)
         with self._cursor(pipeline=True) as cur:
-            cur.executemany(
-                query,
-                self._dump_writes(
-                    config["configurable"]["thread_id"],
-                    config["configurable"]["checkpoint_ns"],
-                    config["configurable"]["checkpoint_id"],
-                    task_id,
-                    writes,
-                ),
-            )
+            if upserts:
+                cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upserts)
+            if inserts:
+                cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, inserts)
 
     @contextmanager
     def _cursor(self, *, pipeline: bool = False) -> Iterator[Cursor[DictRow]]:
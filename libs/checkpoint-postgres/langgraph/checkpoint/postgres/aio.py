@@ -10,7 +10,6 @@ from psycopg.types.json import Jsonb
 from psycopg_pool import AsyncConnectionPool
 
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
@@ -154,6 +153,9 @@ class AsyncPostgresSaver(BasePostgresSaver):
                         value["checkpoint"],
                         value["channel_values"],
                         value["pending_sends"],
+                        value["channel_prefixes"],
+                        value["thread_id"],
+                        value["checkpoint_ns"],
                     ),
                     self._load_metadata(value["metadata"]),
                     {
@@ -213,6 +215,9 @@ class AsyncPostgresSaver(BasePostgresSaver):
                         value["checkpoint"],
                         value["channel_values"],
                         value["pending_sends"],
+                        value["channel_prefixes"],
+                        value["thread_id"],
+                        value["checkpoint_ns"],
                     ),
                     self._load_metadata(value["metadata"]),
                     {
@@ -264,17 +269,12 @@ class AsyncPostgresSaver(BasePostgresSaver):
             }
         }
 
+        channel_values = copy.pop("channel_values")  # type: ignore[misc]
+        blobs = await asyncio.to_thread(
+            self._dump_blobs, thread_id, checkpoint_ns, channel_values, new_versions
+        )
         async with self._cursor(pipeline=True) as cur:
-            await cur.executemany(
-                self.UPSERT_CHECKPOINT_BLOBS_SQL,
-                await asyncio.to_thread(
-                    self._dump_blobs,
-                    thread_id,
-                    checkpoint_ns,
-                    copy.pop("channel_values"),  # type: ignore[misc]
-                    new_versions,
-                ),
-            )
+            await cur.executemany(self.UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
             await cur.execute(
                 self.UPSERT_CHECKPOINTS_SQL,
                 (
@@ -286,6 +286,7 @@ class AsyncPostgresSaver(BasePostgresSaver):
                     self._dump_metadata(metadata),
                 ),
             )
+        self._save_segments(channel_values, blobs)
         return next_config
 
     async def aput_writes(
@@ -303,21 +304,29 @@ class AsyncPostgresSaver(BasePostgresSaver):
             writes (Sequence[Tuple[str, Any]]): List of writes to store, each as (channel, value) pair.
             task_id (str): Identifier for the task creating the writes.
         """
-        query = (
-            self.UPSERT_CHECKPOINT_WRITES_SQL
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else self.INSERT_CHECKPOINT_WRITES_SQL
-        )
-        params = await asyncio.to_thread(
-            self._dump_writes,
-            config["configurable"]["thread_id"],
-            config["configurable"]["checkpoint_ns"],
-            config["configurable"]["checkpoint_id"],
-            task_id,
-            writes,
+        await self.aput_writes_batch(config, [(task_id, writes)])
+
+    async def aput_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint asynchronously.
+
+        This method saves the writes of all tasks to the database in a single round-trip.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[tuple[str, Sequence[tuple[str, Any]]]]): Pairs of task id and the list of writes of that task.
+        """
+        upserts, inserts = await asyncio.to_thread(
+            self._dump_task_writes, config, task_writes
         )
         async with self._cursor(pipeline=True) as cur:
-            await cur.executemany(query, params)
+            if upserts:
+                await cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upserts)
+            if inserts:
+                await cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, inserts)
 
     @asynccontextmanager
     async def _cursor(
@@ -452,3 +461,20 @@ class AsyncPostgresSaver(BasePostgresSaver):
         return asyncio.run_coroutine_threadsafe(
             self.aput_writes(config, writes, task_id), self.loop
         ).result()
+
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        This method is a synchronous wrapper around aput_writes_batch.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[tuple[str, Sequence[tuple[str, Any]]]]): Pairs of task id and the list of writes of that task.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aput_writes_batch(config, task_writes), self.loop
+        ).result()
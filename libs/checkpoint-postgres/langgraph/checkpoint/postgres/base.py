@@ -1,3 +1,4 @@
+import json
 import random
 from typing import Any, List, Optional, Sequence, Tuple, cast
 
@@ -13,7 +14,13 @@ from langgraph.checkpoint.base import (
     get_checkpoint_id,
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
+from langgraph.checkpoint.serde.offload import loads_typed_lazy
+from langgraph.checkpoint.serde.types import (
+    TASKS,
+    ChannelProtocol,
+    ListSegment,
+    SavedSegment,
+)
 
 MetadataInput = Optional[dict[str, Any]]
 
@@ -56,6 +63,7 @@ MIGRATIONS = [
     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
 );""",
     "ALTER TABLE checkpoint_blobs ALTER COLUMN blob DROP not null;",
+    "ALTER TABLE checkpoint_blobs ADD COLUMN IF NOT EXISTS prefix_versions TEXT[];",
 ]
 
 SELECT_SQL = f"""
@@ -67,7 +75,7 @@ select
     parent_checkpoint_id,
     metadata,
     (
-        select array_agg(array[bl.channel::bytea, bl.type::bytea, bl.blob])
+        select array_agg(array[bl.channel::bytea, bl.type::bytea, bl.blob, bl.version::bytea, convert_to(array_to_json(bl.prefix_versions)::text, 'UTF8')])
         from jsonb_each_text(checkpoint -> 'channel_versions')
         inner join checkpoint_blobs bl
             on bl.thread_id = checkpoints.thread_id
@@ -75,6 +83,22 @@ select
             and bl.channel = jsonb_each_text.key
             and bl.version = jsonb_each_text.value
     ) as channel_values,
+    (
+        select array_agg(array[bl.channel::bytea, bl.type::bytea, bl.blob] order by bl.channel, prefix.idx)
+        from jsonb_each_text(checkpoint -> 'channel_versions')
+        inner join checkpoint_blobs head
+            on head.thread_id = checkpoints.thread_id
+            and head.checkpoint_ns = checkpoints.checkpoint_ns
+            and head.channel = jsonb_each_text.key
+            and head.version = jsonb_each_text.value
+            and head.prefix_versions is not null
+        cross join lateral unnest(head.prefix_versions) with ordinality as prefix(version, idx)
+        inner join checkpoint_blobs bl
+            on bl.thread_id = head.thread_id
+            and bl.checkpoint_ns = head.checkpoint_ns
+            and bl.channel = head.channel
+            and bl.version = prefix.version
+    ) as channel_prefixes,
     (
         select
         array_agg(array[cw.task_id::text::bytea, cw.channel::bytea, cw.type::bytea, cw.blob] order by cw.task_id, cw.idx)
@@ -94,8 +118,8 @@ select
 from checkpoints """
 
 UPSERT_CHECKPOINT_BLOBS_SQL = """
-    INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob)
-    VALUES (%s, %s, %s, %s, %s, %s)
+    INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob, prefix_versions)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
     ON CONFLICT (thread_id, checkpoint_ns, channel, version) DO NOTHING
 """
 
@@ -125,6 +149,17 @@ INSERT_CHECKPOINT_WRITES_SQL = """
 
 
 class BasePostgresSaver(BaseCheckpointSaver[str]):
+    """Base class for the Postgres savers.
+
+    Channel values are saved once per version in `checkpoint_blobs`. Channels
+    which only append to a list, eg. a list reduced with `operator.add` or a list
+    of messages, checkpoint it as a `ListSegment`, for which only the items
+    appended since the version saved before are saved, along with the versions
+    of the blobs holding the start of the list. The list is assembled from
+    those blobs when first read. To bound the number of blobs to load, the
+    whole list is saved again once it is split into `max_segments` blobs.
+    """
+
     SELECT_SQL = SELECT_SQL
     MIGRATIONS = MIGRATIONS
     UPSERT_CHECKPOINT_BLOBS_SQL = UPSERT_CHECKPOINT_BLOBS_SQL
@@ -134,33 +169,66 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
 
     jsonplus_serde = JsonPlusSerializer()
 
+    max_segments = 16
+    """Maximum number of blobs a list channel value can be split into."""
+
     def _load_checkpoint(
         self,
         checkpoint: dict[str, Any],
-        channel_values: list[tuple[bytes, bytes, bytes]],
+        channel_values: list[tuple[bytes, ...]],
         pending_sends: list[tuple[bytes, bytes]],
+        channel_prefixes: Optional[list[tuple[bytes, bytes, bytes]]] = None,
+        thread_id: str = "",
+        checkpoint_ns: str = "",
     ) -> Checkpoint:
         return {
             **checkpoint,
             "pending_sends": [
                 self.serde.loads_typed((c.decode(), b)) for c, b in pending_sends or []
             ],
-            "channel_values": self._load_blobs(channel_values),
+            "channel_values": self._load_blobs(
+                channel_values, channel_prefixes, thread_id, checkpoint_ns
+            ),
         }
 
     def _dump_checkpoint(self, checkpoint: Checkpoint) -> dict[str, Any]:
         return {**checkpoint, "pending_sends": []}
 
     def _load_blobs(
-        self, blob_values: list[tuple[bytes, bytes, bytes]]
+        self,
+        blob_values: list[tuple[bytes, ...]],
+        prefix_values: Optional[list[tuple[bytes, bytes, bytes]]] = None,
+        thread_id: str = "",
+        checkpoint_ns: str = "",
     ) -> dict[str, Any]:
         if not blob_values:
             return {}
-        return {
-            k.decode(): self.serde.loads_typed((t.decode(), v))
-            for k, t, v in blob_values
-            if t.decode() != "empty"
-        }
+        # segments saved before the last one, sorted by channel from the start
+        prefixes: dict[str, list[tuple[str, bytes]]] = {}
+        for k, t, v in prefix_values or ():
+            prefixes.setdefault(k.decode(), []).append((t.decode(), v))
+        values: dict[str, Any] = {}
+        for k, t, v, *segment in blob_values:
+            channel, type_ = k.decode(), t.decode()
+            if type_ == "empty":
+                continue
+            elif segment and segment[1] is not None:
+                # lists saved as segments are assembled when first read
+                values[channel] = ListSegment.load_segments(
+                    self.serde,
+                    [*prefixes.get(channel, ()), (type_, v)],
+                    SavedSegment(
+                        self,
+                        thread_id,
+                        checkpoint_ns,
+                        channel,
+                        segment[0].decode(),
+                        tuple(json.loads(segment[1])),
+                    ),
+                )
+            else:
+                values[channel] = loads_typed_lazy(self.serde, (type_, v))
+        return values
 
     def _dump_blobs(
         self,
@@ -168,24 +236,61 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
         checkpoint_ns: str,
         values: dict[str, Any],
         versions: ChannelVersions,
-    ) -> list[tuple[str, str, str, str, str, Optional[bytes]]]:
+    ) -> list[tuple[str, str, str, str, str, Optional[bytes], Optional[list[str]]]]:
         if not versions:
             return []
 
-        return [
-            (
-                thread_id,
-                checkpoint_ns,
-                k,
-                cast(str, ver),
-                *(
-                    self.serde.dumps_typed(values[k])
-                    if k in values
-                    else ("empty", None)
-                ),
-            )
-            for k, ver in versions.items()
-        ]
+        rows: list[
+            tuple[str, str, str, str, str, Optional[bytes], Optional[list[str]]]
+        ] = []
+        for k, ver in versions.items():
+            if k not in values:
+                rows.append(
+                    (thread_id, checkpoint_ns, k, cast(str, ver), "empty", None, None)
+                )
+            elif isinstance(values[k], ListSegment):
+                # save only the items appended since the segments saved before
+                items, prefix_versions = values[k].dump(
+                    self, thread_id, checkpoint_ns, k, self.max_segments
+                )
+                rows.append(
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        k,
+                        cast(str, ver),
+                        *self.serde.dumps_typed(items),
+                        list(prefix_versions),
+                    )
+                )
+            else:
+                rows.append(
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        k,
+                        cast(str, ver),
+                        *self.serde.dumps_typed(values[k]),
+                        None,
+                    )
+                )
+        return rows
+
+    def _save_segments(
+        self,
+        values: dict[str, Any],
+        blobs: list[
+            tuple[str, str, str, str, str, Optional[bytes], Optional[list[str]]]
+        ],
+    ) -> None:
+        """Record where the list segments were saved, for the next versions of
+        their channels to extend. Called once the blobs are saved, so that only
+        saved blobs are referenced."""
+        for thread_id, checkpoint_ns, k, ver, _, _, prefix_versions in blobs:
+            if prefix_versions is not None:
+                values[k].ref.saved = SavedSegment(
+                    self, thread_id, checkpoint_ns, k, ver, tuple(prefix_versions)
+                )
 
     def _load_writes(
         self, writes: list[tuple[bytes, bytes, bytes, bytes]]
@@ -224,6 +329,28 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             for idx, (channel, value) in enumerate(writes)
         ]
 
+    def _dump_task_writes(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> tuple[list[tuple[str, str, str, str, int, str, str, bytes]], ...]:
+        """Dump the writes of several tasks, split into rows to upsert (special
+        writes, eg. errors and interrupts) and rows to insert if missing."""
+        upserts: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        inserts: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        for task_id, writes in task_writes:
+            rows = upserts if all(w[0] in WRITES_IDX_MAP for w in writes) else inserts
+            rows.extend(
+                self._dump_writes(
+                    config["configurable"]["thread_id"],
+                    config["configurable"]["checkpoint_ns"],
+                    config["configurable"]["checkpoint_id"],
+                    task_id,
+                    writes,
+                )
+            )
+        return upserts, inserts
+
     def _load_metadata(self, metadata: dict[str, Any]) -> CheckpointMetadata:
         return self.jsonplus_serde.loads(self.jsonplus_serde.dumps(metadata))
 
@@ -25,5 +25,6 @@ async def clear_test_db(conn: AsyncConnection[DictRow]) -> None:
         await conn.execute("DELETE FROM checkpoint_writes")
         await conn.execute("DELETE FROM checkpoint_migrations")
         await conn.execute("DELETE FROM store_migrations")
+        await conn.execute("DELETE FROM cache_migrations")
     except UndefinedTable:
         pass
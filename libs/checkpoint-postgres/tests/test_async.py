@@ -11,6 +11,7 @@ from langgraph.checkpoint.base import (
     empty_checkpoint,
 )
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.checkpoint.serde.types import ListSegment
 
 
 class TestAsyncPostgresSaver:
@@ -111,3 +112,65 @@ class TestAsyncPostgresSaver:
             assert [c async for c in saver.alist(None, filter={"my_key": "abc"})][
                 0
             ].metadata["my_key"] == "abc"
+
+    async def test_aput_writes_batch(self) -> None:
+        async with AsyncPostgresSaver.from_conn_string(DEFAULT_URI) as saver:
+            config = await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            await saver.aput_writes_batch(
+                config,
+                [
+                    ("task-1", [("foo", 1), ("bar", 2)]),
+                    ("task-2", [("foo", 3)]),
+                ],
+            )
+
+            # call method / assertions
+            checkpoint_tuple = await saver.aget_tuple(config)
+            assert checkpoint_tuple is not None
+            assert checkpoint_tuple.pending_writes == [
+                ("task-1", "foo", 1),
+                ("task-1", "bar", 2),
+                ("task-2", "foo", 3),
+            ]
+
+    async def test_append_only_segments(self) -> None:
+        async with AsyncPostgresSaver.from_conn_string(DEFAULT_URI) as saver:
+            config = self.config_2
+            checkpoint = self.chkpnt_2
+            version = None
+            segment = None
+            for i in range(3):
+                values = ["a"] * (i + 1)
+                segment = ListSegment(values, len(values), segment and segment.ref)
+                version = saver.get_next_version(version, None)  # type: ignore[arg-type]
+                checkpoint = create_checkpoint(checkpoint, None, i)
+                checkpoint["channel_values"] = {"items": segment}
+                checkpoint["channel_versions"] = {"items": version}
+                config = await saver.aput(
+                    config, checkpoint, self.metadata_2, {"items": version}
+                )
+            # a list which doesn't extend a saved one is saved whole
+            checkpoint["channel_values"] = {"items": ListSegment(["b"], 1)}
+            version = saver.get_next_version(version, None)  # type: ignore[arg-type]
+            checkpoint = create_checkpoint(checkpoint, None, 3)
+            checkpoint["channel_versions"] = {"items": version}
+            forked = await saver.aput(
+                config, checkpoint, self.metadata_2, {"items": version}
+            )
+
+            async with saver._cursor() as cur:
+                await cur.execute(
+                    "SELECT prefix_versions FROM checkpoint_blobs "
+                    "WHERE channel = 'items' ORDER BY version"
+                )
+                rows = await cur.fetchall()
+            assert [len(row["prefix_versions"]) for row in rows] == [0, 1, 2, 0]
+
+            checkpoint_tuple = await saver.aget_tuple(config)
+            assert checkpoint_tuple is not None
+            assert checkpoint_tuple.checkpoint["channel_values"] == {
+                "items": ["a", "a", "a"]
+            }
+            checkpoint_tuple = await saver.aget_tuple(forked)
+            assert checkpoint_tuple is not None
+            assert checkpoint_tuple.checkpoint["channel_values"] == {"items": ["b"]}
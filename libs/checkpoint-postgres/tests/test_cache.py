@@ -0,0 +1,54 @@
+# type: ignore
+from conftest import DEFAULT_URI  # type: ignore
+from pytest_mock import MockerFixture
+
+from langgraph.cache.postgres import AsyncPostgresCache, PostgresCache
+
+
+def test_postgres_cache(mocker: MockerFixture) -> None:
+    now = mocker.patch("time.time", return_value=1000.0)
+    with PostgresCache.from_conn_string(DEFAULT_URI) as cache:
+        cache.setup()
+        cache.clear()
+        cache.set(
+            {
+                (("a", "b"), "k1"): ([("chan", 1)], None),
+                (("a", "b"), "k2"): ({"x": "y"}, 10),
+                (("c",), "k1"): ("value", None),
+            }
+        )
+        assert cache.get([(("a", "b"), "k1"), (("a", "b"), "k2"), (("a",), "k1")]) == {
+            (("a", "b"), "k1"): [["chan", 1]],
+            (("a", "b"), "k2"): {"x": "y"},
+        }
+
+        # overwriting an entry replaces its value
+        cache.set({(("a", "b"), "k1"): ([("chan", 2)], None)})
+        assert cache.get([(("a", "b"), "k1")]) == {(("a", "b"), "k1"): [["chan", 2]]}
+
+        # expired entries are treated as missing
+        now.return_value = 1011.0
+        assert cache.get([(("a", "b"), "k2")]) == {}
+
+        # clear a single namespace
+        cache.clear([("a", "b")])
+        assert cache.get([(("a", "b"), "k1"), (("c",), "k1")]) == {
+            (("c",), "k1"): "value"
+        }
+
+        # clear everything
+        cache.clear()
+        assert cache.get([(("c",), "k1")]) == {}
+
+
+async def test_async_postgres_cache() -> None:
+    async with AsyncPostgresCache.from_conn_string(DEFAULT_URI) as cache:
+        await cache.setup()
+        await cache.aclear()
+        await cache.aset({(("ns",), "k"): ("v", None), ((), "k"): ("root", 5)})
+        assert await cache.aget([(("ns",), "k"), ((), "k"), (("ns",), "x")]) == {
+            (("ns",), "k"): "v",
+            ((), "k"): "root",
+        }
+        await cache.aclear([("ns",)])
+        assert await cache.aget([(("ns",), "k"), ((), "k")]) == {((), "k"): "root"}
@@ -11,6 +11,7 @@ from langgraph.checkpoint.base import (
     empty_checkpoint,
 )
 from langgraph.checkpoint.postgres import PostgresSaver
+from langgraph.checkpoint.serde.types import ListSegment
 
 
 class TestPostgresSaver:
@@ -110,3 +111,80 @@ class TestPostgresSaver:
                 list(saver.list(None, filter={"my_key": "abc"}))[0].metadata["my_key"]  # type: ignore
                 == "abc"
             )
+
+    def test_put_writes_batch(self) -> None:
+        with PostgresSaver.from_conn_string(DEFAULT_URI) as saver:
+            config = saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            saver.put_writes_batch(
+                config,
+                [
+                    ("task-1", [("foo", 1), ("bar", 2)]),
+                    ("task-2", [("foo", 3)]),
+                ],
+            )
+
+            # call method / assertions
+            checkpoint_tuple = saver.get_tuple(config)
+            assert checkpoint_tuple is not None
+            assert checkpoint_tuple.pending_writes == [
+                ("task-1", "foo", 1),
+                ("task-1", "bar", 2),
+                ("task-2", "foo", 3),
+            ]
+
+    def test_append_only_segments(self) -> None:
+        with PostgresSaver.from_conn_string(DEFAULT_URI) as saver:
+            saver.max_segments = 3
+            config = self.config_2
+            checkpoint = self.chkpnt_2
+            version = None
+            segment = None
+            for i in range(5):
+                if i == 4:
+                    # continue from the list loaded back
+                    saved = saver.get_tuple(config)
+                    assert saved is not None
+                    segment = saved.checkpoint["channel_values"]["items"]
+                    assert isinstance(segment, ListSegment)
+                values = [*(segment or ()), i]
+                segment = ListSegment(values, len(values), segment and segment.ref)
+                version = saver.get_next_version(version, None)  # type: ignore[arg-type]
+                checkpoint = create_checkpoint(checkpoint, None, i)
+                checkpoint["channel_values"] = {"items": segment, "other": [i]}
+                checkpoint["channel_versions"] = {"items": version, "other": version}
+                config = saver.put(
+                    config,
+                    checkpoint,
+                    self.metadata_2,
+                    {"items": version, "other": version},
+                )
+
+            # appended items are saved on their own, up to max_segments blobs,
+            # other lists are saved whole
+            with saver._cursor() as cur:
+                cur.execute(
+                    "SELECT channel, version, prefix_versions FROM checkpoint_blobs "
+                    "WHERE channel IN ('items', 'other') ORDER BY channel, version"
+                )
+                rows = cur.fetchall()
+            versions = [row["version"] for row in rows if row["channel"] == "items"]
+            assert [row["prefix_versions"] for row in rows] == [
+                [],
+                versions[:1],
+                versions[:2],
+                [],
+                versions[3:4],
+                *[None] * 5,
+            ]
+
+            # the whole list is loaded back
+            checkpoint_tuple = saver.get_tuple(config)
+            assert checkpoint_tuple is not None
+            assert checkpoint_tuple.checkpoint["channel_values"] == {
+                "items": [0, 1, 2, 3, 4],
+                "other": [4],
+            }
+            assert [
+                c.checkpoint["channel_values"]["items"]
+                for c in saver.list({"configurable": {"thread_id": "thread-2"}})
+            ] == [[0, 1, 2, 3, 4], [0, 1, 2, 3], [0, 1, 2], [0, 1], [0]]
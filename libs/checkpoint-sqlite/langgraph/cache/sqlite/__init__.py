@@ -0,0 +1,162 @@
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+
+class SqliteCache(BaseCache[Any]):
+    """A cache of node results stored in a SQLite database.
+
+    Async methods run the (local, short-lived) queries inline, sharing the
+    connection lock with the sync methods.
+
+    Args:
+        conn (sqlite3.Connection): The SQLite database connection.
+        serde (Optional[SerializerProtocol]): The serializer to use for cached values.
+
+    Examples:
+
+        >>> import sqlite3
+        >>> from langgraph.cache.sqlite import SqliteCache
+        >>> conn = sqlite3.connect("cache.sqlite", check_same_thread=False)
+        >>> cache = SqliteCache(conn)
+        >>> graph = builder.compile(cache=cache)
+    """
+
+    conn: sqlite3.Connection
+    is_setup: bool
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.conn = conn
+        self.is_setup = False
+        self.lock = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def from_conn_string(cls, conn_string: str) -> Iterator["SqliteCache"]:
+        """Create a new SqliteCache instance from a connection string.
+
+        Args:
+            conn_string (str): The SQLite connection string.
+
+        Yields:
+            SqliteCache: A new SqliteCache instance.
+        """
+        with closing(sqlite3.connect(conn_string, check_same_thread=False)) as conn:
+            yield cls(conn)
+
+    def setup(self) -> None:
+        """Set up the cache database.
+
+        This method creates the necessary tables in the SQLite database if they don't
+        already exist. It is called automatically when needed and should not be called
+        directly by the user.
+        """
+        if self.is_setup:
+            return
+
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS cache (
+                ns TEXT NOT NULL,
+                key TEXT NOT NULL,
+                expiry REAL,
+                encoding TEXT NOT NULL,
+                val BLOB NOT NULL,
+                PRIMARY KEY (ns, key)
+            );
+            """
+        )
+
+        self.is_setup = True
+
+    @contextmanager
+    def cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Get a cursor for the SQLite database, committing when it is closed."""
+        with self.lock:
+            self.setup()
+            cur = self.conn.cursor()
+            try:
+                yield cur
+            finally:
+                self.conn.commit()
+                cur.close()
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        if not keys:
+            return {}
+        now = time.time()
+        found: dict[FullKey, Any] = {}
+        expired: list[tuple[str, str]] = []
+        with self.cursor() as cur:
+            for ns, key in keys:
+                cur.execute(
+                    "SELECT expiry, encoding, val FROM cache WHERE ns = ? AND key = ?",
+                    (_ns_to_text(ns), key),
+                )
+                if row := cur.fetchone():
+                    expiry, encoding, val = row
+                    if expiry is not None and expiry <= now:
+                        expired.append((_ns_to_text(ns), key))
+                    else:
+                        found[(ns, key)] = (encoding, val)
+            if expired:
+                cur.executemany("DELETE FROM cache WHERE ns = ? AND key = ?", expired)
+        return {key: self.serde.loads_typed(value) for key, value in found.items()}
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        return self.get(keys)
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[float]]]) -> None:
+        if not pairs:
+            return
+        now = time.time()
+        rows = [
+            (
+                _ns_to_text(ns),
+                key,
+                now + ttl if ttl is not None else None,
+                *self.serde.dumps_typed(value),
+            )
+            for (ns, key), (value, ttl) in pairs.items()
+        ]
+        with self.cursor() as cur:
+            cur.executemany(
+                "INSERT OR REPLACE INTO cache (ns, key, expiry, encoding, val) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[Any, Optional[float]]]) -> None:
+        self.set(pairs)
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        with self.cursor() as cur:
+            if namespaces is None:
+                cur.execute("DELETE FROM cache")
+            else:
+                cur.executemany(
+                    "DELETE FROM cache WHERE ns = ?",
+                    [(_ns_to_text(ns),) for ns in namespaces],
+                )
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        self.clear(namespaces)
+
+
+def _ns_to_text(ns: Namespace) -> str:
+    return ",".join(ns)
+
+
+__all__ = ["SqliteCache"]
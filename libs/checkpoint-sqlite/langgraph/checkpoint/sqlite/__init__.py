@@ -2,12 +2,20 @@ import random
 import sqlite3
 import threading
 from contextlib import closing, contextmanager
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from langchain_core.runnables import RunnableConfig
 
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     BaseCheckpointSaver,
     ChannelVersions,
     Checkpoint,
@@ -18,7 +26,23 @@ from langgraph.checkpoint.base import (
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    BLOBS_MIGRATION,
+    INSERT_WRITES_SQL,
+    MIGRATIONS,
+    SELECT_BLOBS_SQL,
+    SELECT_PREFIX_BLOBS_SQL,
+    UPSERT_BLOBS_SQL,
+    UPSERT_WRITES_SQL,
+    blob_versions,
+    dump_blobs,
+    dump_writes,
+    has_prefixes,
+    load_blobs,
+    migrate_channel_values,
+    save_segments,
+    search_where,
+)
 
 _AIO_ERROR_MSG = (
     "The SqliteSaver does not support async methods. "
@@ -68,6 +92,11 @@ class SqliteSaver(BaseCheckpointSaver[str]):
     conn: sqlite3.Connection
     is_setup: bool
 
+    max_segments = 16
+    """Number of blobs a list checkpointed as a `ListSegment` is saved in at most,
+    each holding the items appended since the one before, after which the whole
+    list is saved again."""
+
     def __init__(
         self,
         conn: sqlite3.Connection,
@@ -116,41 +145,72 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """Set up the checkpoint database.
 
         This method creates the necessary tables in the SQLite database if they don't
-        already exist. It is called automatically when needed and should not be called
-        directly by the user.
+        already exist and runs database migrations. It is called automatically
+        when needed and should not be called directly by the user.
         """
         if self.is_setup:
             return
 
-        self.conn.executescript(
-            """
-            PRAGMA journal_mode=WAL;
-            CREATE TABLE IF NOT EXISTS checkpoints (
-                thread_id TEXT NOT NULL,
-                checkpoint_ns TEXT NOT NULL DEFAULT '',
-                checkpoint_id TEXT NOT NULL,
-                parent_checkpoint_id TEXT,
-                type TEXT,
-                checkpoint BLOB,
-                metadata BLOB,
-                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
-            );
-            CREATE TABLE IF NOT EXISTS writes (
-                thread_id TEXT NOT NULL,
-                checkpoint_ns TEXT NOT NULL DEFAULT '',
-                checkpoint_id TEXT NOT NULL,
-                task_id TEXT NOT NULL,
-                idx INTEGER NOT NULL,
-                channel TEXT NOT NULL,
-                type TEXT,
-                value BLOB,
-                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
-            );
-            """
-        )
+        self.conn.execute("PRAGMA journal_mode=WAL;")
+        with closing(self.conn.cursor()) as cur:
+            cur.execute(MIGRATIONS[0])
+            row = cur.execute(
+                "SELECT v FROM checkpoint_migrations ORDER BY v DESC LIMIT 1"
+            ).fetchone()
+            version = -1 if row is None else row[0]
+            for v, migration in zip(
+                range(version + 1, len(MIGRATIONS)),
+                MIGRATIONS[version + 1 :],
+            ):
+                cur.execute(migration)
+                cur.execute("INSERT INTO checkpoint_migrations (v) VALUES (?)", (v,))
+            # moved once checkpoint_blobs has all the columns of later migrations
+            if version < BLOBS_MIGRATION:
+                self._migrate_channel_values(cur)
+        self.conn.commit()
 
         self.is_setup = True
 
+    def _migrate_channel_values(self, cur: sqlite3.Cursor) -> None:
+        """Move the channel values of existing checkpoints to checkpoint_blobs."""
+        cur.execute(
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, type, checkpoint FROM checkpoints"
+        )
+        blobs, updates = migrate_channel_values(self.serde, cur.fetchall())
+        if blobs:
+            cur.executemany(UPSERT_BLOBS_SQL, blobs)
+        if updates:
+            cur.executemany(
+                "UPDATE checkpoints SET type = ?, checkpoint = ? WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                updates,
+            )
+
+    def _load_checkpoint(
+        self,
+        cur: sqlite3.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        type: str,
+        checkpoint: bytes,
+    ) -> Checkpoint:
+        """Deserialize a checkpoint, along with the values of its channel versions."""
+        saved = self.serde.loads_typed((type, checkpoint))
+        # checkpoints saved before BLOBS_MIGRATION and not migrated keep their values
+        if "channel_values" not in saved:
+            versions = blob_versions(saved)
+            cur.execute(SELECT_BLOBS_SQL, (versions, thread_id, checkpoint_ns))
+            rows = cur.fetchall()
+            prefix_rows: Iterable[Any] = ()
+            if has_prefixes(rows):
+                cur.execute(
+                    SELECT_PREFIX_BLOBS_SQL, (versions, thread_id, checkpoint_ns)
+                )
+                prefix_rows = cur.fetchall()
+            saved["channel_values"] = load_blobs(
+                self.serde, rows, prefix_rows, self, thread_id, checkpoint_ns
+            )
+        return saved
+
     @contextmanager
     def cursor(self, transaction: bool = True) -> Iterator[sqlite3.Cursor]:
         """Get a cursor for the SQLite database.
@@ -244,6 +304,10 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # deserialize the checkpoint
+                saved = self._load_checkpoint(
+                    cur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 # find any pending writes
                 cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -253,10 +317,9 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    saved,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -332,6 +395,9 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
+                saved = self._load_checkpoint(
+                    wcur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -344,7 +410,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    saved,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -396,9 +462,23 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        # channel values are saved once per version, in checkpoint_blobs
+        copy = checkpoint.copy()
+        values = copy.pop("channel_values", {})  # type: ignore[misc]
+        blobs = dump_blobs(
+            self.serde,
+            str(thread_id),
+            checkpoint_ns,
+            values,
+            new_versions,
+            self,
+            self.max_segments,
+        )
+        type_, serialized_checkpoint = self.serde.dumps_typed(copy)
         serialized_metadata = self.jsonplus_serde.dumps(metadata)
         with self.cursor() as cur:
+            if blobs:
+                cur.executemany(UPSERT_BLOBS_SQL, blobs)
             cur.execute(
                 "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (
@@ -411,6 +491,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     serialized_metadata,
                 ),
             )
+        save_segments(self, values, blobs)
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -434,27 +515,27 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             writes (Sequence[Tuple[str, Any]]): List of writes to store, each as (channel, value) pair.
             task_id (str): Identifier for the task creating the writes.
         """
-        query = (
-            "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
-        )
+        self.put_writes_batch(config, [(task_id, writes)])
+
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        This method saves the writes of all tasks to the SQLite database in a single transaction.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of task id and the list of writes of that task.
+        """
+        upserts, inserts = dump_writes(self.serde, config, task_writes)
         with self.cursor() as cur:
-            cur.executemany(
-                query,
-                [
-                    (
-                        str(config["configurable"]["thread_id"]),
-                        str(config["configurable"]["checkpoint_ns"]),
-                        str(config["configurable"]["checkpoint_id"]),
-                        task_id,
-                        WRITES_IDX_MAP.get(channel, idx),
-                        channel,
-                        *self.serde.dumps_typed(value),
-                    )
-                    for idx, (channel, value) in enumerate(writes)
-                ],
-            )
+            if upserts:
+                cur.executemany(UPSERT_WRITES_SQL, upserts)
+            if inserts:
+                cur.executemany(INSERT_WRITES_SQL, inserts)
 
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
@@ -6,6 +6,7 @@ from typing import (
     AsyncIterator,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     Optional,
     Sequence,
@@ -17,7 +18,6 @@ import aiosqlite
 from langchain_core.runnables import RunnableConfig
 
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     BaseCheckpointSaver,
     ChannelVersions,
     Checkpoint,
@@ -28,7 +28,23 @@ from langgraph.checkpoint.base import (
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    BLOBS_MIGRATION,
+    INSERT_WRITES_SQL,
+    MIGRATIONS,
+    SELECT_BLOBS_SQL,
+    SELECT_PREFIX_BLOBS_SQL,
+    UPSERT_BLOBS_SQL,
+    UPSERT_WRITES_SQL,
+    blob_versions,
+    dump_blobs,
+    dump_writes,
+    has_prefixes,
+    load_blobs,
+    migrate_channel_values,
+    save_segments,
+    search_where,
+)
 
 T = TypeVar("T", bound=Callable)
 
@@ -110,6 +126,11 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
     lock: asyncio.Lock
     is_setup: bool
 
+    max_segments = 16
+    """Number of blobs a list checkpointed as a `ListSegment` is saved in at most,
+    each holding the items appended since the one before, after which the whole
+    list is saved again."""
+
     def __init__(
         self,
         conn: aiosqlite.Connection,
@@ -233,48 +254,90 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             self.aput_writes(config, writes, task_id), self.loop
         ).result()
 
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        return asyncio.run_coroutine_threadsafe(
+            self.aput_writes_batch(config, task_writes), self.loop
+        ).result()
+
     async def setup(self) -> None:
         """Set up the checkpoint database asynchronously.
 
         This method creates the necessary tables in the SQLite database if they don't
-        already exist. It is called automatically when needed and should not be called
-        directly by the user.
+        already exist and runs database migrations. It is called automatically
+        when needed and should not be called directly by the user.
         """
         async with self.lock:
             if self.is_setup:
                 return
             if not self.conn.is_alive():
                 await self.conn
-            async with self.conn.executescript(
-                """
-                PRAGMA journal_mode=WAL;
-                CREATE TABLE IF NOT EXISTS checkpoints (
-                    thread_id TEXT NOT NULL,
-                    checkpoint_ns TEXT NOT NULL DEFAULT '',
-                    checkpoint_id TEXT NOT NULL,
-                    parent_checkpoint_id TEXT,
-                    type TEXT,
-                    checkpoint BLOB,
-                    metadata BLOB,
-                    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
-                );
-                CREATE TABLE IF NOT EXISTS writes (
-                    thread_id TEXT NOT NULL,
-                    checkpoint_ns TEXT NOT NULL DEFAULT '',
-                    checkpoint_id TEXT NOT NULL,
-                    task_id TEXT NOT NULL,
-                    idx INTEGER NOT NULL,
-                    channel TEXT NOT NULL,
-                    type TEXT,
-                    value BLOB,
-                    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
-                );
-                """
-            ):
-                await self.conn.commit()
+            async with self.conn.cursor() as cur:
+                await cur.execute("PRAGMA journal_mode=WAL;")
+                await cur.execute(MIGRATIONS[0])
+                await cur.execute(
+                    "SELECT v FROM checkpoint_migrations ORDER BY v DESC LIMIT 1"
+                )
+                row = await cur.fetchone()
+                version = -1 if row is None else row[0]
+                for v, migration in zip(
+                    range(version + 1, len(MIGRATIONS)),
+                    MIGRATIONS[version + 1 :],
+                ):
+                    await cur.execute(migration)
+                    await cur.execute(
+                        "INSERT INTO checkpoint_migrations (v) VALUES (?)", (v,)
+                    )
+                # moved once checkpoint_blobs has all the columns of later migrations
+                if version < BLOBS_MIGRATION:
+                    await self._migrate_channel_values(cur)
+            await self.conn.commit()
 
             self.is_setup = True
 
+    async def _migrate_channel_values(self, cur: aiosqlite.Cursor) -> None:
+        """Move the channel values of existing checkpoints to checkpoint_blobs."""
+        await cur.execute(
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, type, checkpoint FROM checkpoints"
+        )
+        blobs, updates = migrate_channel_values(self.serde, await cur.fetchall())
+        if blobs:
+            await cur.executemany(UPSERT_BLOBS_SQL, blobs)
+        if updates:
+            await cur.executemany(
+                "UPDATE checkpoints SET type = ?, checkpoint = ? WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                updates,
+            )
+
+    async def _load_checkpoint(
+        self,
+        cur: aiosqlite.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        type: str,
+        checkpoint: bytes,
+    ) -> Checkpoint:
+        """Deserialize a checkpoint, along with the values of its channel versions."""
+        saved = self.serde.loads_typed((type, checkpoint))
+        # checkpoints saved before BLOBS_MIGRATION and not migrated keep their values
+        if "channel_values" not in saved:
+            versions = blob_versions(saved)
+            await cur.execute(SELECT_BLOBS_SQL, (versions, thread_id, checkpoint_ns))
+            rows = await cur.fetchall()
+            prefix_rows: Iterable[Any] = ()
+            if has_prefixes(rows):
+                await cur.execute(
+                    SELECT_PREFIX_BLOBS_SQL, (versions, thread_id, checkpoint_ns)
+                )
+                prefix_rows = await cur.fetchall()
+            saved["channel_values"] = load_blobs(
+                self.serde, rows, prefix_rows, self, thread_id, checkpoint_ns
+            )
+        return saved
+
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -325,6 +388,10 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # deserialize the checkpoint
+                saved = await self._load_checkpoint(
+                    cur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 # find any pending writes
                 await cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -334,10 +401,9 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    saved,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -398,6 +464,9 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
+                saved = await self._load_checkpoint(
+                    wcur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 await wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -410,7 +479,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    saved,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -453,21 +522,37 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         await self.setup()
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        # channel values are saved once per version, in checkpoint_blobs
+        copy = checkpoint.copy()
+        values = copy.pop("channel_values", {})  # type: ignore[misc]
+        blobs = dump_blobs(
+            self.serde,
+            str(thread_id),
+            checkpoint_ns,
+            values,
+            new_versions,
+            self,
+            self.max_segments,
+        )
+        type_, serialized_checkpoint = self.serde.dumps_typed(copy)
         serialized_metadata = self.jsonplus_serde.dumps(metadata)
-        async with self.lock, self.conn.execute(
-            "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (
-                str(config["configurable"]["thread_id"]),
-                checkpoint_ns,
-                checkpoint["id"],
-                config["configurable"].get("checkpoint_id"),
-                type_,
-                serialized_checkpoint,
-                serialized_metadata,
-            ),
-        ):
+        async with self.lock, self.conn.cursor() as cur:
+            if blobs:
+                await cur.executemany(UPSERT_BLOBS_SQL, blobs)
+            await cur.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(config["configurable"]["thread_id"]),
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    serialized_checkpoint,
+                    serialized_metadata,
+                ),
+            )
             await self.conn.commit()
+        save_segments(self, values, blobs)
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -491,28 +576,28 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             writes (Sequence[Tuple[str, Any]]): List of writes to store, each as (channel, value) pair.
             task_id (str): Identifier for the task creating the writes.
         """
-        query = (
-            "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
-        )
+        await self.aput_writes_batch(config, [(task_id, writes)])
+
+    async def aput_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint asynchronously.
+
+        This method saves the writes of all tasks to the database in a single transaction.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of task id and the list of writes of that task.
+        """
+        upserts, inserts = dump_writes(self.serde, config, task_writes)
         await self.setup()
         async with self.lock, self.conn.cursor() as cur:
-            await cur.executemany(
-                query,
-                [
-                    (
-                        str(config["configurable"]["thread_id"]),
-                        str(config["configurable"]["checkpoint_ns"]),
-                        str(config["configurable"]["checkpoint_id"]),
-                        task_id,
-                        WRITES_IDX_MAP.get(channel, idx),
-                        channel,
-                        *self.serde.dumps_typed(value),
-                    )
-                    for idx, (channel, value) in enumerate(writes)
-                ],
-            )
+            if upserts:
+                await cur.executemany(UPSERT_WRITES_SQL, upserts)
+            if inserts:
+                await cur.executemany(INSERT_WRITES_SQL, inserts)
 
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         """Generate the next version ID for a channel.
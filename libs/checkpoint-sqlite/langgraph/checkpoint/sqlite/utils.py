@@ -1,9 +1,69 @@
 import json
-from typing import Any, Dict, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from langchain_core.runnables import RunnableConfig
 
-from langgraph.checkpoint.base import get_checkpoint_id
+from langgraph.checkpoint.base import WRITES_IDX_MAP, ChannelVersions, get_checkpoint_id
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.offload import loads_typed_lazy
+from langgraph.checkpoint.serde.types import ListSegment, SavedSegment
+
+"""
+To add a new migration, add a new string to the MIGRATIONS list.
+The position of the migration in the list is the version number.
+"""
+MIGRATIONS = [
+    """CREATE TABLE IF NOT EXISTS checkpoint_migrations (
+    v INTEGER PRIMARY KEY
+);""",
+    """CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT,
+    checkpoint BLOB,
+    metadata BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);""",
+    """CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT,
+    value BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);""",
+    """CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type TEXT NOT NULL,
+    blob BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);""",
+    "ALTER TABLE checkpoint_blobs ADD COLUMN prefix_versions TEXT;",
+]
+
+# version of the migration after which channel values are saved in
+# checkpoint_blobs instead of in the checkpoints, which setup moves there once
+# all migrations have run
+BLOBS_MIGRATION = 3
+
+SELECT_BLOBS_SQL = "SELECT bl.channel, bl.type, bl.blob, bl.version, bl.prefix_versions FROM json_each(?) AS cv JOIN checkpoint_blobs AS bl ON bl.thread_id = ? AND bl.checkpoint_ns = ? AND bl.channel = cv.key AND bl.version = cv.value"
+
+# segments saved before the last one of lists saved as segments, from the start
+SELECT_PREFIX_BLOBS_SQL = "SELECT bl.channel, bl.type, bl.blob FROM json_each(?) AS cv JOIN checkpoint_blobs AS head ON head.thread_id = ? AND head.checkpoint_ns = ? AND head.channel = cv.key AND head.version = cv.value JOIN json_each(head.prefix_versions) AS pv JOIN checkpoint_blobs AS bl ON bl.thread_id = head.thread_id AND bl.checkpoint_ns = head.checkpoint_ns AND bl.channel = head.channel AND bl.version = pv.value ORDER BY bl.channel, pv.key"
+
+UPSERT_BLOBS_SQL = "INSERT OR IGNORE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob, prefix_versions) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+UPSERT_WRITES_SQL = "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+INSERT_WRITES_SQL = "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
 
 
 def _metadata_predicate(
@@ -91,3 +151,184 @@ def search_where(
         param_values.append(get_checkpoint_id(before))
 
     return ("WHERE " + " AND ".join(wheres) if wheres else "", param_values)
+
+
+def dump_writes(
+    serde: SerializerProtocol,
+    config: RunnableConfig,
+    task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
+    """Return the rows to insert for the writes of each task, split into rows
+    that replace existing ones (special writes, eg. errors and interrupts),
+    and rows that are ignored if already saved."""
+    upserts: List[Tuple[Any, ...]] = []
+    inserts: List[Tuple[Any, ...]] = []
+    thread_id = str(config["configurable"]["thread_id"])
+    checkpoint_ns = str(config["configurable"]["checkpoint_ns"])
+    checkpoint_id = str(config["configurable"]["checkpoint_id"])
+    for task_id, writes in task_writes:
+        rows = upserts if all(w[0] in WRITES_IDX_MAP for w in writes) else inserts
+        rows.extend(
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                *serde.dumps_typed(value),
+            )
+            for idx, (channel, value) in enumerate(writes)
+        )
+    return upserts, inserts
+
+
+def dump_blobs(
+    serde: SerializerProtocol,
+    thread_id: str,
+    checkpoint_ns: str,
+    values: Dict[str, Any],
+    versions: ChannelVersions,
+    saver: Any = None,
+    max_segments: int = 0,
+) -> List[Tuple[Any, ...]]:
+    """Return the rows to insert for the values of the channel versions, with
+    type "empty" for channels without a value.
+
+    Of lists checkpointed as a `ListSegment`, only the items appended since the
+    segments saved before by the saver are saved, along with the versions of
+    those segments, as a JSON array, up to max_segments blobs per list."""
+    rows: List[Tuple[Any, ...]] = []
+    for channel, version in versions.items():
+        value = values.get(channel)
+        if channel not in values:
+            rows.append(
+                (thread_id, checkpoint_ns, channel, str(version), "empty", None, None)
+            )
+        elif isinstance(value, ListSegment):
+            items, prefix_versions = value.dump(
+                saver, thread_id, checkpoint_ns, channel, max_segments
+            )
+            rows.append(
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    channel,
+                    str(version),
+                    *serde.dumps_typed(items),
+                    json.dumps(prefix_versions),
+                )
+            )
+        else:
+            rows.append(
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    channel,
+                    str(version),
+                    *serde.dumps_typed(value),
+                    None,
+                )
+            )
+    return rows
+
+
+def save_segments(
+    saver: Any, values: Dict[str, Any], blobs: Iterable[Tuple[Any, ...]]
+) -> None:
+    """Record where the lists saved as segments were saved, for the next
+    versions of their channels to extend. Called once the blobs are saved, so
+    that only saved blobs are referenced."""
+    for thread_id, checkpoint_ns, channel, version, _, _, prefix_versions in blobs:
+        if prefix_versions is not None:
+            values[channel].ref.saved = SavedSegment(
+                saver,
+                thread_id,
+                checkpoint_ns,
+                channel,
+                version,
+                tuple(json.loads(prefix_versions)),
+            )
+
+
+def blob_versions(checkpoint: Dict[str, Any]) -> str:
+    """Return the JSON object of the channel versions of a checkpoint, which
+    SELECT_BLOBS_SQL joins with the blobs."""
+    return json.dumps(
+        {k: str(v) for k, v in checkpoint.get("channel_versions", {}).items()}
+    )
+
+
+def has_prefixes(rows: Iterable[Any]) -> bool:
+    """Return whether any of the rows selected with SELECT_BLOBS_SQL is a
+    segment following segments saved before, selected with
+    SELECT_PREFIX_BLOBS_SQL."""
+    return any(row[4] not in (None, "[]") for row in rows)
+
+
+def load_blobs(
+    serde: SerializerProtocol,
+    rows: Iterable[Any],
+    prefix_rows: Iterable[Any] = (),
+    saver: Any = None,
+    thread_id: str = "",
+    checkpoint_ns: str = "",
+) -> Dict[str, Any]:
+    """Return the channel values of the rows selected with SELECT_BLOBS_SQL,
+    given the rows selected with SELECT_PREFIX_BLOBS_SQL for lists saved as
+    segments, which are assembled when first read."""
+    prefixes: Dict[str, List[Tuple[str, bytes]]] = {}
+    for channel, type_, blob in prefix_rows:
+        prefixes.setdefault(channel, []).append((type_, blob))
+    values: Dict[str, Any] = {}
+    for channel, type_, blob, version, prefix_versions in rows:
+        if type_ == "empty":
+            continue
+        elif prefix_versions is not None:
+            values[channel] = ListSegment.load_segments(
+                serde,
+                [*prefixes.get(channel, ()), (type_, blob)],
+                SavedSegment(
+                    saver,
+                    thread_id,
+                    checkpoint_ns,
+                    channel,
+                    version,
+                    tuple(json.loads(prefix_versions)),
+                ),
+            )
+        else:
+            values[channel] = loads_typed_lazy(serde, (type_, blob))
+    return values
+
+
+def migrate_channel_values(
+    serde: SerializerProtocol, rows: Iterable[Any]
+) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
+    """Return the blobs to insert and the checkpoints to update to move the
+    channel values of checkpoints saved before BLOBS_MIGRATION to blobs, given
+    rows of thread ID, checkpoint NS, checkpoint ID, type and checkpoint.
+
+    Checkpoints with values of channels without a version keep their values."""
+    blobs: List[Tuple[Any, ...]] = []
+    updates: List[Tuple[Any, ...]] = []
+    for thread_id, checkpoint_ns, checkpoint_id, type_, data in rows:
+        checkpoint = serde.loads_typed((type_, data))
+        values = checkpoint.get("channel_values")
+        versions = checkpoint.get("channel_versions", {})
+        if values is None or not all(k in versions for k in values):
+            continue
+        blobs.extend(
+            dump_blobs(
+                serde,
+                thread_id,
+                checkpoint_ns,
+                values,
+                {k: versions[k] for k in values},
+            )
+        )
+        del checkpoint["channel_values"]
+        updates.append(
+            (*serde.dumps_typed(checkpoint), thread_id, checkpoint_ns, checkpoint_id)
+        )
+    return blobs, updates
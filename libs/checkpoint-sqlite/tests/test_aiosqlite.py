@@ -9,6 +9,7 @@ from langgraph.checkpoint.base import (
     create_checkpoint,
     empty_checkpoint,
 )
+from langgraph.checkpoint.serde.types import ListSegment
 from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
 
@@ -98,3 +99,58 @@ class TestAsyncSqliteSaver:
             } == {"", "inner"}
 
             # TODO: test before and limit params
+
+    async def test_aput_writes_batch(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            config = await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            await saver.aput_writes_batch(
+                config,
+                [
+                    ("task-1", [("foo", 1), ("bar", 2)]),
+                    ("task-2", [("foo", 3)]),
+                ],
+            )
+
+            # call method / assertions
+            checkpoint_tuple = await saver.aget_tuple(config)
+            assert checkpoint_tuple is not None
+            assert checkpoint_tuple.pending_writes == [
+                ("task-1", "foo", 1),
+                ("task-1", "bar", 2),
+                ("task-2", "foo", 3),
+            ]
+
+    async def test_append_only_segments(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            config = self.config_2
+            checkpoint = self.chkpnt_2
+            segment = None
+            for i in range(3):
+                values = ["a"] * (i + 1)
+                segment = ListSegment(values, len(values), segment and segment.ref)
+                checkpoint = create_checkpoint(checkpoint, None, i)
+                checkpoint["channel_values"] = {"items": segment}
+                checkpoint["channel_versions"] = {"items": i + 1}
+                config = await saver.aput(
+                    config, checkpoint, self.metadata_2, {"items": i + 1}
+                )
+            # a list which doesn't extend a saved one is saved whole
+            checkpoint["channel_values"] = {"items": ListSegment(["b"], 1)}
+            checkpoint = create_checkpoint(checkpoint, None, 3)
+            checkpoint["channel_versions"] = {"items": 4}
+            forked = await saver.aput(config, checkpoint, self.metadata_2, {"items": 4})
+
+            async with saver.conn.execute(
+                "SELECT prefix_versions FROM checkpoint_blobs ORDER BY version"
+            ) as cur:
+                rows = await cur.fetchall()
+            assert [row[0] for row in rows] == ["[]", '["1"]', '["1", "2"]', "[]"]
+
+            checkpoint_tuple = await saver.aget_tuple(config)
+            assert checkpoint_tuple is not None
+            assert checkpoint_tuple.checkpoint["channel_values"] == {
+                "items": ["a", "a", "a"]
+            }
+            checkpoint_tuple = await saver.aget_tuple(forked)
+            assert checkpoint_tuple is not None
+            assert checkpoint_tuple.checkpoint["channel_values"] == {"items": ["b"]}
@@ -0,0 +1,45 @@
+from pytest_mock import MockerFixture
+
+from langgraph.cache.sqlite import SqliteCache
+
+
+def test_sqlite_cache(mocker: MockerFixture) -> None:
+    now = mocker.patch("time.time", return_value=1000.0)
+    with SqliteCache.from_conn_string(":memory:") as cache:
+        cache.set(
+            {
+                (("a", "b"), "k1"): ([("chan", 1)], None),
+                (("a", "b"), "k2"): ({"x": "y"}, 10),
+                (("c",), "k1"): ("value", None),
+            }
+        )
+        assert cache.get([(("a", "b"), "k1"), (("a", "b"), "k2"), (("a",), "k1")]) == {
+            (("a", "b"), "k1"): [["chan", 1]],
+            (("a", "b"), "k2"): {"x": "y"},
+        }
+
+        # overwriting an entry replaces its value
+        cache.set({(("a", "b"), "k1"): ([("chan", 2)], None)})
+        assert cache.get([(("a", "b"), "k1")]) == {(("a", "b"), "k1"): [["chan", 2]]}
+
+        # expired entries are treated as missing
+        now.return_value = 1011.0
+        assert cache.get([(("a", "b"), "k2")]) == {}
+
+        # clear a single namespace
+        cache.clear([("a", "b")])
+        assert cache.get([(("a", "b"), "k1"), (("c",), "k1")]) == {
+            (("c",), "k1"): "value"
+        }
+
+        # clear everything
+        cache.clear()
+        assert cache.get([(("c",), "k1")]) == {}
+
+
+async def test_sqlite_cache_async() -> None:
+    with SqliteCache.from_conn_string(":memory:") as cache:
+        await cache.aset({(("ns",), "k"): ("v", None)})
+        assert await cache.aget([(("ns",), "k")]) == {(("ns",), "k"): "v"}
+        await cache.aclear()
+        assert await cache.aget([(("ns",), "k")]) == {}
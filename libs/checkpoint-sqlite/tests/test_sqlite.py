@@ -1,3 +1,4 @@
+import sqlite3
 from typing import Any, cast
 
 import pytest
@@ -9,8 +10,13 @@ from langgraph.checkpoint.base import (
     create_checkpoint,
     empty_checkpoint,
 )
+from langgraph.checkpoint.serde.types import ListSegment
 from langgraph.checkpoint.sqlite import SqliteSaver
-from langgraph.checkpoint.sqlite.utils import _metadata_predicate, search_where
+from langgraph.checkpoint.sqlite.utils import (
+    MIGRATIONS,
+    _metadata_predicate,
+    search_where,
+)
 
 
 class TestSqliteSaver:
@@ -155,3 +161,161 @@ class TestSqliteSaver:
             with pytest.raises(NotImplementedError, match="AsyncSqliteSaver"):
                 async for _ in saver.alist(self.config_1):
                     pass
+
+    def test_put_writes_batch(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config = saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            saver.put_writes_batch(
+                config,
+                [
+                    ("task-1", [("foo", 1), ("bar", 2)]),
+                    ("task-2", [("foo", 3)]),
+                ],
+            )
+
+            # call method / assertions
+            checkpoint_tuple = saver.get_tuple(config)
+            assert checkpoint_tuple is not None
+            assert checkpoint_tuple.pending_writes == [
+                ("task-1", "foo", 1),
+                ("task-1", "bar", 2),
+                ("task-2", "foo", 3),
+            ]
+
+    def test_channel_blobs(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            checkpoint = create_checkpoint(self.chkpnt_1, None, 1)
+            checkpoint["channel_values"] = {"foo": "a", "bar": ["b"]}
+            checkpoint["channel_versions"] = {"foo": 1, "bar": 1}
+            first = saver.put(
+                self.config_1, checkpoint, self.metadata_1, {"foo": 1, "bar": 1}
+            )
+            child = create_checkpoint(checkpoint, None, 2)
+            child["channel_values"] = {"foo": "c", "bar": ["b"]}
+            child["channel_versions"] = {"foo": 2, "bar": 1}
+            second = saver.put(first, child, self.metadata_2, {"foo": 2})
+
+            # values are saved once per channel version
+            with saver.cursor(transaction=False) as cur:
+                cur.execute(
+                    "SELECT channel, version FROM checkpoint_blobs ORDER BY channel, version"
+                )
+                assert cur.fetchall() == [("bar", "1"), ("foo", "1"), ("foo", "2")]
+            # and read back with each checkpoint
+            saved = saver.get_tuple(first)
+            assert saved is not None
+            assert saved.checkpoint["channel_values"] == {"foo": "a", "bar": ["b"]}
+            saved = saver.get_tuple(second)
+            assert saved is not None
+            assert saved.checkpoint["channel_values"] == {"foo": "c", "bar": ["b"]}
+            assert [
+                c.checkpoint["channel_values"]
+                for c in saver.list({"configurable": {"thread_id": "thread-1"}})
+            ] == [{"foo": "c", "bar": ["b"]}, {"foo": "a", "bar": ["b"]}]
+
+    def test_append_only_segments(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            saver.max_segments = 3
+            config = self.config_2
+            checkpoint = self.chkpnt_2
+            segment = None
+            for i in range(5):
+                if i == 4:
+                    # continue from the list loaded back
+                    saved = saver.get_tuple(config)
+                    assert saved is not None
+                    segment = saved.checkpoint["channel_values"]["items"]
+                    assert isinstance(segment, ListSegment)
+                values = [*(segment or ()), i]
+                segment = ListSegment(values, len(values), segment and segment.ref)
+                checkpoint = create_checkpoint(checkpoint, None, i)
+                checkpoint["channel_values"] = {"items": segment, "other": [i]}
+                checkpoint["channel_versions"] = {"items": i + 1, "other": i + 1}
+                config = saver.put(
+                    config,
+                    checkpoint,
+                    self.metadata_2,
+                    {"items": i + 1, "other": i + 1},
+                )
+
+            # appended items are saved on their own, up to max_segments blobs,
+            # other lists are saved whole
+            with saver.cursor(transaction=False) as cur:
+                cur.execute(
+                    "SELECT prefix_versions FROM checkpoint_blobs "
+                    "WHERE channel IN ('items', 'other') ORDER BY channel, version"
+                )
+                assert [row[0] for row in cur.fetchall()] == [
+                    "[]",
+                    '["1"]',
+                    '["1", "2"]',
+                    "[]",
+                    '["4"]',
+                    *[None] * 5,
+                ]
+
+            # the whole list is loaded back
+            checkpoint_tuple = saver.get_tuple(config)
+            assert checkpoint_tuple is not None
+            assert checkpoint_tuple.checkpoint["channel_values"] == {
+                "items": [0, 1, 2, 3, 4],
+                "other": [4],
+            }
+            assert [
+                c.checkpoint["channel_values"]["items"]
+                for c in saver.list({"configurable": {"thread_id": "thread-2"}})
+            ] == [[0, 1, 2, 3, 4], [0, 1, 2, 3], [0, 1, 2], [0, 1], [0]]
+
+    def test_migrate_channel_values(self) -> None:
+        with sqlite3.connect(":memory:", check_same_thread=False) as conn:
+            # database saved before checkpoint_blobs, with values in checkpoints
+            conn.executescript(
+                """
+                CREATE TABLE checkpoints (
+                    thread_id TEXT NOT NULL,
+                    checkpoint_ns TEXT NOT NULL DEFAULT '',
+                    checkpoint_id TEXT NOT NULL,
+                    parent_checkpoint_id TEXT,
+                    type TEXT,
+                    checkpoint BLOB,
+                    metadata BLOB,
+                    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+                );
+                """
+            )
+            saver = SqliteSaver(conn)
+            checkpoint = create_checkpoint(self.chkpnt_1, None, 1)
+            checkpoint["channel_values"] = {"foo": "a", "bar": "b"}
+            checkpoint["channel_versions"] = {"foo": 1, "bar": 1}
+            conn.execute(
+                "INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    "thread-1",
+                    "",
+                    checkpoint["id"],
+                    *saver.serde.dumps_typed(checkpoint),
+                    saver.jsonplus_serde.dumps({}),
+                ),
+            )
+            first: RunnableConfig = {
+                "configurable": {
+                    "thread_id": "thread-1",
+                    "checkpoint_ns": "",
+                    "checkpoint_id": checkpoint["id"],
+                }
+            }
+
+            # the values are moved to blobs, which later checkpoints use
+            saved = saver.get_tuple(first)
+            assert saved is not None
+            assert saved.checkpoint["channel_values"] == {"foo": "a", "bar": "b"}
+            child = create_checkpoint(checkpoint, None, 2)
+            child["channel_values"] = {"foo": "c", "bar": "b"}
+            child["channel_versions"] = {"foo": 2, "bar": 1}
+            second = saver.put(first, child, {}, {"foo": 2})
+            saved = saver.get_tuple(second)
+            assert saved is not None
+            assert saved.checkpoint["channel_values"] == {"foo": "c", "bar": "b"}
+            with saver.cursor(transaction=False) as cur:
+                cur.execute("SELECT MAX(v) FROM checkpoint_migrations")
+                assert cur.fetchone() == (len(MIGRATIONS) - 1,)
@@ -0,0 +1,78 @@
+"""Base classes for node result caches.
+
+A cache maps a (namespace, key) pair to a previously computed value, optionally
+expiring after a time-to-live. Pregel uses it to skip re-executing nodes whose
+cache policy produces a key that was already seen, replaying the stored writes
+instead.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Generic, Mapping, Optional, Sequence, TypeVar
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+ValueT = TypeVar("ValueT")
+
+Namespace = tuple[str, ...]
+"""Hierarchical namespace of a cache entry, eg. the path of the cached node."""
+
+FullKey = tuple[Namespace, str]
+"""Fully qualified key of a cache entry, a (namespace, key) pair."""
+
+
+class BaseCache(ABC, Generic[ValueT]):
+    """Base class for a cache of node results.
+
+    Implementations must treat expired entries as missing.
+    """
+
+    serde: SerializerProtocol = JsonPlusSerializer()
+
+    def __init__(self, *, serde: Optional[SerializerProtocol] = None) -> None:
+        self.serde = serde or self.serde
+
+    @abstractmethod
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Get the cached values for the given keys.
+
+        Args:
+            keys: The keys to look up.
+
+        Returns:
+            A mapping of the keys that were found (and not expired) to their values.
+        """
+
+    @abstractmethod
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Asynchronously get the cached values for the given keys."""
+
+    @abstractmethod
+    def set(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[float]]]) -> None:
+        """Set the cached values for the given keys.
+
+        Args:
+            pairs: A mapping of keys to (value, ttl) pairs. The ttl is in seconds,
+                None means the entry never expires.
+        """
+
+    @abstractmethod
+    async def aset(
+        self, pairs: Mapping[FullKey, tuple[ValueT, Optional[float]]]
+    ) -> None:
+        """Asynchronously set the cached values for the given keys."""
+
+    @abstractmethod
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Delete the cached values for the given namespaces.
+
+        Args:
+            namespaces: The namespaces to clear. If None, clears the whole cache.
+        """
+
+    @abstractmethod
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Asynchronously delete the cached values for the given namespaces."""
+
+
+__all__ = ["BaseCache", "FullKey", "Namespace"]
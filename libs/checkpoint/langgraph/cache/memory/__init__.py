@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Mapping, Optional, Sequence
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+
+class InMemoryCache(BaseCache[Any]):
+    """A cache backed by an in-memory, least-recently-used ordered dictionary.
+
+    Values are stored serialized, so cached results can't be mutated by callers.
+
+    Args:
+        maxsize: Maximum number of entries to keep. When exceeded, the least
+            recently used entry is evicted. None means unbounded.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: Optional[int] = 1024,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.maxsize = maxsize
+        self._data: OrderedDict[FullKey, tuple[tuple[str, bytes], Optional[float]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        now = time.time()
+        found: dict[FullKey, tuple[str, bytes]] = {}
+        with self._lock:
+            for key in keys:
+                if entry := self._data.get(key):
+                    value, expiry = entry
+                    if expiry is not None and expiry <= now:
+                        del self._data[key]
+                    else:
+                        self._data.move_to_end(key)
+                        found[key] = value
+        return {key: self.serde.loads_typed(value) for key, value in found.items()}
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        return self.get(keys)
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[float]]]) -> None:
+        now = time.time()
+        entries = {
+            key: (
+                self.serde.dumps_typed(value),
+                now + ttl if ttl is not None else None,
+            )
+            for key, (value, ttl) in pairs.items()
+        }
+        with self._lock:
+            for key, entry in entries.items():
+                self._data[key] = entry
+                self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[Any, Optional[float]]]) -> None:
+        self.set(pairs)
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        with self._lock:
+            if namespaces is None:
+                self._data.clear()
+            else:
+                to_clear = set(namespaces)
+                for key in [k for k in self._data if k[0] in to_clear]:
+                    del self._data[key]
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        self.clear(namespaces)
@@ -130,7 +130,14 @@ def create_checkpoint(
     *,
     id: Optional[str] = None,
 ) -> Checkpoint:
-    """Create a checkpoint for the given channels."""
+    """Create a checkpoint for the given channels.
+
+    The new checkpoint shares `channel_versions`, `versions_seen` and
+    `pending_sends` with the given checkpoint, rather than copying them.
+    Checkpoints are treated as copy-on-write: code updating a checkpoint
+    (eg. `apply_writes` in the Pregel loop) replaces nested values instead of
+    mutating them in place, so snapshots handed to a checkpointer stay unchanged
+    while only the entries that were modified are copied."""
     ts = datetime.now(timezone.utc).isoformat()
     if channels is None:
         values = checkpoint["channel_values"]
@@ -315,6 +322,25 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to the same checkpoint.
+
+        Used to save the writes of tasks finishing close together in a single call.
+        Savers backed by a database should override this to store them in a single
+        round-trip. Defaults to calling `put_writes` for each task.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task id and the list of writes of that task.
+        """
+        for task_id, writes in task_writes:
+            self.put_writes(config, writes, task_id)
+
     async def aget(self, config: RunnableConfig) -> Optional[Checkpoint]:
         """Asynchronously fetch a checkpoint using the given configuration.
 
@@ -407,6 +433,22 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    async def aput_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Asynchronously store intermediate writes of several tasks linked to the
+        same checkpoint. Defaults to calling `aput_writes` for each task.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task id and the list of writes of that task.
+        """
+        for task_id, writes in task_writes:
+            await self.aput_writes(config, writes, task_id)
+
     def get_next_version(self, current: Optional[V], channel: ChannelProtocol) -> V:
         """Generate the next version ID for a channel.
 
@@ -1,10 +1,27 @@
 import asyncio
+import copy
+import marshal
+import pickle
 import random
-from collections import defaultdict
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from contextvars import copy_context
 from functools import partial
 from types import TracebackType
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 from langchain_core.runnables import RunnableConfig
 
@@ -18,6 +35,7 @@ from langgraph.checkpoint.base import (
     SerializerProtocol,
     get_checkpoint_id,
 )
+from langgraph.checkpoint.serde.offload import loads_typed_lazy
 from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
 
 
@@ -27,6 +45,9 @@ class MemorySaver(
     """An in-memory checkpoint saver.
 
     This checkpoint saver stores checkpoints in memory using a defaultdict.
+    Channel values are stored once per channel and version, as `PostgresSaver`
+    does, so each checkpoint only adds the values of the channels updated since
+    the checkpoints saved before it.
 
     Note:
         Only use `MemorySaver` for debugging or testing purposes.
@@ -34,6 +55,25 @@ class MemorySaver(
 
     Args:
         serde (Optional[SerializerProtocol]): The serializer to use for serializing and deserializing checkpoints. Defaults to None.
+        max_checkpoints (Optional[int]): Maximum number of checkpoints to keep for each
+            thread and checkpoint namespace. When exceeded, the oldest checkpoints are
+            dropped along with their pending writes. None means unbounded.
+        max_threads (Optional[int]): Maximum number of threads to keep. When exceeded,
+            all checkpoints of the least recently used thread are dropped. None means
+            unbounded.
+        max_bytes (Optional[int]): Approximate budget for the serialized checkpoints,
+            metadata and writes kept. When exceeded, the least recently used threads
+            are dropped, then the oldest checkpoints of the thread being written,
+            always keeping its latest checkpoint. None means unbounded.
+        snapshots (bool): Whether to store in-process snapshots of checkpoints,
+            metadata and writes, instead of encoding them with `serde`. Snapshots
+            are taken with `marshal` or `pickle`, which are much faster than `serde`.
+            As with `serde`, values are copied when saved and when read, so callers
+            can't change what is saved.
+            Can't be combined with `max_bytes`. Defaults to False.
+
+    The number of threads and checkpoints dropped so far are counted in
+    `evicted_threads` and `pruned_checkpoints`.
 
     Examples:
 
@@ -63,15 +103,51 @@ class MemorySaver(
     writes: defaultdict[
         tuple[str, str, str], dict[tuple[str, int], tuple[str, str, tuple[str, bytes]]]
     ]
+    # thread ID -> (checkpoint NS, channel, version) -> channel value
+    blobs: defaultdict[str, dict[tuple[str, str, Any], tuple[str, bytes]]]
 
     def __init__(
         self,
         *,
         serde: Optional[SerializerProtocol] = None,
+        max_checkpoints: Optional[int] = None,
+        max_threads: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        snapshots: bool = False,
     ) -> None:
         super().__init__(serde=serde)
+        if snapshots and max_bytes is not None:
+            raise ValueError("max_bytes can't be used with snapshots")
+        if max_checkpoints is not None and max_checkpoints < 1:
+            raise ValueError("max_checkpoints must be at least 1")
+        if max_threads is not None and max_threads < 1:
+            raise ValueError("max_threads must be at least 1")
         self.storage = defaultdict(lambda: defaultdict(dict))
         self.writes = defaultdict(dict)
+        self.blobs = defaultdict(dict)
+        self.max_checkpoints = max_checkpoints
+        self.max_threads = max_threads
+        self.max_bytes = max_bytes
+        self.snapshots = snapshots
+        self.evicted_threads = 0
+        self.pruned_checkpoints = 0
+        # thread IDs, least recently used first, tracked when threads can be evicted
+        self._threads: OrderedDict[str, None] = OrderedDict()
+        # bytes stored for each thread, tracked when max_bytes is set
+        self._thread_bytes: defaultdict[str, int] = defaultdict(int)
+        self._bytes = 0
+        # checkpoint IDs of each thread and namespace, in order
+        self._ids: dict[tuple[str, str], List[str]] = {}
+        # number of checkpoints using each blob, tracked when checkpoints can be dropped
+        self._refs: defaultdict[str, defaultdict[tuple[str, str, Any], int]] = (
+            defaultdict(lambda: defaultdict(int))
+        )
+        self._lock = threading.RLock()
+        self._bounded = (
+            max_checkpoints is not None
+            or max_threads is not None
+            or max_bytes is not None
+        )
 
     def __enter__(self) -> "MemorySaver":
         return self
@@ -111,16 +187,24 @@ class MemorySaver(
         """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        if thread_id in self.storage:
+            self._touch(thread_id)
         if checkpoint_id := get_checkpoint_id(config):
-            if saved := self.storage[thread_id][checkpoint_ns].get(checkpoint_id):
+            if (
+                saved := self.storage.get(thread_id, {})
+                .get(checkpoint_ns, {})
+                .get(checkpoint_id)
+            ):
                 checkpoint, metadata, parent_checkpoint_id = saved
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
+                writes = self.writes.get(
+                    (thread_id, checkpoint_ns, checkpoint_id), {}
+                ).values()
                 if parent_checkpoint_id:
                     sends = [
                         w[2]
-                        for w in self.writes[
-                            (thread_id, checkpoint_ns, parent_checkpoint_id)
-                        ].values()
+                        for w in self.writes.get(
+                            (thread_id, checkpoint_ns, parent_checkpoint_id), {}
+                        ).values()
                         if w[1] == TASKS
                     ]
                 else:
@@ -128,13 +212,11 @@ class MemorySaver(
                 return CheckpointTuple(
                     config=config,
                     checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s) for s in sends],
+                        **self._loads_checkpoint(thread_id, checkpoint_ns, checkpoint),
+                        "pending_sends": [self._loads(s) for s in sends],
                     },
-                    metadata=self.serde.loads_typed(metadata),
-                    pending_writes=[
-                        (id, c, self.serde.loads_typed(v)) for id, c, v in writes
-                    ],
+                    metadata=self._loads(metadata),
+                    pending_writes=[(id, c, self._loads(v)) for id, c, v in writes],
                     parent_config={
                         "configurable": {
                             "thread_id": thread_id,
@@ -146,16 +228,19 @@ class MemorySaver(
                     else None,
                 )
         else:
-            if checkpoints := self.storage[thread_id][checkpoint_ns]:
-                checkpoint_id = max(checkpoints.keys())
+            if checkpoints := self.storage.get(thread_id, {}).get(checkpoint_ns):
+                with self._lock:
+                    checkpoint_id = self._checkpoint_ids(thread_id, checkpoint_ns)[-1]
                 checkpoint, metadata, parent_checkpoint_id = checkpoints[checkpoint_id]
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
+                writes = self.writes.get(
+                    (thread_id, checkpoint_ns, checkpoint_id), {}
+                ).values()
                 if parent_checkpoint_id:
                     sends = [
                         w[2]
-                        for w in self.writes[
-                            (thread_id, checkpoint_ns, parent_checkpoint_id)
-                        ].values()
+                        for w in self.writes.get(
+                            (thread_id, checkpoint_ns, parent_checkpoint_id), {}
+                        ).values()
                         if w[1] == TASKS
                     ]
                 else:
@@ -169,13 +254,11 @@ class MemorySaver(
                         }
                     },
                     checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s) for s in sends],
+                        **self._loads_checkpoint(thread_id, checkpoint_ns, checkpoint),
+                        "pending_sends": [self._loads(s) for s in sends],
                     },
-                    metadata=self.serde.loads_typed(metadata),
-                    pending_writes=[
-                        (id, c, self.serde.loads_typed(v)) for id, c, v in writes
-                    ],
+                    metadata=self._loads(metadata),
+                    pending_writes=[(id, c, self._loads(v)) for id, c, v in writes],
                     parent_config={
                         "configurable": {
                             "thread_id": thread_id,
@@ -214,37 +297,43 @@ class MemorySaver(
             config["configurable"].get("checkpoint_ns") if config else None
         )
         config_checkpoint_id = get_checkpoint_id(config) if config else None
+        before_checkpoint_id = get_checkpoint_id(before) if before else None
         for thread_id in thread_ids:
-            for checkpoint_ns in self.storage[thread_id].keys():
+            for checkpoint_ns in list(self.storage.get(thread_id, {}).keys()):
                 if (
                     config_checkpoint_ns is not None
                     and checkpoint_ns != config_checkpoint_ns
                 ):
                     continue
 
-                for checkpoint_id, (
-                    checkpoint,
-                    metadata_b,
-                    parent_checkpoint_id,
-                ) in sorted(
-                    self.storage[thread_id][checkpoint_ns].items(),
-                    key=lambda x: x[0],
-                    reverse=True,
-                ):
+                checkpoints = self.storage[thread_id][checkpoint_ns]
+                checkpoint_ids: Iterable[str]
+                if config_checkpoint_id:
                     # filter by checkpoint ID from config
-                    if config_checkpoint_id and checkpoint_id != config_checkpoint_id:
+                    checkpoint_ids = (config_checkpoint_id,)
+                else:
+                    # newest first, starting before the checkpoint ID of `before`
+                    # from a snapshot of the IDs, as puts may insert into them
+                    with self._lock:
+                        ids = self._checkpoint_ids(thread_id, checkpoint_ns)
+                        end = (
+                            bisect_left(ids, before_checkpoint_id)
+                            if before_checkpoint_id
+                            else len(ids)
+                        )
+                        checkpoint_ids = reversed(ids[:end])
+
+                for checkpoint_id in checkpoint_ids:
+                    if (saved := checkpoints.get(checkpoint_id)) is None:
                         continue
+                    checkpoint, metadata_b, parent_checkpoint_id = saved
 
                     # filter by checkpoint ID from `before` config
-                    if (
-                        before
-                        and (before_checkpoint_id := get_checkpoint_id(before))
-                        and checkpoint_id >= before_checkpoint_id
-                    ):
+                    if before_checkpoint_id and checkpoint_id >= before_checkpoint_id:
                         continue
 
                     # filter by metadata
-                    metadata = self.serde.loads_typed(metadata_b)
+                    metadata = self._loads(metadata_b)
                     if filter and not all(
                         query_value == metadata.get(query_key)
                         for query_key, query_value in filter.items()
@@ -257,16 +346,16 @@ class MemorySaver(
                     elif limit is not None:
                         limit -= 1
 
-                    writes = self.writes[
-                        (thread_id, checkpoint_ns, checkpoint_id)
-                    ].values()
+                    writes = self.writes.get(
+                        (thread_id, checkpoint_ns, checkpoint_id), {}
+                    ).values()
 
                     if parent_checkpoint_id:
                         sends = [
                             w[2]
-                            for w in self.writes[
-                                (thread_id, checkpoint_ns, parent_checkpoint_id)
-                            ].values()
+                            for w in self.writes.get(
+                                (thread_id, checkpoint_ns, parent_checkpoint_id), {}
+                            ).values()
                             if w[1] == TASKS
                         ]
                     else:
@@ -281,8 +370,10 @@ class MemorySaver(
                             }
                         },
                         checkpoint={
-                            **self.serde.loads_typed(checkpoint),
-                            "pending_sends": [self.serde.loads_typed(s) for s in sends],
+                            **self._loads_checkpoint(
+                                thread_id, checkpoint_ns, checkpoint
+                            ),
+                            "pending_sends": [self._loads(s) for s in sends],
                         },
                         metadata=metadata,
                         parent_config={
@@ -294,9 +385,7 @@ class MemorySaver(
                         }
                         if parent_checkpoint_id
                         else None,
-                        pending_writes=[
-                            (id, c, self.serde.loads_typed(v)) for id, c, v in writes
-                        ],
+                        pending_writes=[(id, c, self._loads(v)) for id, c, v in writes],
                     )
 
     def put(
@@ -322,17 +411,50 @@ class MemorySaver(
         """
         c = checkpoint.copy()
         c.pop("pending_sends")  # type: ignore[misc]
+        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        self.storage[thread_id][checkpoint_ns].update(
-            {
-                checkpoint["id"]: (
-                    self.serde.dumps_typed(c),
-                    self.serde.dumps_typed(metadata),
-                    config["configurable"].get("checkpoint_id"),  # parent
+        parent_checkpoint_id = config["configurable"].get("checkpoint_id")
+        dumps = _snapshot if self.snapshots else self.serde.dumps_typed
+        saved = (dumps(c), dumps(metadata), parent_checkpoint_id)
+        with self._lock:
+            # store the values of the channel versions not stored yet, ie. those
+            # in new_versions, unless callers left out some updated channels
+            blobs = self.blobs[thread_id]
+            for k, v in c["channel_versions"].items():
+                if k in values and (checkpoint_ns, k, v) not in blobs:
+                    blob = blobs[(checkpoint_ns, k, v)] = dumps(values[k])
+                    if self.max_bytes is not None:
+                        self._count(thread_id, _sizeof(blob))
+            if self._bounded:
+                refs = self._refs[thread_id]
+                for k, v in c["channel_versions"].items():
+                    if (checkpoint_ns, k, v) in blobs:
+                        refs[(checkpoint_ns, k, v)] += 1
+            checkpoints = self.storage[thread_id][checkpoint_ns]
+            ids = self._checkpoint_ids(thread_id, checkpoint_ns)
+            if previous := checkpoints.get(checkpoint["id"]):
+                if self.max_bytes is not None:
+                    self._count(thread_id, -_sizeof(previous[0], previous[1]))
+                self._release(thread_id, checkpoint_ns, previous[0])
+            elif not ids or checkpoint["id"] > ids[-1]:
+                ids.append(checkpoint["id"])
+            else:
+                insort(ids, checkpoint["id"])
+            if self.max_bytes is not None:
+                self._count(thread_id, _sizeof(saved[0], saved[1]))
+            checkpoints[checkpoint["id"]] = saved
+            self._touch(thread_id)
+            if (
+                self.max_checkpoints is not None
+                and len(checkpoints) > self.max_checkpoints
+            ):
+                self._prune(
+                    thread_id,
+                    checkpoint_ns,
+                    ids[: len(checkpoints) - self.max_checkpoints],
                 )
-            }
-        )
+            self._evict(thread_id)
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -364,9 +486,176 @@ class MemorySaver(
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
         checkpoint_id = config["configurable"]["checkpoint_id"]
         outer_key = (thread_id, checkpoint_ns, checkpoint_id)
-        for idx, (c, v) in enumerate(writes):
-            inner_key = (task_id, WRITES_IDX_MAP.get(c, idx))
-            self.writes[outer_key][inner_key] = (task_id, c, self.serde.dumps_typed(v))
+        saved = {
+            (task_id, WRITES_IDX_MAP.get(c, idx)): (
+                task_id,
+                c,
+                _snapshot(v) if self.snapshots else self.serde.dumps_typed(v),
+            )
+            for idx, (c, v) in enumerate(writes)
+        }
+        with self._lock:
+            if self._bounded and checkpoint_id not in self.storage.get(
+                thread_id, {}
+            ).get(checkpoint_ns, {}):
+                # the checkpoint was dropped, its writes would never be read
+                return
+            outer = self.writes[outer_key]
+            if self.max_bytes is not None:
+                for inner_key, w in saved.items():
+                    if previous := outer.get(inner_key):
+                        self._count(thread_id, -_sizeof(previous[2]))
+                    self._count(thread_id, _sizeof(w[2]))
+            outer.update(saved)
+            self._touch(thread_id)
+            self._evict(thread_id)
+
+    def _loads(self, data: tuple[str, bytes]) -> Any:
+        if self.snapshots:
+            return _restore(data)
+        return self.serde.loads_typed(data)
+
+    def _loads_checkpoint(
+        self, thread_id: str, checkpoint_ns: str, data: tuple[str, bytes]
+    ) -> Any:
+        checkpoint = self._loads(data)
+        if "channel_values" not in checkpoint:
+            # assemble the values from the blobs of the channel versions
+            blobs = self.blobs.get(thread_id, {})
+            loads = (
+                _restore if self.snapshots else partial(loads_typed_lazy, self.serde)
+            )
+            checkpoint["channel_values"] = {
+                k: loads(blob)
+                for k, v in checkpoint["channel_versions"].items()
+                if (blob := blobs.get((checkpoint_ns, k, v))) is not None
+            }
+        return checkpoint
+
+    def _release(
+        self, thread_id: str, checkpoint_ns: str, data: tuple[str, bytes]
+    ) -> None:
+        """Drop the blobs of a dropped checkpoint which no other checkpoint uses."""
+        if not self._bounded:
+            return
+        checkpoint = self._loads(data)
+        if "channel_values" in checkpoint:
+            return
+        blobs = self.blobs[thread_id]
+        refs = self._refs[thread_id]
+        for k, v in checkpoint["channel_versions"].items():
+            key = (checkpoint_ns, k, v)
+            if key not in refs:
+                continue
+            refs[key] -= 1
+            if not refs[key]:
+                del refs[key]
+                blob = blobs.pop(key)
+                if self.max_bytes is not None:
+                    self._count(thread_id, -_sizeof(blob))
+
+    def _checkpoint_ids(self, thread_id: str, checkpoint_ns: str) -> List[str]:
+        """Sorted IDs of the checkpoints of the thread and namespace, to be
+        called holding `self._lock`, as puts insert into them."""
+        checkpoints = self.storage.get(thread_id, {}).get(checkpoint_ns, {})
+        key = (thread_id, checkpoint_ns)
+        ids = self._ids.get(key)
+        if ids is None or len(ids) != len(checkpoints):
+            # rebuild the index of checkpoints saved without calling put
+            ids = self._ids[key] = sorted(checkpoints)
+        return ids
+
+    def _touch(self, thread_id: str) -> None:
+        """Mark the thread as the most recently used."""
+        if self.max_threads is not None or self.max_bytes is not None:
+            with self._lock:
+                self._threads[thread_id] = None
+                self._threads.move_to_end(thread_id)
+
+    def _count(self, thread_id: str, size: int) -> None:
+        self._thread_bytes[thread_id] += size
+        self._bytes += size
+
+    def _evict(self, thread_id: str) -> None:
+        """Drop threads, then checkpoints of the thread written, over the limits."""
+        if self.max_threads is not None:
+            while len(self._threads) > self.max_threads:
+                self._evict_thread(next(iter(self._threads)))
+        if self.max_bytes is not None:
+            while self._bytes > self.max_bytes and len(self._threads) > 1:
+                lru = next(iter(self._threads))
+                if lru == thread_id:
+                    break
+                self._evict_thread(lru)
+            if self._bytes > self.max_bytes:
+                # drop the oldest checkpoints of the thread, across namespaces
+                oldest = sorted(
+                    (checkpoint_id, checkpoint_ns)
+                    for checkpoint_ns in self.storage[thread_id]
+                    for checkpoint_id in self._checkpoint_ids(thread_id, checkpoint_ns)[
+                        :-1
+                    ]
+                )
+                for checkpoint_id, checkpoint_ns in oldest:
+                    if self._bytes <= self.max_bytes:
+                        break
+                    self._prune(thread_id, checkpoint_ns, [checkpoint_id])
+
+    def _evict_thread(self, thread_id: str) -> None:
+        """Drop all checkpoints and writes of the thread."""
+        self._threads.pop(thread_id, None)
+        self.blobs.pop(thread_id, None)
+        self._refs.pop(thread_id, None)
+        for checkpoint_ns in self.storage.pop(thread_id, {}):
+            self._ids.pop((thread_id, checkpoint_ns), None)
+        # including the sends kept for checkpoints which were pruned
+        for key in [key for key in self.writes if key[0] == thread_id]:
+            del self.writes[key]
+        self._bytes -= self._thread_bytes.pop(thread_id, 0)
+        self.evicted_threads += 1
+
+    def _prune(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_ids: Sequence[str]
+    ) -> None:
+        """Drop checkpoints of the thread and namespace, with their writes."""
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        ids = self._checkpoint_ids(thread_id, checkpoint_ns)
+        pruned_parents: set[Optional[str]] = set()
+        for checkpoint_id in checkpoint_ids:
+            del ids[bisect_left(ids, checkpoint_id)]
+            checkpoint, metadata, parent_checkpoint_id = checkpoints.pop(checkpoint_id)
+            pruned_parents.add(parent_checkpoint_id)
+            if self.max_bytes is not None:
+                self._count(thread_id, -_sizeof(checkpoint, metadata))
+            self._release(thread_id, checkpoint_ns, checkpoint)
+            self.pruned_checkpoints += 1
+        # pending sends of a checkpoint are read from the writes of its parent
+        parents = {saved[2] for saved in checkpoints.values()}
+        for checkpoint_id in checkpoint_ids:
+            key = (thread_id, checkpoint_ns, checkpoint_id)
+            writes = self.writes.pop(key, None)
+            if not writes:
+                continue
+            if checkpoint_id in parents:
+                kept = {k: w for k, w in writes.items() if w[1] == TASKS}
+                if kept:
+                    self.writes[key] = kept
+            else:
+                kept = {}
+            if self.max_bytes is not None:
+                self._count(
+                    thread_id,
+                    -sum(_sizeof(w[2]) for k, w in writes.items() if k not in kept),
+                )
+        # drop the sends kept for pruned checkpoints whose children were pruned
+        for parent_checkpoint_id in pruned_parents:
+            if parent_checkpoint_id in checkpoints or parent_checkpoint_id in parents:
+                continue
+            writes = self.writes.pop(
+                (thread_id, checkpoint_ns, cast(str, parent_checkpoint_id)), None
+            )
+            if writes and self.max_bytes is not None:
+                self._count(thread_id, -sum(_sizeof(w[2]) for w in writes.values()))
 
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Asynchronous version of get_tuple.
@@ -440,8 +729,15 @@ class MemorySaver(
         Returns:
             RunnableConfig: The updated config containing the saved checkpoint's timestamp.
         """
+        # in the context of the caller, eg. measuring what the serde dumps
         return await asyncio.get_running_loop().run_in_executor(
-            None, self.put, config, checkpoint, metadata, new_versions
+            None,
+            copy_context().run,
+            self.put,
+            config,
+            checkpoint,
+            metadata,
+            new_versions,
         )
 
     async def aput_writes(
@@ -464,6 +760,24 @@ class MemorySaver(
             None, self.put_writes, config, writes, task_id
         )
 
+    async def aput_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Asynchronous version of put_writes_batch.
+
+        This method saves the writes of all tasks in a single call to the executor.
+
+        Args:
+            config (RunnableConfig): The config to associate with the writes.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task id and the list of writes of that task.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.put_writes_batch, config, task_writes
+        )
+
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         if current is None:
             current_v = 0
@@ -474,3 +788,34 @@ class MemorySaver(
         next_v = current_v + 1
         next_h = random.random()
         return f"{next_v:032}.{next_h:016}"
+
+
+def _sizeof(*values: tuple[str, bytes]) -> int:
+    return sum(len(v[1]) for v in values)
+
+
+def _snapshot(value: Any) -> tuple[str, bytes]:
+    """Snapshot of the value, which later changes to the value don't affect.
+
+    Values made only of builtin types are marshalled, other values pickled,
+    which both copy them at C speed. Values which can't be pickled, eg. instances
+    of local classes, are deep copied."""
+    try:
+        return "marshal", marshal.dumps(value)
+    except ValueError:
+        pass
+    try:
+        return "pickle", pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return "copy", copy.deepcopy(value)
+
+
+def _restore(snapshot: tuple[str, bytes]) -> Any:
+    """Copy of the value of a snapshot, which callers are free to change."""
+    type_, data = snapshot
+    if type_ == "marshal":
+        return marshal.loads(data)
+    elif type_ == "pickle":
+        return pickle.loads(data)
+    else:
+        return copy.deepcopy(data)
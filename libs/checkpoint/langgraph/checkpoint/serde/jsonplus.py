@@ -4,6 +4,7 @@ import importlib
 import json
 import pathlib
 import re
+import sys
 from collections import deque
 from datetime import date, datetime, time, timedelta, timezone
 from enum import Enum
@@ -25,7 +26,7 @@ from langchain_core.load.serializable import Serializable
 from zoneinfo import ZoneInfo
 
 from langgraph.checkpoint.serde.base import SerializerProtocol
-from langgraph.checkpoint.serde.types import SendProtocol
+from langgraph.checkpoint.serde.types import ListView, SendProtocol
 from langgraph.store.base import Item
 
 LC_REVIVER = Reviver()
@@ -53,7 +54,7 @@ class JsonPlusSerializer(SerializerProtocol):
             out["kwargs"] = kwargs
         return out
 
-    def _default(self, obj: Any) -> Union[str, dict[str, Any]]:
+    def _default(self, obj: Any) -> Union[str, dict[str, Any], list[Any]]:
         if isinstance(obj, Serializable):
             return cast(dict[str, Any], obj.to_json())
         elif hasattr(obj, "model_dump") and callable(obj.model_dump):
@@ -126,6 +127,15 @@ class JsonPlusSerializer(SerializerProtocol):
             return self._encode_constructor_args(
                 obj.__class__, method="fromhex", args=(obj.hex(),)
             )
+        elif _is_ndarray(obj):
+            return self._encode_constructor_args(
+                _numpy().array,
+                args=(obj.tolist(), "O" if obj.dtype.hasobject else obj.dtype.str),
+            )
+        elif _is_numpy_scalar(obj):
+            return obj.item()
+        elif isinstance(obj, ListView):
+            return obj._list()
         elif isinstance(obj, BaseException):
             return repr(obj)
         else:
@@ -188,6 +198,8 @@ class JsonPlusSerializer(SerializerProtocol):
             return "bytes", obj
         elif isinstance(obj, bytearray):
             return "bytearray", obj
+        elif _is_ndarray(obj) and not obj.dtype.hasobject:
+            return "ndarray", _ndarray_enc(obj)
         else:
             try:
                 return "msgpack", _msgpack_enc(obj)
@@ -203,6 +215,8 @@ class JsonPlusSerializer(SerializerProtocol):
             return data_
         elif type_ == "bytearray":
             return bytearray(data_)
+        elif type_ == "ndarray":
+            return _ndarray_dec(data_)
         elif type_ == "json":
             return self.loads(data_)
         elif type_ == "msgpack":
@@ -221,9 +235,10 @@ EXT_CONSTRUCTOR_KW_ARGS = 2
 EXT_METHOD_SINGLE_ARG = 3
 EXT_PYDANTIC_V1 = 4
 EXT_PYDANTIC_V2 = 5
+EXT_NUMPY_ARRAY = 6
 
 
-def _msgpack_default(obj: Any) -> Union[str, msgpack.ExtType]:
+def _msgpack_default(obj: Any) -> Union[str, list[Any], msgpack.ExtType]:
     if hasattr(obj, "model_dump") and callable(obj.model_dump):  # pydantic v2
         return msgpack.ExtType(
             EXT_PYDANTIC_V2,
@@ -428,7 +443,17 @@ def _msgpack_default(obj: Any) -> Union[str, msgpack.ExtType]:
                 ),
             ),
         )
-
+    elif _is_ndarray(obj):
+        if obj.dtype.hasobject:
+            return msgpack.ExtType(
+                EXT_CONSTRUCTOR_POS_ARGS,
+                _msgpack_enc(("numpy", "array", (obj.tolist(), "O"))),
+            )
+        return msgpack.ExtType(EXT_NUMPY_ARRAY, _ndarray_enc(obj))
+    elif _is_numpy_scalar(obj):
+        return obj.item()
+    elif isinstance(obj, ListView):
+        return obj._list()
     elif isinstance(obj, BaseException):
         return repr(obj)
     else:
@@ -488,6 +513,68 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 return cls.model_construct(**tup[2])
         except Exception:
             return
+    elif code == EXT_NUMPY_ARRAY:
+        try:
+            return _ndarray_dec(data)
+        except Exception:
+            return
+
+
+# --- numpy ---
+
+
+def _numpy() -> Any:
+    import numpy
+
+    return numpy
+
+
+def _is_ndarray(obj: Any) -> bool:
+    # numpy is only imported by the serializer to load arrays
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
+def _is_numpy_scalar(obj: Any) -> bool:
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.generic)
+
+
+# the header is padded so the buffer of an array is aligned in the payload
+ND_ALIGN = 16
+
+
+def _ndarray_enc(obj: Any) -> bytes:
+    """Encode an array as the length of its header, the header with its dtype,
+    shape and memory order, and the raw bytes of its buffer."""
+    numpy = _numpy()
+    fortran = obj.flags.f_contiguous and not obj.flags.c_contiguous
+    header = _msgpack_enc(
+        (numpy.lib.format.dtype_to_descr(obj.dtype), obj.shape, fortran)
+    )
+    offset = 4 + len(header)
+    return b"".join(
+        (
+            len(header).to_bytes(4, "little"),
+            header,
+            bytes(-offset % ND_ALIGN),
+            obj.tobytes(order="F" if fortran else "C"),
+        )
+    )
+
+
+def _ndarray_dec(data: bytes) -> Any:
+    """Decode an array encoded with `_ndarray_enc`. The array is a read-only
+    view of the buffer of `data`, which isn't copied."""
+    numpy = _numpy()
+    size = int.from_bytes(data[:4], "little")
+    descr, shape, fortran = msgpack.unpackb(data[4 : 4 + size])
+    offset = 4 + size
+    offset += -offset % ND_ALIGN
+    dtype = numpy.lib.format.descr_to_dtype(descr)
+    return numpy.frombuffer(data, dtype=dtype, offset=offset).reshape(
+        shape, order="F" if fortran else "C"
+    )
 
 
 ENC_POOL: deque[msgpack.Packer] = deque(maxlen=32)
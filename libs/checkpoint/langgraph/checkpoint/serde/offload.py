@@ -0,0 +1,207 @@
+import hashlib
+import mmap
+import os
+import tempfile
+from typing import Any, Optional, Protocol, Union
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+# type of the serialized references to offloaded values
+OFFLOAD = "offload"
+# serialization types which are decoded from a buffer without copying it whole
+BUFFER_TYPES = ("msgpack", "ndarray")
+
+
+class BlobStore(Protocol):
+    """Content-addressed store of the serialized values offloaded by
+    `OffloadSerializer`, keyed by the SHA-256 hex digest of their bytes."""
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store the data under its key, unless already stored."""
+        ...
+
+    def get(self, key: str) -> Union[bytes, memoryview, mmap.mmap]:
+        """Return the data stored under the key.
+
+        Raises KeyError if no data is stored under the key."""
+        ...
+
+
+class FilesystemBlobStore(BlobStore):
+    """Stores each value in a file named after its key, under a directory
+    named after the first two characters of the key, and reads it back as a
+    read-only memory map.
+
+    Args:
+        path: Directory of the store, created if missing.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = os.fspath(path)
+        os.makedirs(self.path, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key)
+
+    def put(self, key: str, data: bytes) -> None:
+        file = self._file(key)
+        if os.path.exists(file):
+            return
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        # write to a temporary file first, so readers never see partial values
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(file), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def get(self, key: str) -> Union[bytes, memoryview, mmap.mmap]:
+        try:
+            with open(self._file(key), "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return b""
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+
+class OffloadedValue:
+    """Reference to a value offloaded to a `BlobStore`, returned in place of the
+    value when loading channel values, until `load` is called.
+
+    The value is loaded on the first call to `load`, and kept for later calls.
+    Copies of the reference are the reference itself, as the value it loads
+    never changes, and pickling it pickles the value."""
+
+    __slots__ = ("serde", "type", "key", "_value")
+
+    def __init__(self, serde: "OffloadSerializer", type: str, key: str) -> None:
+        self.serde = serde
+        self.type = type
+        self.key = key
+        self._value: Any = _UNSET
+
+    def load(self) -> Any:
+        if self._value is _UNSET:
+            self._value = self.serde._load(self.type, self.key)
+        return self._value
+
+    def __copy__(self) -> "OffloadedValue":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "OffloadedValue":
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_identity, (self.load(),))
+
+    def __repr__(self) -> str:
+        return f"OffloadedValue({self.type!r}, {self.key!r})"
+
+
+class OffloadSerializer(SerializerProtocol):
+    """Serializer which stores the serialized values of at least `threshold`
+    bytes in a content-addressed `BlobStore`, and only a reference to them in
+    the checkpoint. Values are keyed by the hash of their bytes, so equal
+    values saved by several threads or versions are stored once.
+
+    `loads_typed` loads offloaded values, while `loads_typed_lazy`, which the
+    checkpoint savers use for channel values, returns an `OffloadedValue` in
+    their place, which is loaded when a node reads the channel.
+
+    Args:
+        store: Store of the offloaded values, eg. a `FilesystemBlobStore`.
+        serde: Serializer of the values. Defaults to `JsonPlusSerializer`.
+        threshold: Size in bytes from which serialized values are offloaded.
+            Defaults to 1 MiB.
+
+    ```python
+    from langgraph.checkpoint.memory import MemorySaver
+    from langgraph.checkpoint.serde.offload import (
+        FilesystemBlobStore,
+        OffloadSerializer,
+    )
+
+    serde = OffloadSerializer(FilesystemBlobStore("./blobs"))
+    checkpointer = MemorySaver(serde=serde)
+    ```
+    """
+
+    def __init__(
+        self,
+        store: BlobStore,
+        *,
+        serde: Optional[SerializerProtocol] = None,
+        threshold: int = 1024 * 1024,
+    ) -> None:
+        if threshold < 1:
+            raise ValueError("threshold must be at least 1")
+        self.store = store
+        self.serde = serde or JsonPlusSerializer()
+        self.threshold = threshold
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.serde.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.serde.loads(data)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        if isinstance(obj, OffloadedValue) and obj.serde.store is self.store:
+            # saved again without being loaded, eg. in a copy of a checkpoint
+            return OFFLOAD, f"{obj.type}:{obj.key}".encode()
+        elif isinstance(obj, OffloadedValue):
+            obj = obj.load()
+        type_, data = self.serde.dumps_typed(obj)
+        if len(data) < self.threshold:
+            return type_, data
+        key = hashlib.sha256(data).hexdigest()
+        self.store.put(key, data)
+        return OFFLOAD, f"{type_}:{key}".encode()
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        if data[0] == OFFLOAD:
+            type_, _, key = bytes(data[1]).decode().rpartition(":")
+            return self._load(type_, key)
+        return self.serde.loads_typed(data)
+
+    def loads_typed_lazy(self, data: tuple[str, bytes]) -> Any:
+        """Deserialize like `loads_typed`, except offloaded values, which are
+        returned as an `OffloadedValue`."""
+        if data[0] == OFFLOAD:
+            type_, _, key = bytes(data[1]).decode().rpartition(":")
+            return OffloadedValue(self, type_, key)
+        return self.serde.loads_typed(data)
+
+    def _load(self, type_: str, key: str) -> Any:
+        data = self.store.get(key)
+        if type_ not in BUFFER_TYPES:
+            data = bytes(data)
+        return self.serde.loads_typed((type_, data))  # type: ignore[arg-type]
+
+
+def loads_typed_lazy(serde: SerializerProtocol, data: tuple[str, bytes]) -> Any:
+    """Deserialize a channel value with the serializer, deferring loading
+    offloaded values if the serializer supports it, as `OffloadSerializer`
+    and serializers wrapping it do."""
+    if (lazy := getattr(serde, "loads_typed_lazy", None)) is not None:
+        return lazy(data)
+    return serde.loads_typed(data)
+
+
+def load(value: Any) -> Any:
+    """Return the value, loading it if it's an `OffloadedValue`."""
+    if type(value) is OffloadedValue:
+        return value.load()
+    return value
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+_UNSET = object()
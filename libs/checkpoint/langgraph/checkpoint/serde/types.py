@@ -1,9 +1,15 @@
+from itertools import islice
 from typing import (
     Any,
+    Callable,
+    Iterator,
+    NamedTuple,
     Optional,
     Protocol,
     Sequence,
     TypeVar,
+    Union,
+    overload,
     runtime_checkable,
 )
 
@@ -16,6 +22,7 @@ TASKS = "__pregel_tasks"
 Value = TypeVar("Value", covariant=True)
 Update = TypeVar("Update", contravariant=True)
 C = TypeVar("C")
+T = TypeVar("T")
 
 
 class ChannelProtocol(Protocol[Value, Update, C]):
@@ -48,3 +55,176 @@ class SendProtocol(Protocol):
     def __repr__(self) -> str: ...
 
     def __eq__(self, value: object) -> bool: ...
+
+
+class ListView(Sequence[T]):
+    """Read-only view of the first items of a list, for channels which only
+    ever append to their list of values, or replace it.
+
+    The view shares that list instead of copying it, and ignores values
+    appended later. Compares equal to lists and views with the same values,
+    and pickles and serializes as a list.
+    """
+
+    __slots__ = ("_values", "_len")
+
+    def __init__(self, values: list[T], length: int) -> None:
+        self._values = values
+        self._len = length
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, list[T]]:
+        if isinstance(index, slice):
+            return self._list()[index]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("list index out of range")
+        return self._values[index]
+
+    def __iter__(self) -> Iterator[T]:
+        return islice(self._values, self._len)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ListView):
+            return self._len == other._len and self._list() == other._list()
+        elif isinstance(other, list):
+            return self._len == len(other) and self._list() == other
+        else:
+            return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other: Sequence[T]) -> list[T]:
+        return [*self, *other]
+
+    def __radd__(self, other: Sequence[T]) -> list[T]:
+        return [*other, *self]
+
+    def __repr__(self) -> str:
+        return repr(self._list())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (list, (self._list(),))
+
+    def _list(self) -> list[T]:
+        if self._len == len(self._values):
+            return self._values
+        return self._values[: self._len]
+
+
+class SavedSegment(NamedTuple):
+    """Where a checkpointer saved a `ListSegment`."""
+
+    saver: Any
+    thread_id: str
+    checkpoint_ns: str
+    channel: str
+    version: str
+    prefix_versions: tuple[str, ...]
+    """Versions of the segments saved before this one, from the start of the
+    list, or none if the whole list was saved in this version."""
+
+
+class SegmentRef:
+    """Reference to a `ListSegment`, which later checkpoints of the channel
+    keep instead of the segment itself, to not keep its values alive."""
+
+    __slots__ = ("length", "saved")
+
+    def __init__(self, length: Optional[int]) -> None:
+        self.length = length
+        # set by the checkpointer once the segment is saved
+        self.saved: Optional[SavedSegment] = None
+
+
+class ListSegment(ListView[T]):
+    """Checkpoint of a list channel, eg. a list reduced with `operator.add`,
+    which was only appended to since its checkpoint `prefix`, if any.
+
+    Checkpointers which save each version of a channel value separately save
+    only the items appended since the prefix, if they saved the prefix, along
+    with the versions of the segments saved before. Other checkpointers save
+    the whole list, as for any `ListView`.
+
+    Checkpointers load lists saved this way as a `ListSegment` as well, which
+    assembles the list from its segments when first read.
+    """
+
+    __slots__ = ("ref", "prefix", "_load")
+
+    def __init__(
+        self, values: list[T], length: int, prefix: Optional[SegmentRef] = None
+    ) -> None:
+        super().__init__(values, length)
+        self.ref = SegmentRef(length)
+        self.prefix = prefix
+        self._load: Optional[Callable[[], list[T]]] = None
+
+    @classmethod
+    def load_segments(
+        cls,
+        serde: Any,
+        segments: Sequence[tuple[str, bytes]],
+        saved: SavedSegment,
+    ) -> "ListSegment":
+        """Return the list saved in the serialized segments, from the start of
+        the list, which are deserialized and joined when the list is first read."""
+
+        def load() -> list:
+            values: list = []
+            for segment in segments:
+                values.extend(serde.loads_typed(segment))
+            return values
+
+        segment = cls.__new__(cls)
+        segment.ref = SegmentRef(None)
+        segment.ref.saved = saved
+        segment.prefix = None
+        segment._load = load
+        return segment
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for the values of lists not loaded yet
+        if name in ("_values", "_len") and self._load is not None:
+            self._values = self._load()
+            self._len = self.ref.length = len(self._values)
+            self._load = None
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    def dump(
+        self,
+        saver: Any,
+        thread_id: str,
+        checkpoint_ns: str,
+        channel: str,
+        max_segments: int,
+    ) -> tuple[list[T], tuple[str, ...]]:
+        """Return the items to save for this version of the channel, and the
+        versions of the segments saved before them, from the start of the list,
+        which are none if the whole list is to be saved."""
+        if (
+            (prefix := self.prefix) is not None
+            and (saved := prefix.saved) is not None
+            and prefix.length is not None
+            and saved.saver is saver
+            and saved.thread_id == thread_id
+            and saved.checkpoint_ns == checkpoint_ns
+            and saved.channel == channel
+            and len(saved.prefix_versions) + 1 < max_segments
+            and prefix.length <= self._len
+        ):
+            return (
+                self._values[prefix.length : self._len],
+                (*saved.prefix_versions, saved.version),
+            )
+        return self._list(), ()
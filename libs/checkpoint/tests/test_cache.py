@@ -0,0 +1,54 @@
+from pytest_mock import MockerFixture
+
+from langgraph.cache.memory import InMemoryCache
+
+
+def test_in_memory_cache(mocker: MockerFixture) -> None:
+    now = mocker.patch("time.time", return_value=1000.0)
+    cache = InMemoryCache()
+
+    cache.set(
+        {
+            (("a", "b"), "k1"): ([("chan", 1)], None),
+            (("a", "b"), "k2"): ({"x": "y"}, 10),
+            (("c",), "k1"): ("value", None),
+        }
+    )
+    assert cache.get([(("a", "b"), "k1"), (("a", "b"), "k2"), (("a",), "k1")]) == {
+        (("a", "b"), "k1"): [["chan", 1]],
+        (("a", "b"), "k2"): {"x": "y"},
+    }
+
+    # expired entries are treated as missing
+    now.return_value = 1011.0
+    assert cache.get([(("a", "b"), "k1"), (("a", "b"), "k2")]) == {
+        (("a", "b"), "k1"): [["chan", 1]],
+    }
+
+    # clear a single namespace
+    cache.clear([("a", "b")])
+    assert cache.get([(("a", "b"), "k1"), (("c",), "k1")]) == {(("c",), "k1"): "value"}
+
+    # clear everything
+    cache.clear()
+    assert cache.get([(("c",), "k1")]) == {}
+
+
+def test_in_memory_cache_lru() -> None:
+    cache = InMemoryCache(maxsize=2)
+    cache.set({((), "a"): (1, None), ((), "b"): (2, None)})
+    # reading "a" makes "b" the least recently used entry
+    assert cache.get([((), "a")]) == {((), "a"): 1}
+    cache.set({((), "c"): (3, None)})
+    assert cache.get([((), "a"), ((), "b"), ((), "c")]) == {
+        ((), "a"): 1,
+        ((), "c"): 3,
+    }
+
+
+async def test_in_memory_cache_async() -> None:
+    cache = InMemoryCache()
+    await cache.aset({(("ns",), "k"): ("v", None)})
+    assert await cache.aget([(("ns",), "k")]) == {(("ns",), "k"): "v"}
+    await cache.aclear()
+    assert await cache.aget([(("ns",), "k")]) == {}
@@ -10,12 +10,14 @@ from enum import Enum
 from ipaddress import IPv4Address
 
 import dataclasses_json
+import pytest
 from pydantic import BaseModel, SecretStr
 from pydantic.v1 import BaseModel as BaseModelV1
 from pydantic.v1 import SecretStr as SecretStrV1
 from zoneinfo import ZoneInfo
 
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.serde.types import ListView
 from langgraph.store.base import Item
 
 
@@ -200,3 +202,56 @@ def test_loads_cannot_find() -> None:
     )
 
     assert serde.loads_typed(dumped) is None, "Should return None if cannot find module"
+
+
+def test_serde_jsonplus_list_view() -> None:
+    values = [1, 2, 3]
+    view = ListView(values, 2)
+    values.append(4)
+    serde = JsonPlusSerializer()
+
+    assert serde.loads_typed(serde.dumps_typed(view)) == [1, 2]
+    assert serde.loads_typed(serde.dumps_typed({"a": view})) == {"a": [1, 2]}
+    assert serde.loads(serde.dumps(view)) == [1, 2]
+
+
+def test_serde_jsonplus_numpy() -> None:
+    np = pytest.importorskip("numpy")
+    serde = JsonPlusSerializer()
+
+    arrays = [
+        np.arange(6.0).reshape(2, 3),
+        np.asfortranarray(np.arange(6, dtype="int32").reshape(2, 3)),
+        np.arange(10)[::2],
+        np.zeros((0, 4), dtype="float32"),
+        np.array(1.5),
+        np.array([(1, 2.0)], dtype=[("a", "i4"), ("b", "f8")]),
+        np.array(["2024-01-01"], dtype="datetime64[D]"),
+    ]
+    for array in arrays:
+        dumped = serde.dumps_typed(array)
+        assert dumped[0] == "ndarray"
+        loaded = serde.loads_typed(dumped)
+        assert loaded.dtype == array.dtype
+        assert loaded.shape == array.shape
+        assert np.array_equal(loaded, array)
+        # nested arrays are saved the same way
+        nested = serde.loads_typed(serde.dumps_typed({"a": [array]}))["a"][0]
+        assert nested.dtype == array.dtype
+        assert np.array_equal(nested, array)
+
+    # loaded arrays are read-only views of the saved bytes
+    dumped = serde.dumps_typed(np.arange(1000.0))
+    loaded = serde.loads_typed(dumped)
+    assert not loaded.flags.owndata
+    assert not loaded.flags.writeable
+    assert loaded.flags.aligned
+
+    # arrays of objects, numpy scalars and json
+    objects = np.array([{"a": 1}, None], dtype=object)
+    assert serde.loads_typed(serde.dumps_typed(objects)).tolist() == [{"a": 1}, None]
+    assert serde.loads_typed(serde.dumps_typed([np.int64(3), np.bool_(True)])) == [
+        3,
+        True,
+    ]
+    assert serde.loads(serde.dumps(np.arange(3))).tolist() == [0, 1, 2]
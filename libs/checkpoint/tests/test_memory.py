@@ -1,6 +1,7 @@
 from typing import Any
 
 import pytest
+from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableConfig
 
 from langgraph.checkpoint.base import (
@@ -138,3 +139,292 @@ class TestMemorySaver:
             c async for c in self.memory_saver.alist(None, filter=query_4)
         ]
         assert len(search_results_4) == 0
+
+    async def test_aput_writes_batch(self) -> None:
+        config = await self.memory_saver.aput(
+            self.config_2, self.chkpnt_2, self.metadata_2, {}
+        )
+        await self.memory_saver.aput_writes_batch(
+            config,
+            [
+                ("task-1", [("foo", 1), ("bar", 2)]),
+                ("task-2", [("foo", 3)]),
+            ],
+        )
+
+        checkpoint_tuple = await self.memory_saver.aget_tuple(config)
+        assert checkpoint_tuple is not None
+        assert checkpoint_tuple.pending_writes == [
+            ("task-1", "foo", 1),
+            ("task-1", "bar", 2),
+            ("task-2", "foo", 3),
+        ]
+
+
+def _put_chain(
+    saver: MemorySaver, thread_id: str, count: int, checkpoint_ns: str = ""
+) -> list[RunnableConfig]:
+    config: RunnableConfig = {
+        "configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns}
+    }
+    checkpoint = empty_checkpoint()
+    configs = []
+    for step in range(count):
+        checkpoint = create_checkpoint(checkpoint, {}, step)
+        config = saver.put(config, checkpoint, {"step": step}, {})
+        config["configurable"]["checkpoint_ns"] = checkpoint_ns
+        configs.append(config)
+    return configs
+
+
+def test_memory_saver_max_checkpoints() -> None:
+    saver = MemorySaver(max_checkpoints=2)
+    configs = _put_chain(saver, "thread-1", 3)
+    saver.put_writes(configs[2], [("foo", 1)], "task-1")
+    _put_chain(saver, "thread-1", 1, "inner")
+    saver.put_writes(configs[0], [("foo", 2)], "task-2")
+    _put_chain(saver, "thread-1", 1)
+
+    # the oldest checkpoints of the namespace are dropped, with their writes
+    assert len(saver.storage["thread-1"][""]) == 2
+    assert saver.get_tuple(configs[0]) is None
+    assert saver.get_tuple(configs[1]) is None
+    assert saver.get_tuple(configs[2]) is not None
+    # and writes to dropped checkpoints are ignored
+    assert saver.writes.keys() == {
+        ("thread-1", "", configs[2]["configurable"]["checkpoint_id"])
+    }
+    assert saver.pruned_checkpoints == 2
+    # other namespaces are capped separately
+    assert len(saver.storage["thread-1"]["inner"]) == 1
+
+
+def test_memory_saver_max_checkpoints_keeps_sends() -> None:
+    saver = MemorySaver(max_checkpoints=1)
+    first = _put_chain(saver, "thread-1", 1)[0]
+    saver.put_writes(first, [("__pregel_tasks", "send"), ("foo", 1)], "task-1")
+    checkpoint = create_checkpoint(empty_checkpoint(), {}, 1)
+    second = saver.put(first, checkpoint, {}, {})
+
+    assert saver.get_tuple(first) is None
+    # sends of the parent are still read by its child
+    saved = saver.get_tuple(second)
+    assert saved is not None
+    assert saved.checkpoint["pending_sends"] == ["send"]
+    assert list(
+        saver.writes[("thread-1", "", first["configurable"]["checkpoint_id"])].values()
+    ) == [("task-1", "__pregel_tasks", saver.serde.dumps_typed("send"))]
+
+
+def test_memory_saver_max_checkpoints_drops_sends_of_pruned() -> None:
+    saver = MemorySaver(max_checkpoints=2, max_bytes=10**9)
+    config = _put_chain(saver, "thread-1", 1)[0]
+    checkpoint = empty_checkpoint()
+    for step in range(20):
+        saver.put_writes(config, [("__pregel_tasks", f"send-{step}")], "task-1")
+        checkpoint = create_checkpoint(checkpoint, {}, step)
+        config = saver.put(config, checkpoint, {}, {})
+
+    # of the pruned checkpoints, only the sends of the parent of the oldest
+    # checkpoint kept are retained
+    assert len(saver.storage["thread-1"][""]) == 2
+    assert len(saver.writes) == 2
+    saver.put_writes(config, [("__pregel_tasks", "send-20")], "task-1")
+    assert len(saver.writes) == 3
+    assert saver._bytes == sum(
+        sum(len(value[1]) for value in saved[:2])
+        for saved in saver.storage["thread-1"][""].values()
+    ) + sum(len(w[2][1]) for writes in saver.writes.values() for w in writes.values())
+
+
+def test_memory_saver_max_threads_drops_sends_of_pruned() -> None:
+    saver = MemorySaver(max_checkpoints=1, max_threads=1)
+    config = _put_chain(saver, "thread-1", 1)[0]
+    for step in range(5):
+        saver.put_writes(config, [("__pregel_tasks", f"send-{step}")], "task-1")
+        checkpoint = create_checkpoint(empty_checkpoint(), {}, step)
+        config = saver.put(config, checkpoint, {}, {})
+    _put_chain(saver, "thread-2", 1)
+
+    assert set(saver.storage) == {"thread-2"}
+    assert all(key[0] != "thread-1" for key in saver.writes)
+
+
+def test_memory_saver_max_threads() -> None:
+    saver = MemorySaver(max_threads=2)
+    one = _put_chain(saver, "thread-1", 2)
+    _put_chain(saver, "thread-2", 2)
+    saver.put_writes(one[-1], [("foo", 1)], "task-1")
+    # reading thread-1 makes thread-2 the least recently used
+    assert saver.get_tuple({"configurable": {"thread_id": "thread-1"}}) is not None
+    _put_chain(saver, "thread-3", 1)
+
+    assert set(saver.storage) == {"thread-1", "thread-3"}
+    assert all(key[0] != "thread-2" for key in saver.writes)
+    assert saver.evicted_threads == 1
+    assert saver.pruned_checkpoints == 0
+
+
+def test_memory_saver_max_bytes() -> None:
+    saver = MemorySaver()
+    _put_chain(saver, "thread-1", 1)
+    size = sum(
+        len(checkpoint[1]) + len(metadata[1])
+        for checkpoint, metadata, _ in saver.storage["thread-1"][""].values()
+    )
+
+    saver = MemorySaver(max_bytes=int(size * 3.5))
+    _put_chain(saver, "thread-1", 2)
+    _put_chain(saver, "thread-2", 1)
+    assert saver.evicted_threads == 0
+    # the least recently used thread is dropped first
+    _put_chain(saver, "thread-2", 1)
+    assert set(saver.storage) == {"thread-2"}
+    assert saver.evicted_threads == 1
+    # then the oldest checkpoints of the thread written, keeping the latest
+    configs = _put_chain(saver, "thread-2", 3)
+    assert len(saver.storage["thread-2"][""]) == 3
+    assert saver.pruned_checkpoints == 2
+    assert saver.get_tuple(configs[-1]) is not None
+    assert saver._bytes <= saver.max_bytes
+
+    saver = MemorySaver(max_bytes=1)
+    configs = _put_chain(saver, "thread-1", 3)
+    assert saver.storage["thread-1"][""].keys() == {
+        configs[-1]["configurable"]["checkpoint_id"]
+    }
+
+
+def test_memory_saver_history_index() -> None:
+    saver = MemorySaver()
+    configs = _put_chain(saver, "thread-1", 10)
+    ids = [c["configurable"]["checkpoint_id"] for c in configs]
+    thread: RunnableConfig = {"configurable": {"thread_id": "thread-1"}}
+
+    latest = saver.get_tuple(thread)
+    assert latest is not None
+    assert latest.config["configurable"]["checkpoint_id"] == ids[-1]
+    assert [c.config["configurable"]["checkpoint_id"] for c in saver.list(thread)] == (
+        ids[::-1]
+    )
+    assert [
+        c.config["configurable"]["checkpoint_id"]
+        for c in saver.list(thread, before=configs[5], limit=3)
+    ] == [ids[4], ids[3], ids[2]]
+    assert [
+        c.config["configurable"]["checkpoint_id"]
+        for c in saver.list(thread, filter={"step": 1})
+    ] == [ids[1]]
+    assert [
+        c.config["configurable"]["checkpoint_id"] for c in saver.list(configs[3])
+    ] == [ids[3]]
+
+    # checkpoints saved out of order, or directly in storage, are indexed too
+    saver.put(configs[0], {**empty_checkpoint(), "id": ids[2] + "0"}, {}, {})
+    saver.storage["thread-1"][""]["0"] = saver.storage["thread-1"][""][ids[0]]
+    assert [
+        c.config["configurable"]["checkpoint_id"]
+        for c in saver.list(thread, before=configs[4])
+    ] == [ids[3], ids[2] + "0", ids[2], ids[1], ids[0], "0"]
+
+
+def test_memory_saver_snapshots() -> None:
+    class Local:
+        def __init__(self, items: list) -> None:
+            self.items = items
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, Local) and other.items == self.items
+
+    saver = MemorySaver(snapshots=True)
+    config: RunnableConfig = {"configurable": {"thread_id": "1", "checkpoint_ns": ""}}
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {
+        "builtin": {"a": [1, 2], "b": (3, "4")},
+        "object": Local([1]),
+        "message": HumanMessage("hi", id="1"),
+    }
+    checkpoint["channel_versions"] = {"builtin": 1, "object": 1, "message": 1}
+    first = saver.put(config, checkpoint, {"step": 0}, {})
+    saver.put_writes(first, [("builtin", {"c": [5]})], "task-1")
+
+    # changes to saved values don't change the checkpoint
+    checkpoint["channel_values"]["builtin"]["a"].append(3)
+    checkpoint["channel_values"]["object"].items.append(2)
+    saved = saver.get_tuple(first)
+    assert saved is not None
+    assert saved.checkpoint["channel_values"] == {
+        "builtin": {"a": [1, 2], "b": (3, "4")},
+        "object": Local([1]),
+        "message": HumanMessage("hi", id="1"),
+    }
+    assert saved.pending_writes == [("task-1", "builtin", {"c": [5]})]
+    # nor do changes to values read
+    saved.checkpoint["channel_values"]["builtin"]["a"].append(4)
+    assert saver.get_tuple(first).checkpoint["channel_values"]["builtin"] == {
+        "a": [1, 2],
+        "b": (3, "4"),
+    }
+
+    # values of channels which weren't updated are only stored once
+    child = create_checkpoint(checkpoint, None, 1)
+    child["channel_values"] = {**checkpoint["channel_values"], "message": "bye"}
+    child["channel_versions"] = {"builtin": 1, "object": 1, "message": 2}
+    second = saver.put(first, child, {"step": 1}, {"message": 2})
+    assert set(saver.blobs["1"]) == {
+        ("", "builtin", 1),
+        ("", "object", 1),
+        ("", "message", 1),
+        ("", "message", 2),
+    }
+    assert saver.get_tuple(second).checkpoint["channel_values"] == {
+        "builtin": {"a": [1, 2], "b": (3, "4")},
+        "object": Local([1]),
+        "message": "bye",
+    }
+
+    with pytest.raises(ValueError):
+        MemorySaver(snapshots=True, max_bytes=1000)
+
+
+def test_memory_saver_channel_blobs() -> None:
+    saver = MemorySaver(max_checkpoints=2)
+    config: RunnableConfig = {"configurable": {"thread_id": "1", "checkpoint_ns": ""}}
+    checkpoint = empty_checkpoint()
+    configs = []
+    for step, (key, value) in enumerate([("a", 1), ("b", 2), ("a", 3)]):
+        checkpoint = create_checkpoint(checkpoint, None, step)
+        checkpoint["channel_values"] = {**checkpoint["channel_values"], key: value}
+        version = saver.get_next_version(checkpoint["channel_versions"].get(key), None)
+        checkpoint["channel_versions"] = {
+            **checkpoint["channel_versions"],
+            key: version,
+        }
+        config = saver.put(config, checkpoint, {}, {key: version})
+        config["configurable"]["checkpoint_ns"] = ""
+        configs.append(config)
+
+    # each checkpoint is assembled from the values of its channel versions
+    saved = saver.get_tuple(configs[-1])
+    assert saved is not None
+    assert saved.checkpoint["channel_values"] == {"a": 3, "b": 2}
+    saved = saver.get_tuple(configs[1])
+    assert saved is not None
+    assert saved.checkpoint["channel_values"] == {"a": 1, "b": 2}
+    # values only used by dropped checkpoints are dropped with them
+    assert saver.get_tuple(configs[0]) is None
+    assert len(saver.blobs["1"]) == 3
+    _put_chain(saver, "1", 2)
+    assert len(saver.blobs["1"]) == 0
+
+    # checkpoints stored with their values are read as is
+    saver.storage["2"][""]["1"] = (
+        saver.serde.dumps_typed(
+            {**empty_checkpoint(), "id": "1", "channel_values": {"a": 1}}
+        ),
+        saver.serde.dumps_typed({}),
+        None,
+    )
+    saved = saver.get_tuple({"configurable": {"thread_id": "2"}})
+    assert saved is not None
+    assert saved.checkpoint["channel_values"] == {"a": 1}
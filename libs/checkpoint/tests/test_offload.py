@@ -0,0 +1,79 @@
+import copy
+import mmap
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import create_checkpoint, empty_checkpoint
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.offload import (
+    FilesystemBlobStore,
+    OffloadedValue,
+    OffloadSerializer,
+)
+
+
+def test_filesystem_blob_store(tmp_path: Path) -> None:
+    store = FilesystemBlobStore(tmp_path / "blobs")
+    store.put("abcd", b"data")
+    store.put("abcd", b"ignored")
+
+    data = store.get("abcd")
+    assert isinstance(data, mmap.mmap)
+    assert bytes(data) == b"data"
+    assert [p.name for p in (tmp_path / "blobs").rglob("*") if p.is_file()] == ["abcd"]
+    with pytest.raises(KeyError):
+        store.get("efgh")
+
+
+def test_offload_serializer(tmp_path: Path) -> None:
+    store = FilesystemBlobStore(tmp_path)
+    serde = OffloadSerializer(store, threshold=100)
+
+    # small values are kept inline
+    assert serde.dumps_typed("small") == serde.serde.dumps_typed("small")
+
+    # large values are stored once, under the hash of their bytes
+    large = {"text": "x" * 1000}
+    dumped = serde.dumps_typed(large)
+    assert dumped[0] == "offload"
+    assert serde.dumps_typed({"text": "x" * 1000}) == dumped
+    assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+    assert serde.loads_typed(dumped) == large
+
+    # lazy loads return a reference, loaded once
+    lazy = serde.loads_typed_lazy(dumped)
+    assert isinstance(lazy, OffloadedValue)
+    assert lazy.load() == large
+    assert lazy.load() is lazy.load()
+    assert copy.deepcopy(lazy) is lazy
+    assert pickle.loads(pickle.dumps(lazy)) == large
+    # saving the reference again doesn't load it
+    assert serde.dumps_typed(serde.loads_typed_lazy(dumped)) == dumped
+
+    # arrays are read from the memory map without copying
+    array = np.arange(1000, dtype=np.int64)
+    loaded = serde.loads_typed(serde.dumps_typed(array))
+    assert np.array_equal(loaded, array)
+    assert not loaded.flags.writeable
+
+
+def test_memory_saver_offload(tmp_path: Path) -> None:
+    saver = MemorySaver(
+        serde=OffloadSerializer(FilesystemBlobStore(tmp_path), threshold=100)
+    )
+    config: RunnableConfig = {"configurable": {"thread_id": "1", "checkpoint_ns": ""}}
+    checkpoint = create_checkpoint(empty_checkpoint(), None, 1)
+    checkpoint["channel_values"] = {"doc": "x" * 1000, "small": 1}
+    checkpoint["channel_versions"] = {"doc": 1, "small": 1}
+    config = saver.put(config, checkpoint, {}, {"doc": 1, "small": 1})
+
+    saved = saver.get_tuple(config)
+    assert saved is not None
+    values = saved.checkpoint["channel_values"]
+    assert values["small"] == 1
+    assert isinstance(values["doc"], OffloadedValue)
+    assert values["doc"].load() == "x" * 1000
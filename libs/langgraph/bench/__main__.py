@@ -6,8 +6,13 @@ from pyperf._runner import Runner
 from uvloop import new_event_loop
 
 from bench.fanout_to_subgraph import fanout_to_subgraph, fanout_to_subgraph_sync
+from bench.long_thread import aresume, long_thread, resume
+from bench.pipeline import pipeline
+from bench.pydantic_state import pydantic_state
 from bench.react_agent import react_agent
-from bench.wide_state import wide_state
+from bench.topic_log import topic_log
+from bench.wide_graph import wide_graph
+from bench.wide_state import wide_state, wide_state_writes
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.pregel import Pregel
 
@@ -63,6 +68,16 @@ benchmarks = (
             ]
         },
     ),
+    (
+        "fanout_to_subgraph_10x_checkpoint_snapshots",
+        fanout_to_subgraph().compile(checkpointer=MemorySaver(snapshots=True)),
+        fanout_to_subgraph_sync().compile(checkpointer=MemorySaver(snapshots=True)),
+        {
+            "subjects": [
+                random.choices("abcdefghijklmnopqrstuvwxyz", k=1000) for _ in range(10)
+            ]
+        },
+    ),
     (
         "fanout_to_subgraph_100x",
         fanout_to_subgraph().compile(checkpointer=None),
@@ -83,6 +98,16 @@ benchmarks = (
             ]
         },
     ),
+    (
+        "fanout_to_subgraph_100x_checkpoint_snapshots",
+        fanout_to_subgraph().compile(checkpointer=MemorySaver(snapshots=True)),
+        fanout_to_subgraph_sync().compile(checkpointer=MemorySaver(snapshots=True)),
+        {
+            "subjects": [
+                random.choices("abcdefghijklmnopqrstuvwxyz", k=1000) for _ in range(100)
+            ]
+        },
+    ),
     (
         "react_agent_10x",
         react_agent(10, checkpointer=None),
@@ -95,6 +120,12 @@ benchmarks = (
         react_agent(10, checkpointer=MemorySaver()),
         {"messages": [HumanMessage("hi?")]},
     ),
+    (
+        "react_agent_10x_checkpoint_snapshots",
+        react_agent(10, checkpointer=MemorySaver(snapshots=True)),
+        react_agent(10, checkpointer=MemorySaver(snapshots=True)),
+        {"messages": [HumanMessage("hi?")]},
+    ),
     (
         "react_agent_100x",
         react_agent(100, checkpointer=None),
@@ -107,6 +138,12 @@ benchmarks = (
         react_agent(100, checkpointer=MemorySaver()),
         {"messages": [HumanMessage("hi?")]},
     ),
+    (
+        "react_agent_100x_checkpoint_snapshots",
+        react_agent(100, checkpointer=MemorySaver(snapshots=True)),
+        react_agent(100, checkpointer=MemorySaver(snapshots=True)),
+        {"messages": [HumanMessage("hi?")]},
+    ),
     (
         "wide_state_25x300",
         wide_state(300).compile(checkpointer=None),
@@ -139,6 +176,22 @@ benchmarks = (
             ]
         },
     ),
+    (
+        "wide_state_25x300_checkpoint_snapshots",
+        wide_state(300).compile(checkpointer=MemorySaver(snapshots=True)),
+        wide_state(300).compile(checkpointer=MemorySaver(snapshots=True)),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(5)
+                    }
+                    for i in range(5)
+                }
+            ]
+        },
+    ),
     (
         "wide_state_15x600",
         wide_state(600).compile(checkpointer=None),
@@ -171,6 +224,22 @@ benchmarks = (
             ]
         },
     ),
+    (
+        "wide_state_15x600_checkpoint_snapshots",
+        wide_state(600).compile(checkpointer=MemorySaver(snapshots=True)),
+        wide_state(600).compile(checkpointer=MemorySaver(snapshots=True)),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(5)
+                    }
+                    for i in range(3)
+                }
+            ]
+        },
+    ),
     (
         "wide_state_9x1200",
         wide_state(1200).compile(checkpointer=None),
@@ -203,6 +272,180 @@ benchmarks = (
             ]
         },
     ),
+    (
+        "wide_state_9x1200_checkpoint_snapshots",
+        wide_state(1200).compile(checkpointer=MemorySaver(snapshots=True)),
+        wide_state(1200).compile(checkpointer=MemorySaver(snapshots=True)),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(3)
+                    }
+                    for i in range(3)
+                }
+            ]
+        },
+    ),
+    (
+        "wide_state_9x300_100fields",
+        wide_state(300, extra_fields=100).compile(checkpointer=None),
+        wide_state(300, extra_fields=100).compile(checkpointer=None),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(3)
+                    }
+                    for i in range(3)
+                }
+            ]
+        },
+    ),
+    (
+        "wide_state_9x300_100fields_checkpoint",
+        wide_state(300, extra_fields=100).compile(checkpointer=MemorySaver()),
+        wide_state(300, extra_fields=100).compile(checkpointer=MemorySaver()),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(3)
+                    }
+                    for i in range(3)
+                }
+            ]
+        },
+    ),
+    (
+        "wide_state_9x300_500fields",
+        wide_state(300, extra_fields=500).compile(checkpointer=None),
+        wide_state(300, extra_fields=500).compile(checkpointer=None),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(3)
+                    }
+                    for i in range(3)
+                }
+            ]
+        },
+    ),
+    (
+        "wide_state_9x300_500fields_checkpoint",
+        wide_state(300, extra_fields=500).compile(checkpointer=MemorySaver()),
+        wide_state(300, extra_fields=500).compile(checkpointer=MemorySaver()),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(3)
+                    }
+                    for i in range(3)
+                }
+            ]
+        },
+    ),
+    (
+        "wide_state_writes_1000x200fields",
+        wide_state_writes(1000, 200).compile(checkpointer=None),
+        wide_state_writes(1000, 200).compile(checkpointer=None),
+        {"count": 0},
+    ),
+    (
+        "wide_state_writes_1000x200fields_checkpoint",
+        wide_state_writes(1000, 200).compile(checkpointer=MemorySaver()),
+        wide_state_writes(1000, 200).compile(checkpointer=MemorySaver()),
+        {"count": 0},
+    ),
+    (
+        "wide_state_writes_1000x200fields_lazy",
+        wide_state_writes(1000, 200, lazy=True).compile(checkpointer=None),
+        wide_state_writes(1000, 200, lazy=True).compile(checkpointer=None),
+        {"count": 0},
+    ),
+    (
+        "wide_state_9x1200_trusted",
+        wide_state(1200).compile(checkpointer=None, trusted_state=True),
+        wide_state(1200).compile(checkpointer=None, trusted_state=True),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(3)
+                    }
+                    for i in range(3)
+                }
+            ]
+        },
+    ),
+    (
+        "pydantic_state_300x100fields",
+        pydantic_state(300, 100).compile(checkpointer=None),
+        pydantic_state(300, 100).compile(checkpointer=None),
+        {f"item_{i}": {"id": i, "tags": ["a"] * 10} for i in range(100)},
+    ),
+    (
+        "pydantic_state_300x100fields_trusted",
+        pydantic_state(300, 100).compile(checkpointer=None, trusted_state=True),
+        pydantic_state(300, 100).compile(checkpointer=None, trusted_state=True),
+        {f"item_{i}": {"id": i, "tags": ["a"] * 10} for i in range(100)},
+    ),
+    (
+        "pipeline_100",
+        pipeline(100).compile(checkpointer=None),
+        pipeline(100).compile(checkpointer=None),
+        {"text": "", "steps": []},
+    ),
+    (
+        "pipeline_100_checkpoint",
+        pipeline(100).compile(checkpointer=MemorySaver()),
+        pipeline(100).compile(checkpointer=MemorySaver()),
+        {"text": "", "steps": []},
+    ),
+    (
+        "pipeline_100_fused",
+        pipeline(100).compile(checkpointer=None, fuse_nodes=True),
+        pipeline(100).compile(checkpointer=None, fuse_nodes=True),
+        {"text": "", "steps": []},
+    ),
+    (
+        "pipeline_100_fused_checkpoint",
+        pipeline(100).compile(checkpointer=MemorySaver(), fuse_nodes=True),
+        pipeline(100).compile(checkpointer=MemorySaver(), fuse_nodes=True),
+        {"text": "", "steps": []},
+    ),
+    (
+        "wide_graph_200",
+        wide_graph(200).compile(checkpointer=None),
+        wide_graph(200).compile(checkpointer=None),
+        {"count": 0},
+    ),
+    (
+        "wide_graph_200_checkpoint",
+        wide_graph(200).compile(checkpointer=MemorySaver()),
+        wide_graph(200).compile(checkpointer=MemorySaver()),
+        {"count": 0},
+    ),
+    (
+        "wide_graph_1000",
+        wide_graph(1000).compile(checkpointer=None),
+        wide_graph(1000).compile(checkpointer=None),
+        {"count": 0},
+    ),
+    (
+        "topic_log_2000",
+        topic_log(2000).compile(checkpointer=None),
+        topic_log(2000).compile(checkpointer=None),
+        {"count": 0},
+    ),
 )
 
 
@@ -212,3 +455,8 @@ for name, agraph, graph, input in benchmarks:
     r.bench_async_func(name, arun, agraph, input, loop_factory=new_event_loop)
     if graph is not None:
         r.bench_func(name + "_sync", run, graph, input)
+
+r.bench_async_func(
+    "long_thread_10000", aresume, *long_thread(10000), loop_factory=new_event_loop
+)
+r.bench_func("long_thread_10000_sync", resume, *long_thread(10000))
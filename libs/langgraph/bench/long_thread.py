@@ -0,0 +1,78 @@
+from typing import TypedDict, cast
+from uuid import uuid4
+
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    CheckpointTuple,
+    create_checkpoint,
+    empty_checkpoint,
+)
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.constants import END, START
+from langgraph.graph.state import CompiledStateGraph, StateGraph
+
+
+class State(TypedDict):
+    count: int
+
+
+def long_thread(n: int) -> tuple[CompiledStateGraph, RunnableConfig]:
+    """A graph with a thread which already has a history of n checkpoints,
+    used to measure the cost of resuming and reading the history of long
+    threads."""
+
+    def step(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    builder = StateGraph(State)
+    builder.add_node("step", step)
+    builder.add_edge(START, "step")
+    builder.add_edge("step", END)
+
+    checkpointer = MemorySaver()
+    graph = builder.compile(checkpointer=checkpointer)
+    config: RunnableConfig = {
+        "configurable": {"thread_id": str(uuid4()), "checkpoint_ns": ""}
+    }
+    checkpoint = empty_checkpoint()
+    version = None
+    for i in range(n):
+        version = checkpointer.get_next_version(version, None)
+        checkpoint = create_checkpoint(checkpoint, None, i)
+        checkpoint["channel_values"] = {"count": i}
+        checkpoint["channel_versions"] = {"count": version}
+        config = checkpointer.put(
+            config, checkpoint, {"source": "loop", "step": i, "writes": None}, {}
+        )
+        config["configurable"]["checkpoint_ns"] = ""
+    return graph, {"configurable": {"thread_id": config["configurable"]["thread_id"]}}
+
+
+def resume(graph: CompiledStateGraph, config: RunnableConfig) -> None:
+    """Run the graph on the thread, then page through its latest history."""
+    checkpointer = cast(BaseCheckpointSaver, graph.checkpointer)
+    graph.invoke({"count": 0}, config)
+    latest = cast(CheckpointTuple, checkpointer.get_tuple(config))
+    page = [*checkpointer.list(config, before=latest.config, limit=10)]
+    [*checkpointer.list(config, before=page[-1].config, limit=10)]
+
+
+async def aresume(graph: CompiledStateGraph, config: RunnableConfig) -> None:
+    """Run the graph on the thread, then page through its latest history."""
+    checkpointer = cast(BaseCheckpointSaver, graph.checkpointer)
+    await graph.ainvoke({"count": 0}, config)
+    latest = cast(CheckpointTuple, await checkpointer.aget_tuple(config))
+    page = [c async for c in checkpointer.alist(config, before=latest.config, limit=10)]
+    [c async for c in checkpointer.alist(config, before=page[-1].config, limit=10)]
+
+
+if __name__ == "__main__":
+    import time
+
+    graph, config = long_thread(10000)
+    start = time.perf_counter()
+    for _ in range(100):
+        resume(graph, config)
+    print(f"{(time.perf_counter() - start) * 10:.2f}ms per resume")
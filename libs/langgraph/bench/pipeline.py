@@ -0,0 +1,33 @@
+import operator
+from typing import Annotated
+
+from typing_extensions import TypedDict
+
+from langgraph.constants import END, START
+from langgraph.graph.state import StateGraph
+
+
+class State(TypedDict):
+    text: str
+    steps: Annotated[list[str], operator.add]
+
+
+def pipeline(n: int) -> StateGraph:
+    """Graph with a chain of n nodes connected by edges, each updating the
+    state, to measure the cost of running one step per node."""
+
+    def step(i: int):  # type: ignore[no-untyped-def]
+        def node(state: State) -> dict:
+            return {"text": state["text"][-100:] + str(i), "steps": [str(i)]}
+
+        return node
+
+    builder = StateGraph(State)
+    for i in range(n):
+        builder.add_node(f"step_{i}", step(i))
+    builder.add_edge(START, "step_0")
+    for i in range(1, n):
+        builder.add_edge(f"step_{i - 1}", f"step_{i}")
+    builder.add_edge(f"step_{n - 1}", END)
+
+    return builder
@@ -0,0 +1,36 @@
+import operator
+from typing import Annotated, Optional
+
+from pydantic import BaseModel, create_model
+
+from langgraph.constants import END, START
+from langgraph.graph.state import StateGraph
+
+
+class Item(BaseModel):
+    id: int
+    tags: list[str] = []
+
+
+def pydantic_state(n: int, fields: int) -> StateGraph:
+    """Graph looping over a single node n times, with a pydantic state of `fields`
+    nested models, to measure the cost of building the node input from the state."""
+
+    State = create_model(  # type: ignore[call-overload]
+        "State",
+        count=(int, 0),
+        seen=(Annotated[list[int], operator.add], []),
+        **{f"item_{i}": (Optional[Item], None) for i in range(fields)},
+    )
+
+    def increment(state: State) -> dict:
+        return {"count": state.count + 1, "seen": [state.count]}
+
+    builder = StateGraph(State)
+    builder.add_node("increment", increment)
+    builder.add_edge(START, "increment")
+    builder.add_conditional_edges(
+        "increment", lambda state: END if state.count >= n else "increment"
+    )
+
+    return builder
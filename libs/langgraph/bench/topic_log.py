@@ -0,0 +1,31 @@
+from typing import Annotated, Sequence
+
+from typing_extensions import TypedDict
+
+from langgraph.channels.topic import Topic
+from langgraph.constants import END, START
+from langgraph.graph.state import StateGraph
+
+
+class State(TypedDict):
+    count: int
+    log: Annotated[Sequence[str], Topic(str, accumulate=True)]
+
+
+def topic_log(n: int) -> StateGraph:
+    """Graph with a node which runs n times, appending to an accumulating topic
+    each time, to measure the cost of updating and checkpointing a topic which
+    grows by one value per step."""
+
+    def step(state: State) -> dict:
+        return {"count": state["count"] + 1, "log": f"step {state['count']}"}
+
+    def route(state: State) -> str:
+        return "step" if state["count"] < n else END
+
+    builder = StateGraph(State)
+    builder.add_node("step", step)
+    builder.add_edge(START, "step")
+    builder.add_conditional_edges("step", route)
+
+    return builder
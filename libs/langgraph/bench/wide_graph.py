@@ -0,0 +1,42 @@
+from typing import TypedDict
+
+from langgraph.constants import END, START
+from langgraph.graph.state import StateGraph
+
+
+def wide_graph(n: int) -> StateGraph:
+    """A graph with many nodes where only one node is triggered per step,
+    used to measure the cost of selecting the next tasks in wide graphs."""
+
+    class State(TypedDict):
+        count: int
+
+    def step(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    builder = StateGraph(State)
+    for i in range(n):
+        builder.add_node(f"node_{i}", step)
+        builder.add_edge(f"node_{i - 1}" if i else START, f"node_{i}")
+    builder.add_edge(f"node_{n - 1}", END)
+
+    return builder
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    import uvloop
+
+    from langgraph.checkpoint.memory import MemorySaver
+
+    graph = wide_graph(1000).compile(checkpointer=MemorySaver())
+    input = {"count": 0}
+    config = {"configurable": {"thread_id": "1"}, "recursion_limit": 20000000000}
+
+    async def run():
+        async for c in graph.astream(input, config=config):
+            print(c.keys())
+
+    uvloop.install()
+    asyncio.run(run())
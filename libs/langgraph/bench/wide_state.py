@@ -1,15 +1,19 @@
 import operator
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, make_dataclass
 from functools import partial
-from typing import Annotated, Optional, Sequence
+from typing import Annotated, Optional, Sequence, TypedDict
 
 from langgraph.constants import END, START
 from langgraph.graph.state import StateGraph
 
 
-def wide_state(n: int) -> StateGraph:
+def wide_state(n: int, extra_fields: int = 0) -> StateGraph:
+    """Graph looping over 6 nodes n times, with a state of 15 fields plus
+    `extra_fields` reducer fields that are never written to, to measure
+    per-step overhead as the number of fields grows."""
+
     @dataclass(kw_only=True)
-    class State:
+    class BaseState:
         messages: Annotated[list, operator.add] = field(default_factory=list)
         trigger_events: Annotated[list, operator.add] = field(default_factory=list)
         """The external events that are converted by the graph."""
@@ -49,6 +53,16 @@ def wide_state(n: int) -> StateGraph:
         """The ID of the bot user in the slack channel."""
         notified_assignees: Annotated[dict, operator.or_] = field(default_factory=dict)
 
+    State = make_dataclass(
+        "State",
+        [
+            (f"extra_{i}", Annotated[list, operator.add], field(default_factory=list))
+            for i in range(extra_fields)
+        ],
+        bases=(BaseState,),
+        kw_only=True,
+    )
+
     def read_write(read: str, write: Sequence[str], input: State) -> dict:
         val = getattr(input, read)
         val_single = val[-1] if isinstance(val, list) else val
@@ -111,6 +125,28 @@ def wide_state(n: int) -> StateGraph:
     return builder
 
 
+def wide_state_writes(n: int, fields: int, lazy: bool = False) -> StateGraph:
+    """Graph looping over a single node n times, which updates 1 of `fields`
+    state keys, to measure per-node write overhead as the number of fields grows.
+    With `lazy`, the node reads only that key, instead of receiving all of them."""
+
+    State = TypedDict(  # type: ignore[misc]
+        "State", {"count": int, **{f"field_{i}": str for i in range(fields)}}
+    )
+
+    def increment(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    builder = StateGraph(State)
+    builder.add_node("increment", increment, lazy=lazy)
+    builder.add_edge(START, "increment")
+    builder.add_conditional_edges(
+        "increment", lambda state: END if state["count"] >= n else "increment"
+    )
+
+    return builder
+
+
 if __name__ == "__main__":
     import asyncio
 
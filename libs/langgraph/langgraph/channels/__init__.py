@@ -1,4 +1,5 @@
 from langgraph.channels.any_value import AnyValue
+from langgraph.channels.array import ArrayAggregate
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
 from langgraph.channels.ephemeral_value import EphemeralValue
@@ -14,4 +15,5 @@ __all__ = [
     "UntrackedValue",
     "EphemeralValue",
     "AnyValue",
+    "ArrayAggregate",
 ]
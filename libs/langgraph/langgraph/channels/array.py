@@ -0,0 +1,170 @@
+import sys
+from typing import Any, Literal, Optional, Sequence, Type
+
+from typing_extensions import Self
+
+from langgraph.channels.base import BaseChannel
+from langgraph.channels.binop import _strip_extras
+from langgraph.errors import EmptyChannelError, InvalidUpdateError
+
+ArrayReducer = Literal["sum", "max", "min", "concat"]
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "ArrayAggregate requires numpy, install it with `pip install numpy`"
+        ) from None
+    return numpy
+
+
+def _is_array_type(typ: Any) -> bool:
+    """Whether the type is a NumPy array, without importing numpy."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and _strip_extras(typ) is numpy.ndarray
+
+
+class ArrayAggregate(BaseChannel[Any, Any, Any]):
+    """Accumulates NumPy arrays in place, without allocating a new array for
+    each update.
+
+    Reducers:
+        - `sum`, `max` and `min` combine each update with the value elementwise,
+        as `numpy.add`, `numpy.maximum` and `numpy.minimum` do.
+        - `concat` appends the updates along the first axis, as
+        `numpy.concatenate` does. Updates with one dimension less than the value
+        are appended as a single row.
+
+    ```python
+    import numpy as np
+
+    scores = ArrayAggregate(np.ndarray, "sum")
+    embeddings = ArrayAggregate(np.ndarray, "concat")
+    ```
+
+    State keys annotated with `Annotated[np.ndarray, operator.add]` use this
+    channel with the `sum` reducer.
+
+    Elementwise reducers copy the value before updating it once it has been
+    read or saved in a checkpoint, ie. at most once per step. Concatenated
+    updates are written to spare capacity at the end of the array, which
+    doesn't change the values read earlier, so they are never copied except
+    to grow the array.
+    """
+
+    __slots__ = ("reducer", "value", "size", "shared")
+
+    step_sensitive = False
+
+    def __init__(self, typ: Type[Any], reducer: ArrayReducer = "sum") -> None:
+        super().__init__(typ)
+        if reducer not in ("sum", "max", "min", "concat"):
+            raise ValueError(f"Unknown reducer for ArrayAggregate: {reducer!r}")
+        _numpy()
+        self.reducer = reducer
+        # for concat, value is the buffer, of which the first size rows are set
+        self.value: Optional[Any] = None
+        self.size = 0
+        # whether self.value was read or saved, and can't be updated in place
+        self.shared = False
+
+    def __eq__(self, value: object) -> bool:
+        return isinstance(value, ArrayAggregate) and value.reducer == self.reducer
+
+    @property
+    def ValueType(self) -> Any:
+        """The type of the value stored in the channel."""
+        return self.typ
+
+    @property
+    def UpdateType(self) -> Any:
+        """The type of the update received by the channel."""
+        return self.typ
+
+    def checkpoint(self) -> Any:
+        if self.value is None:
+            raise EmptyChannelError()
+        if self.reducer == "concat":
+            return self.value[: self.size]
+        self.shared = True
+        return self.value
+
+    def from_checkpoint(self, checkpoint: Optional[Any]) -> Self:
+        empty = self.__class__(self.typ, self.reducer)
+        empty.key = self.key
+        if checkpoint is not None:
+            empty.value = _numpy().asarray(checkpoint)
+            empty.size = len(empty.value) if empty.value.ndim else 0
+            empty.shared = True
+        return empty
+
+    def update(self, values: Sequence[Any]) -> bool:
+        if not values:
+            return False
+        np = _numpy()
+        arrays = [np.asarray(value) for value in values]
+        if self.reducer == "concat":
+            self._concat(np, arrays)
+        else:
+            self._reduce(np, arrays)
+        return True
+
+    def get(self) -> Any:
+        if self.value is None:
+            raise EmptyChannelError()
+        if self.reducer == "concat":
+            return self.value[: self.size]
+        self.shared = True
+        return self.value
+
+    def _reduce(self, np: Any, arrays: list[Any]) -> None:
+        ufunc = {"sum": np.add, "max": np.maximum, "min": np.minimum}[self.reducer]
+        if self.value is None:
+            self.value = np.array(arrays[0])
+            self.shared = False
+            arrays = arrays[1:]
+        for array in arrays:
+            try:
+                shape = np.broadcast_shapes(self.value.shape, array.shape)
+            except ValueError as exc:
+                raise InvalidUpdateError(
+                    f"Can't combine array update for channel {self.key}: {exc}"
+                ) from exc
+            dtype = np.result_type(self.value, array)
+            if shape != self.value.shape or dtype != self.value.dtype:
+                # the result doesn't fit in the current array
+                self.value = ufunc(self.value, array)
+                self.shared = False
+            elif self.shared:
+                self.value = ufunc(self.value, array)
+                self.shared = False
+            else:
+                ufunc(self.value, array, out=self.value)
+
+    def _concat(self, np: Any, arrays: list[Any]) -> None:
+        if self.value is None:
+            first = arrays[0]
+            self.value = np.array(first if first.ndim else first.reshape(1))
+            self.size = len(self.value)
+            arrays = arrays[1:]
+        rows = self.value.shape[1:]
+        for i, array in enumerate(arrays):
+            if array.shape == rows:
+                arrays[i] = array.reshape(1, *rows)
+            elif array.shape[1:] != rows:
+                raise InvalidUpdateError(
+                    f"Can't concatenate array of shape {array.shape} "
+                    f"to array of shape {(self.size, *rows)} for channel {self.key}"
+                )
+        needed = self.size + sum(len(array) for array in arrays)
+        dtype = np.result_type(self.value, *arrays)
+        if needed > len(self.value) or dtype != self.value.dtype:
+            # grow geometrically, so appending n rows copies O(n) rows overall
+            buffer = np.empty((max(needed, 2 * self.size), *rows), dtype=dtype)
+            buffer[: self.size] = self.value[: self.size]
+            self.value = buffer
+        for array in arrays:
+            self.value[self.size : self.size + len(array)] = array
+            self.size += len(array)
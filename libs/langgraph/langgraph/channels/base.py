@@ -27,6 +27,13 @@ class BaseChannel(Generic[Value, Update, C], ABC):
     def UpdateType(self) -> Any:
         """The type of the update received by the channel."""
 
+    @property
+    def step_sensitive(self) -> bool:
+        """Whether the channel can change when notified of a new step, ie. when
+        `update` is called with an empty sequence. Pregel skips that notification
+        for channels where this is False. Defaults to True."""
+        return True
+
     # serialize/deserialize methods
 
     def checkpoint(self) -> Optional[C]:
@@ -46,7 +53,8 @@ class BaseChannel(Generic[Value, Update, C], ABC):
     def update(self, values: Sequence[Update]) -> bool:
         """Update the channel's value with the given sequence of updates.
         The order of the updates in the sequence is arbitrary.
-        This method is called by Pregel for all channels at the end of each step.
+        This method is called by Pregel at the end of each step for all channels
+        that received updates, and for all `step_sensitive` channels.
         If there are no updates, it is called with an empty sequence.
         Raises InvalidUpdateError if the sequence of updates is invalid.
         Returns True if the channel was updated, False otherwise."""
@@ -1,15 +1,21 @@
 import collections.abc
+import functools
+import itertools
+import operator
 from typing import (
+    Any,
     Callable,
     Generic,
     Optional,
     Sequence,
     Type,
+    cast,
 )
 
 from typing_extensions import NotRequired, Required, Self
 
 from langgraph.channels.base import BaseChannel, Value
+from langgraph.checkpoint.serde.types import ListSegment
 from langgraph.errors import EmptyChannelError
 
 
@@ -24,6 +30,66 @@ def _strip_extras(t):  # type: ignore[no-untyped-def]
     return t
 
 
+BulkReducer = Callable[[Any, Sequence[Any]], Any]
+"""Reducer receiving the current value and all the updates of a step at once."""
+
+BULK_REDUCERS: dict[Callable[[Any, Any], Any], BulkReducer] = {}
+
+
+def register_bulk_reducer(
+    reducer: Callable[[Any, Any], Any], bulk: BulkReducer
+) -> None:
+    """Declare the bulk form of a reducer, used by `BinaryOperatorAggregate`
+    when a channel receives more than one update in a step.
+
+    `bulk(value, updates)` must return the same result as folding the updates
+    into the value with the reducer, one at a time, eg. to concatenate all the
+    updates at once instead of copying the value for each update.
+
+    ```python
+    def concat(left: list, right: list) -> list:
+        return left + right
+
+    register_bulk_reducer(
+        concat, lambda left, updates: [*left, *itertools.chain(*updates)]
+    )
+    ```
+    """
+    BULK_REDUCERS[reducer] = bulk
+
+
+def _add_bulk(value: Any, updates: Sequence[Any]) -> Any:
+    typ = type(value)
+    if all(type(update) is typ for update in updates):
+        if typ is list:
+            return list(itertools.chain(value, *updates))
+        if typ is tuple:
+            return tuple(itertools.chain(value, *updates))
+        if typ is str:
+            return "".join((value, *updates))
+        if typ is int:
+            return sum(updates, value)
+    # floats are summed one at a time, as sum() is exact from Python 3.12
+    return functools.reduce(operator.add, updates, value)
+
+
+def _or_bulk(value: Any, updates: Sequence[Any]) -> Any:
+    typ = type(value)
+    if all(type(update) is typ for update in updates):
+        if typ is dict:
+            merged = value.copy()
+            for update in updates:
+                merged.update(update)
+            return merged
+        if typ is set:
+            return value.union(*updates)
+    return functools.reduce(operator.or_, updates, value)
+
+
+register_bulk_reducer(operator.add, _add_bulk)
+register_bulk_reducer(operator.or_, _or_bulk)
+
+
 class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
     """Stores the result of applying a binary operator to the current value and each new value.
 
@@ -32,13 +98,28 @@ class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
 
     total = Channels.BinaryOperatorAggregate(int, operator.add)
     ```
+
+    When the operator has a bulk form, see `register_bulk_reducer`, all the
+    updates received in a step are reduced with a single call to it.
+
+    Lists reduced with `operator.add` are only ever appended to, so they are
+    checkpointed as a `ListSegment` extending the previous checkpoint, of which
+    checkpointers can save only the appended items.
     """
 
-    __slots__ = ("value", "operator")
+    __slots__ = ("value", "operator", "bulk", "segment")
+
+    step_sensitive = False
 
     def __init__(self, typ: Type[Value], operator: Callable[[Value, Value], Value]):
         super().__init__(typ)
         self.operator = operator
+        try:
+            self.bulk: Optional[BulkReducer] = BULK_REDUCERS.get(operator)
+        except TypeError:  # unhashable callable
+            self.bulk = None
+        # last checkpoint of the value, if the value only appended to it since
+        self.segment: Optional[ListSegment] = None
         # special forms from typing or collections.abc are not instantiable
         # so we need to replace them with their concrete counterparts
         typ = _strip_extras(typ)
@@ -75,21 +156,51 @@ class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
         empty = self.__class__(self.typ, self.operator)
         empty.key = self.key
         if checkpoint is not None:
+            # lists saved as segments are assembled when first read
             empty.value = checkpoint
+            if isinstance(checkpoint, ListSegment):
+                empty.segment = checkpoint
         return empty
 
+    def checkpoint(self) -> Value:
+        try:
+            value = self.value
+        except AttributeError:
+            raise EmptyChannelError()
+        if type(value) is list and self.operator is operator.add:
+            return self._segment(value)
+        return value
+
+    def _segment(self, value: list) -> Any:
+        """Return the checkpoint of a list value, which extends the previous
+        checkpoint unless `self.segment` was reset since."""
+        segment = self.segment
+        if segment is None or segment._values is not value:
+            segment = self.segment = ListSegment(
+                value, len(value), None if segment is None else segment.ref
+            )
+        return segment
+
     def update(self, values: Sequence[Value]) -> bool:
         if not values:
             return False
         if not hasattr(self, "value"):
             self.value = values[0]
             values = values[1:]
-        for value in values:
-            self.value = self.operator(self.value, value)
+        elif isinstance(self.value, ListSegment):
+            self.value = cast(Value, self.value._list())
+        if self.bulk is not None and len(values) > 1:
+            self.value = self.bulk(self.value, values)
+        else:
+            for value in values:
+                self.value = self.operator(self.value, value)
         return True
 
     def get(self) -> Value:
         try:
-            return self.value
+            value = self.value
         except AttributeError:
             raise EmptyChannelError()
+        if isinstance(value, ListSegment):
+            value = self.value = cast(Value, value._list())
+        return value
@@ -24,6 +24,8 @@ class DynamicBarrierValue(
 
     __slots__ = ("names", "seen")
 
+    step_sensitive = False
+
     names: Optional[set[Value]]
     seen: set[Value]
 
@@ -11,6 +11,8 @@ class LastValue(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("value",)
 
+    step_sensitive = False
+
     def __eq__(self, value: object) -> bool:
         return isinstance(value, LastValue)
 
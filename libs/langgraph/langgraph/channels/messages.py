@@ -0,0 +1,206 @@
+import uuid
+from typing import Any, Callable, Optional, Sequence, Type, cast
+
+from langchain_core.messages import (
+    BaseMessage,
+    BaseMessageChunk,
+    RemoveMessage,
+    convert_to_messages,
+    message_chunk_to_message,
+)
+from typing_extensions import Self
+
+from langgraph.channels.binop import BinaryOperatorAggregate
+from langgraph.checkpoint.serde.types import ListSegment
+
+
+class IndexedMessages(BinaryOperatorAggregate[list]):
+    """Stores a list of messages, merging updates the same way as `add_messages`.
+
+    Used in place of `BinaryOperatorAggregate` for state keys reduced with
+    `add_messages`. Instead of re-running the reducer over the whole history for
+    each update, it keeps the normalized messages and the index of each message
+    id across updates, so that appending, replacing and removing messages only
+    costs in proportion to the messages changed.
+
+    The value is a plain list of messages, as with the reducer, copied from the
+    messages when first read after an update. Checkpoints are instead a
+    `ListSegment` view of the messages, extending the previous checkpoint until
+    messages are replaced or removed, so the messages are only copied before
+    being changed in place if a checkpoint of them was taken since.
+    """
+
+    __slots__ = ("messages", "index", "shadowed", "removed", "shared", "copy")
+
+    def __init__(self, typ: Type[list], operator: Callable[[Any, Any], Any]):
+        super().__init__(typ, operator)
+        # messages in order, removed messages are left as None until compacted
+        self.messages: list[Optional[BaseMessage]] = []
+        # position of each message id in self.messages, built on first update
+        self.index: Optional[dict[str, int]] = {}
+        # earlier positions of ids appended more than once, removed along with them
+        self.shadowed: dict[str, list[int]] = {}
+        self.removed = 0
+        # whether a checkpoint of self.messages was taken since it was copied
+        self.shared = False
+        # value returned by get() until the next update
+        self.copy: Optional[list[BaseMessage]] = None
+
+    def from_checkpoint(self, checkpoint: Optional[list]) -> Self:
+        empty = super().from_checkpoint(checkpoint)
+        if isinstance(checkpoint, ListSegment):
+            # copied from the checkpoint when first updated, see `update`
+            empty.index = None
+        elif checkpoint is not None:
+            empty.messages = (
+                checkpoint.copy() if isinstance(checkpoint, list) else [checkpoint]
+            )
+            empty.index = None
+        return empty
+
+    def checkpoint(self) -> list:
+        if self._restored():
+            return super().checkpoint()
+        messages = self._share()
+        segment = self.segment
+        if (
+            segment is None
+            or segment._values is not messages
+            or len(segment) != len(messages)
+        ):
+            segment = self.segment = ListSegment(
+                messages, len(messages), None if segment is None else segment.ref
+            )
+        return cast(list, segment)
+
+    def get(self) -> list:
+        if self.copy is None:
+            if self._restored():
+                self.copy = list(self.value)
+            elif self.removed:
+                self.copy = [m for m in self.messages if m is not None]
+            else:
+                self.copy = cast(list[BaseMessage], self.messages.copy())
+        return self.copy
+
+    def update(self, values: Sequence[list]) -> bool:
+        if not values:
+            return False
+        if self._restored():
+            self.messages = list(self.value)
+        index = self._index()
+        # coerce and validate all the values before merging any of them, so
+        # that failed updates leave the channel untouched
+        batches = [_coerce(value) for value in values]
+        added: set[str] = set()
+        removed: set[str] = set()
+        for batch in batches:
+            for m in batch:
+                if isinstance(m, RemoveMessage) and (
+                    m.id in removed or (m.id not in index and m.id not in added)
+                ):
+                    raise ValueError(
+                        f"Attempting to delete a message with an ID that doesn't exist ('{m.id}')"
+                    )
+            for m in batch:
+                if not isinstance(m, RemoveMessage):
+                    added.add(cast(str, m.id))
+                    removed.discard(cast(str, m.id))
+            for m in batch:
+                if isinstance(m, RemoveMessage):
+                    removed.add(cast(str, m.id))
+        for batch in batches:
+            self._merge(batch)
+        self.copy = None
+        return True
+
+    def _restored(self) -> bool:
+        """Whether the channel wasn't updated since restored from a segment."""
+        return self.index is None and not self.messages
+
+    def _share(self) -> list[BaseMessage]:
+        """Return the messages to take a checkpoint of, until changed in place."""
+        if self.removed:
+            self._compact()
+        self.shared = True
+        return cast(list[BaseMessage], self.messages)
+
+    def _own(self) -> None:
+        """Copy the messages before changing them in place, if shared."""
+        if self.shared:
+            self.messages = self.messages.copy()
+            self.shared = False
+
+    def _merge(self, updates: list[BaseMessage]) -> None:
+        index = cast(dict[str, int], self.index)
+        # merge, matching ids against the messages before this update only
+        appended: list[BaseMessage] = []
+        ids_to_remove: set[str] = set()
+        for m in updates:
+            if (existing_idx := index.get(cast(str, m.id))) is not None:
+                if isinstance(m, RemoveMessage):
+                    ids_to_remove.add(cast(str, m.id))
+                else:
+                    self._own()
+                    self.messages[existing_idx] = m
+                # the next checkpoint doesn't only append to the last one
+                self.segment = None
+            else:
+                appended.append(m)
+        for m in appended:
+            if (prev_idx := index.get(cast(str, m.id))) is not None:
+                self.shadowed.setdefault(cast(str, m.id), []).append(prev_idx)
+            index[cast(str, m.id)] = len(self.messages)
+            self.messages.append(m)
+        if ids_to_remove:
+            self._own()
+        for id in ids_to_remove:
+            for idx in (index.pop(id), *self.shadowed.pop(id, ())):
+                self.messages[idx] = None
+                self.removed += 1
+        if self.removed > len(self.messages) // 2:
+            self._compact()
+
+    def _index(self) -> dict[str, int]:
+        if self.index is None:
+            # messages saved by this channel or the reducer are already normalized
+            if all(
+                isinstance(m, BaseMessage) and m.id is not None for m in self.messages
+            ):
+                self._reindex()
+            else:
+                self._normalize()
+        return cast(dict[str, int], self.index)
+
+    def _normalize(self) -> None:
+        self.segment = None
+        self.messages = list(_coerce(cast(list, self.messages)))
+        self._reindex()
+
+    def _compact(self) -> None:
+        self.messages = [m for m in self.messages if m is not None]
+        self.removed = 0
+        self.shared = False
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self.index = {m.id: i for i, m in enumerate(self.messages)}  # type: ignore
+        self.shadowed = {}
+        if len(self.index) < len(self.messages):
+            for i, m in enumerate(self.messages):
+                if self.index[m.id] != i:  # type: ignore
+                    self.shadowed.setdefault(m.id, []).append(i)  # type: ignore
+
+
+def _coerce(value: Any) -> list[BaseMessage]:
+    """Coerce an update to a list of messages, with ids assigned."""
+    if not isinstance(value, list):
+        value = [value]
+    messages = [
+        message_chunk_to_message(cast(BaseMessageChunk, m))
+        for m in convert_to_messages(value)
+    ]
+    for m in messages:
+        if m.id is None:
+            m.id = str(uuid.uuid4())
+    return messages
@@ -11,6 +11,8 @@ class NamedBarrierValue(Generic[Value], BaseChannel[Value, Value, set[Value]]):
 
     __slots__ = ("names", "seen")
 
+    step_sensitive = False
+
     names: set[Value]
     seen: set[Value]
 
@@ -1,8 +1,17 @@
-from typing import Any, Generic, Iterator, Optional, Sequence, Type, Union
+from typing import (
+    Any,
+    Generic,
+    Iterator,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
 
 from typing_extensions import Self
 
 from langgraph.channels.base import BaseChannel, Value
+from langgraph.checkpoint.serde.types import ListSegment
 from langgraph.errors import EmptyChannelError
 
 
@@ -14,20 +23,31 @@ def flatten(values: Sequence[Union[Value, list[Value]]]) -> Iterator[Value]:
             yield value
 
 
+class TopicView(ListSegment[Value]):
+    """Read-only view of the values of a Topic, as of when it was read."""
+
+    __slots__ = ()
+
+
 class Topic(
     Generic[Value],
-    BaseChannel[
-        Sequence[Value], Union[Value, list[Value]], tuple[set[Value], list[Value]]
-    ],
+    BaseChannel[Sequence[Value], Union[Value, list[Value]], Sequence[Value]],
 ):
     """A configurable PubSub Topic.
 
     Args:
         typ: The type of the value stored in the channel.
         accumulate: Whether to accumulate values across steps. If False, the channel will be emptied after each step.
+
+    Values are kept in a list which is only appended to, so updates don't copy
+    the values received in earlier steps, and reads and checkpoints return a
+    `TopicView` of the list instead of a copy. Channels restored from a view
+    copy it, as the list it shows may still be appended to. Checkpoints of
+    accumulating topics extend the previous checkpoint, so checkpointers can
+    save only the values appended since.
     """
 
-    __slots__ = ("values", "accumulate")
+    __slots__ = ("values", "accumulate", "segment")
 
     def __init__(self, typ: Type[Value], accumulate: bool = False) -> None:
         super().__init__(typ)
@@ -35,10 +55,17 @@ class Topic(
         self.accumulate = accumulate
         # state
         self.values = list[Value]()
+        # last checkpoint of an accumulating topic
+        self.segment: Optional[ListSegment] = None
 
     def __eq__(self, value: object) -> bool:
         return isinstance(value, Topic) and value.accumulate == self.accumulate
 
+    @property
+    def step_sensitive(self) -> bool:
+        """Topics that don't accumulate are emptied at the start of each step."""
+        return not self.accumulate
+
     @property
     def ValueType(self) -> Any:
         """The type of the value stored in the channel."""
@@ -49,29 +76,47 @@ class Topic(
         """The type of the update received by the channel."""
         return Union[self.typ, list[self.typ]]  # type: ignore[name-defined]
 
-    def checkpoint(self) -> tuple[set[Value], list[Value]]:
-        return self.values
-
-    def from_checkpoint(self, checkpoint: Optional[list[Value]]) -> Self:
+    def checkpoint(self) -> Sequence[Value]:
+        if not self.accumulate:
+            return TopicView(self.values, len(self.values))
+        segment = self.segment
+        if segment is None or len(segment) != len(self.values):
+            segment = self.segment = TopicView(
+                self.values,
+                len(self.values),
+                None if segment is None else segment.ref,
+            )
+        return segment
+
+    def from_checkpoint(
+        self,
+        checkpoint: Optional[Union[Sequence[Value], tuple[set[Value], list[Value]]]],
+    ) -> Self:
         empty = self.__class__(self.typ, self.accumulate)
         empty.key = self.key
         if checkpoint is not None:
+            # older checkpoints are tuples of (unused) seen values and values
             if isinstance(checkpoint, tuple):
-                empty.values = checkpoint[1]
+                empty.values = list(checkpoint[1])
             else:
-                empty.values = checkpoint
+                empty.values = list(checkpoint)
+                if empty.accumulate and isinstance(checkpoint, ListSegment):
+                    empty.segment = checkpoint
         return empty
 
-    def update(self, values: Sequence[Union[Value, list[Value]]]) -> None:
-        current = list(self.values)
-        if not self.accumulate:
+    def update(self, values: Sequence[Union[Value, list[Value]]]) -> bool:
+        updated = False
+        if not self.accumulate and self.values:
+            updated = True
             self.values = list[Value]()
-        if flat_values := flatten(values):
-            self.values.extend(flat_values)
-        return self.values != current
+        if values:
+            size = len(self.values)
+            self.values.extend(flatten(values))
+            updated = updated or len(self.values) > size
+        return updated
 
     def get(self) -> Sequence[Value]:
         if self.values:
-            return list(self.values)
+            return TopicView(self.values, len(self.values))
         else:
             raise EmptyChannelError
@@ -67,6 +67,7 @@ class Branch(NamedTuple):
                 afunc=self._aroute,
                 writer=writer,
                 reader=reader,
+                path_func=_get_plain_func(self.path),
                 name=None,
                 trace=False,
             )
@@ -81,6 +82,7 @@ class Branch(NamedTuple):
         writer: Callable[
             [Sequence[Union[str, Send]], RunnableConfig], Optional[ChannelWrite]
         ],
+        path_func: Optional[Callable[[Any], Any]],
     ) -> Runnable:
         if reader:
             value = reader(config)
@@ -90,7 +92,13 @@ class Branch(NamedTuple):
                 value = {**input, **value}
         else:
             value = input
-        result = self.path.invoke(value, config)
+        if path_func is not None and not _has_callbacks(config):
+            # nothing to trace, call the function without invoking the path
+            result = path_func(value)
+            if isinstance(result, Runnable):
+                result = result.invoke(value, config)
+        else:
+            result = self.path.invoke(value, config)
         return self._finish(writer, input, result, config)
 
     async def _aroute(
@@ -102,6 +110,7 @@ class Branch(NamedTuple):
         writer: Callable[
             [Sequence[Union[str, Send]], RunnableConfig], Optional[ChannelWrite]
         ],
+        path_func: Optional[Callable[[Any], Any]],
     ) -> Runnable:
         if reader:
             value = await asyncio.to_thread(reader, config)
@@ -126,18 +135,44 @@ class Branch(NamedTuple):
         if not isinstance(result, list):
             result = [result]
         if self.ends:
+            # the nodes in ends are validated when compiling the graph
             destinations: Sequence[Union[Send, str]] = [
                 r if isinstance(r, Send) else self.ends[r] for r in result
             ]
         else:
             destinations = cast(Sequence[Union[Send, str]], result)
-        if any(dest is None or dest == START for dest in destinations):
-            raise ValueError("Branch did not return a valid destination")
+            if any(dest is None or dest == START for dest in destinations):
+                raise ValueError("Branch did not return a valid destination")
         if any(p.node == END for p in destinations if isinstance(p, Send)):
             raise InvalidUpdateError("Cannot send a packet to the END node")
         return writer(destinations, config) or input
 
 
+def _get_plain_func(path: Runnable) -> Optional[Callable[[Any], Any]]:
+    """Return the sync function of the path, when it can be called with the state
+    only, instead of invoking the path, ie. when it doesn't read the config."""
+    if (
+        isinstance(path, RunnableCallable)
+        and path.func is not None
+        and not path.func_accepts_config
+        and not any(path.func_accepts.values())
+        and not path.kwargs
+    ):
+        return path.func
+    return None
+
+
+def _has_callbacks(config: RunnableConfig) -> bool:
+    """Whether invoking a runnable with this config would report to any handler."""
+    callbacks = config.get("callbacks")
+    if callbacks is None:
+        return False
+    elif isinstance(callbacks, list):
+        return bool(callbacks)
+    else:
+        return bool(callbacks.handlers)
+
+
 class Graph:
     def __init__(self) -> None:
         self.nodes: dict[str, NodeSpec] = {}
@@ -482,14 +517,30 @@ class CompiledGraph(Pregel):
             cast(list[str], self.nodes[end].channels).append(start)
 
     def attach_branch(self, start: str, name: str, branch: Branch) -> None:
+        # add hidden start node
+        if start == START and start not in self.nodes:
+            self.nodes[start] = Channel.subscribe_to(START, tags=[TAG_HIDDEN])
+
+        ends = branch.ends.values() if branch.ends else [node for node in self.nodes]
+        # table of the write for each destination node
+        entries = {
+            end: ChannelWriteEntry(
+                f"branch:{start}:{name}:{end}" if end != END else END
+            )
+            for end in ends
+        }
+
         def branch_writer(
             packets: Sequence[Union[str, Send]], config: RunnableConfig
         ) -> Optional[ChannelWrite]:
             writes = [
                 (
-                    ChannelWriteEntry(f"branch:{start}:{name}:{p}" if p != END else END)
-                    if not isinstance(p, Send)
-                    else p
+                    p
+                    if isinstance(p, Send)
+                    else entries.get(p)
+                    or ChannelWriteEntry(
+                        f"branch:{start}:{name}:{p}" if p != END else END
+                    )
                 )
                 for p in packets
             ]
@@ -498,15 +549,10 @@ class CompiledGraph(Pregel):
                 tags=[TAG_HIDDEN],
             )
 
-        # add hidden start node
-        if start == START and start not in self.nodes:
-            self.nodes[start] = Channel.subscribe_to(START, tags=[TAG_HIDDEN])
-
         # attach branch writer
         self.nodes[start] |= branch.run(branch_writer)
 
         # attach branch readers
-        ends = branch.ends.values() if branch.ends else [node for node in self.nodes]
         for end in ends:
             if end != END:
                 channel_name = f"branch:{start}:{name}:{end}"
@@ -1,7 +1,10 @@
+import dataclasses
 import inspect
 import logging
+import operator
 import typing
 import warnings
+from collections import defaultdict
 from functools import partial
 from inspect import isclass, isfunction, signature
 from typing import (
@@ -23,15 +26,20 @@ from langchain_core.runnables import Runnable, RunnableConfig
 from langchain_core.runnables.base import RunnableLike
 from pydantic import BaseModel
 from pydantic.v1 import BaseModel as BaseModelV1
+from pydantic.v1 import ValidationError as ValidationErrorV1
 from typing_extensions import Self
 
 from langgraph._api.deprecation import LangGraphDeprecationWarning
+from langgraph.cache.base import BaseCache
+from langgraph.channels.array import ArrayAggregate, _is_array_type
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.dynamic_barrier_value import DynamicBarrierValue, WaitForNames
 from langgraph.channels.ephemeral_value import EphemeralValue
 from langgraph.channels.last_value import LastValue
+from langgraph.channels.messages import IndexedMessages
 from langgraph.channels.named_barrier_value import NamedBarrierValue
+from langgraph.channels.topic import Topic
 from langgraph.constants import NS_END, NS_SEP, TAG_HIDDEN
 from langgraph.errors import InvalidUpdateError
 from langgraph.graph.graph import END, START, Branch, CompiledGraph, Graph, Send
@@ -43,10 +51,23 @@ from langgraph.managed.base import (
     is_managed_value,
     is_writable_managed_value,
 )
+from langgraph.pregel.fused import fuse_chain
+from langgraph.pregel.process import run_in_process
 from langgraph.pregel.read import ChannelRead, PregelNode
-from langgraph.pregel.write import SKIP_WRITE, ChannelWrite, ChannelWriteEntry
+from langgraph.pregel.utils import find_subgraph_pregel
+from langgraph.pregel.write import (
+    ChannelWrite,
+    ChannelWriteEntry,
+    ChannelWriteTupleEntry,
+)
 from langgraph.store.base import BaseStore
-from langgraph.types import All, Checkpointer, RetryPolicy
+from langgraph.types import (
+    All,
+    CachePolicy,
+    Checkpointer,
+    ResourcePool,
+    RetryPolicy,
+)
 from langgraph.utils.fields import get_field_default
 from langgraph.utils.pydantic import create_model
 from langgraph.utils.runnable import coerce_to_runnable
@@ -71,6 +92,11 @@ class StateNodeSpec(NamedTuple):
     metadata: Optional[dict[str, Any]]
     input: Type[Any]
     retry_policy: Optional[RetryPolicy]
+    cache_policy: Optional[CachePolicy] = None
+    max_concurrency: Optional[int] = None
+    pool: Optional[ResourcePool] = None
+    batch: bool = False
+    lazy: bool = False
 
 
 class StateGraph(Graph):
@@ -211,6 +237,12 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache: Optional[CachePolicy] = None,
+        executor: Literal["thread", "process"] = "thread",
+        max_concurrency: Optional[int] = None,
+        pool: Optional[ResourcePool] = None,
+        batch: bool = False,
+        lazy: bool = False,
     ) -> Self:
         """Adds a new node to the state graph.
         Will take the name of the function/runnable as the node name.
@@ -235,6 +267,12 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache: Optional[CachePolicy] = None,
+        executor: Literal["thread", "process"] = "thread",
+        max_concurrency: Optional[int] = None,
+        pool: Optional[ResourcePool] = None,
+        batch: bool = False,
+        lazy: bool = False,
     ) -> Self:
         """Adds a new node to the state graph.
 
@@ -258,6 +296,12 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache: Optional[CachePolicy] = None,
+        executor: Literal["thread", "process"] = "thread",
+        max_concurrency: Optional[int] = None,
+        pool: Optional[ResourcePool] = None,
+        batch: bool = False,
+        lazy: bool = False,
     ) -> Self:
         """Adds a new node to the state graph.
 
@@ -269,6 +313,12 @@ class StateGraph(Graph):
             metadata (Optional[dict[str, Any]]): The metadata associated with the node. (default: None)
             input (Optional[Type[Any]]): The input schema for the node. (default: the graph's input schema)
             retry (Optional[RetryPolicy]): The policy for retrying the node. (default: None)
+            cache (Optional[CachePolicy]): The policy for caching the node's results. Requires the graph to be compiled with a cache. (default: None)
+            executor (Literal["thread", "process"]): Where to run the node. Use "process" for CPU-bound nodes, to run them in a shared pool of worker processes. The action must then be a picklable function that only accepts the node input. (default: "thread")
+            max_concurrency (Optional[int]): Maximum number of tasks for this node that can run at the same time, eg. when fanning out with `Send`. Excess tasks are queued until a slot frees up. (default: None)
+            pool (Optional[ResourcePool]): A resource pool limiting the concurrency of this node together with other nodes using a pool of the same name, in any graph. (default: None)
+            batch (bool): Whether to call the action once per step with the list of inputs of all tasks of this node, eg. those sent with `Send`. The action must then return a list with one update per input, in the same order. (default: False)
+            lazy (bool): Whether to pass the action a read-only mapping which reads state keys when first accessed, instead of a dict of all state keys. Useful for nodes reading a few keys of a wide state. Only applies to dict and TypedDict input schemas, pydantic models and dataclasses are always built eagerly. (default: False)
         Raises:
             ValueError: If the key is already being used as a state key.
 
@@ -353,11 +403,28 @@ class StateGraph(Graph):
             pass
         if input is not None:
             self._add_schema(input)
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"Node `{node}` max_concurrency must be at least 1.")
+        if executor == "process":
+            if isinstance(action, Runnable) or not callable(action):
+                raise ValueError(
+                    f"Node `{node}` must be a function to run in a process."
+                )
+            if lazy:
+                raise ValueError(
+                    f"Node `{node}` runs in a process, so its input can't be lazy."
+                )
+            action = run_in_process(cast(Callable[[Any], Any], action), name=node)
         self.nodes[cast(str, node)] = StateNodeSpec(
             coerce_to_runnable(action, name=cast(str, node), trace=False),
             metadata,
             input=input or self.schema,
             retry_policy=retry,
+            cache_policy=cache,
+            max_concurrency=max_concurrency,
+            pool=pool,
+            batch=batch,
+            lazy=lazy,
         )
         return self
 
@@ -402,9 +469,12 @@ class StateGraph(Graph):
         checkpointer: Checkpointer = None,
         *,
         store: Optional[BaseStore] = None,
+        cache: Optional[BaseCache] = None,
         interrupt_before: Optional[Union[All, list[str]]] = None,
         interrupt_after: Optional[Union[All, list[str]]] = None,
         debug: bool = False,
+        trusted_state: bool = False,
+        fuse_nodes: bool = False,
     ) -> "CompiledStateGraph":
         """Compiles the state graph into a `CompiledGraph` object.
 
@@ -415,9 +485,22 @@ class StateGraph(Graph):
             checkpointer (Checkpointer): An optional checkpoint saver object.
                 This serves as a fully versioned "memory" for the graph, allowing
                 the graph to be paused and resumed, and replayed from any point.
+            cache (Optional[BaseCache]): An optional cache, used to store the results of nodes with a cache policy.
             interrupt_before (Optional[Sequence[str]]): An optional list of node names to interrupt before.
             interrupt_after (Optional[Sequence[str]]): An optional list of node names to interrupt after.
             debug (bool): A flag indicating whether to enable debug mode.
+            trusted_state (bool): Whether to build pydantic model and dataclass node inputs
+                from state values without validating them again. Instead, the values of
+                state keys without a reducer are validated against their annotation when
+                given as graph input or returned by nodes in a dict. Values of keys with a
+                reducer are not validated.
+            fuse_nodes (bool): Whether to run chains of nodes connected by edges
+                in a single task, instead of one step per node. A node runs in the same
+                task as the one before it when that node is its only incoming edge and
+                its only outgoing edge, neither has a conditional edge, and both have the
+                same retry policy, no cache policy, and no interrupt between them.
+                Nodes read the state updated by the nodes before them in the chain,
+                and output their updates separately.
 
         Returns:
             CompiledStateGraph: The compiled state graph.
@@ -473,6 +556,8 @@ class StateGraph(Graph):
             auto_validate=False,
             debug=debug,
             store=store,
+            cache=cache,
+            trusted_state=trusted_state,
         )
 
         compiled.attach_node(START, None)
@@ -489,11 +574,22 @@ class StateGraph(Graph):
             for name, branch in branches.items():
                 compiled.attach_branch(start, name, branch)
 
+        if fuse_nodes:
+            for chain in _get_chains(self, interrupt_before, interrupt_after):
+                compiled.attach_chain(chain)
+
         return compiled.validate()
 
 
 class CompiledStateGraph(CompiledGraph):
     builder: StateGraph
+    trusted_state: bool
+
+    def __init__(
+        self, *, builder: StateGraph, trusted_state: bool = False, **kwargs: Any
+    ) -> None:
+        super().__init__(builder=builder, **kwargs)
+        self.trusted_state = trusted_state
 
     def get_input_schema(
         self, config: Optional[RunnableConfig] = None
@@ -529,25 +625,36 @@ class CompiledStateGraph(CompiledGraph):
                 if is_writable_managed_value(v)
             ]
 
-        def _get_state_key(input: Union[None, dict, Any], *, key: str) -> Any:
+        output_keys_set = frozenset(output_keys)
+        validate = (
+            _get_state_validator(self.builder.schema, self.builder.channels)
+            if self.trusted_state
+            else None
+        )
+
+        def _get_updates(
+            input: Union[None, dict, Any],
+        ) -> Optional[Sequence[tuple[str, Any]]]:
             if input is None:
-                return SKIP_WRITE
+                return None
             elif isinstance(input, dict):
-                return input.get(key, SKIP_WRITE)
+                # only visit the keys returned by the node, ignoring unknown keys
+                updates = [(k, v) for k, v in input.items() if k in output_keys_set]
+                return validate(updates) if validate else updates
             elif get_type_hints(type(input)):
-                value = getattr(input, key, SKIP_WRITE)
-                return value if value is not None else SKIP_WRITE
+                return [
+                    (k, value)
+                    for k in output_keys
+                    if (value := getattr(input, k, None)) is not None
+                ]
             else:
                 raise InvalidUpdateError(f"Expected dict, got {input}")
 
         # state updaters
-        write_entries = (
+        write_entries: list[Union[ChannelWriteEntry, ChannelWriteTupleEntry]] = (
             [ChannelWriteEntry("__root__", skip_none=True)]
             if output_keys == ["__root__"]
-            else [
-                ChannelWriteEntry(key, mapper=partial(_get_state_key, key=key))
-                for key in output_keys
-            ]
+            else [ChannelWriteTupleEntry(_get_updates)]
         )
 
         # add node and output channel
@@ -578,18 +685,27 @@ class CompiledStateGraph(CompiledGraph):
                 mapper=(
                     None
                     if is_single_input or issubclass(input_schema, dict)
+                    else _get_state_constructor(input_schema)
+                    if self.trusted_state
                     else partial(_coerce_state, input_schema)
                 ),
                 writers=[
                     # publish to this channel and state keys
                     ChannelWrite(
-                        [ChannelWriteEntry(key, key)] + write_entries,
+                        [ChannelWriteEntry(key, key), *write_entries],
                         tags=[TAG_HIDDEN],
                         require_at_least_one_of=output_keys,
                     ),
                 ],
                 metadata=node.metadata,
                 retry_policy=node.retry_policy,
+                cache_policy=node.cache_policy,
+                max_concurrency=node.max_concurrency,
+                pool=node.pool,
+                batched=node.batch,
+                lazy=(
+                    node.lazy and not is_single_input and issubclass(input_schema, dict)
+                ),
                 bound=node.runnable,
             )
         else:
@@ -623,15 +739,28 @@ class CompiledStateGraph(CompiledGraph):
                 )
 
     def attach_branch(self, start: str, name: str, branch: Branch) -> None:
+        ends = (
+            branch.ends.values()
+            if branch.ends
+            else [node for node in self.builder.nodes if node != branch.then]
+        )
+        # table of the write for each destination node
+        entries = {
+            end: ChannelWriteEntry(f"branch:{start}:{name}:{end}", start)
+            for end in ends
+            if end != END
+        }
+
         def branch_writer(
             packets: Sequence[Union[str, Send]], config: RunnableConfig
         ) -> None:
             if filtered := [p for p in packets if p != END]:
                 writes = [
                     (
-                        ChannelWriteEntry(f"branch:{start}:{name}:{p}", start)
-                        if not isinstance(p, Send)
-                        else p
+                        p
+                        if isinstance(p, Send)
+                        else entries.get(p)
+                        or ChannelWriteEntry(f"branch:{start}:{name}:{p}", start)
                     )
                     for p in filtered
                 ]
@@ -655,15 +784,11 @@ class CompiledStateGraph(CompiledGraph):
             else self.builder.schema
         )
         self.nodes[start] |= branch.run(
-            branch_writer, _get_state_reader(self.builder, schema)
+            branch_writer,
+            _get_state_reader(self.builder, schema, trusted=self.trusted_state),
         )
 
         # attach branch subscribers
-        ends = (
-            branch.ends.values()
-            if branch.ends
-            else [node for node in self.builder.nodes if node != branch.then]
-        )
         for end in ends:
             if end != END:
                 channel_name = f"branch:{start}:{name}:{end}"
@@ -681,9 +806,91 @@ class CompiledStateGraph(CompiledGraph):
                         [ChannelWriteEntry(channel_name, end)], tags=[TAG_HIDDEN]
                     )
 
+    def attach_chain(self, chain: Sequence[str]) -> None:
+        # channels keeping the values of the last step only
+        replaced = frozenset(
+            k
+            for k, c in self.channels.items()
+            if isinstance(c, (LastValue, EphemeralValue))
+            or (isinstance(c, Topic) and not c.accumulate)
+        )
+        nodes = [(key, self.nodes[key]) for key in chain]
+        # each node runs the rest of the chain in its task, the first one when
+        # triggered, the others when sent to
+        for i, (key, node) in enumerate(nodes):
+            update: dict[str, Any] = {}
+            if i > 0:
+                update["triggers"] = [t for t in node.triggers if t != chain[i - 1]]
+            if i < len(nodes) - 1:
+                update["bound"] = fuse_chain(nodes[i:], replaced)
+                update["writers"] = []
+            self.nodes[key] = node.copy(update)
+
+
+def _get_chains(
+    builder: StateGraph,
+    interrupt_before: Union[All, list[str]],
+    interrupt_after: Union[All, list[str]],
+) -> list[list[str]]:
+    """Find the chains of nodes which can run in a single task, see `fuse_nodes`
+    in `StateGraph.compile`."""
+    if interrupt_before == "*" or interrupt_after == "*":
+        return []
+    outgoing: defaultdict[str, int] = defaultdict(int)
+    incoming: defaultdict[str, int] = defaultdict(int)
+    for start, end in builder.edges:
+        outgoing[start] += 1
+        incoming[end] += 1
+    for starts, end in builder.waiting_edges:
+        for start in starts:
+            outgoing[start] += 1
+        incoming[end] += 1
+    for start, branches in builder.branches.items():
+        for branch in branches.values():
+            outgoing[start] += 1
+            for end in branch.ends.values() if branch.ends else builder.nodes:
+                incoming[end] += 1
+            if branch.then:
+                incoming[branch.then] += 1
+
+    def can_fuse(start: str, end: str) -> bool:
+        a, b = builder.nodes[start], builder.nodes[end]
+        return (
+            outgoing[start] == 1
+            and incoming[end] == 1
+            and start not in interrupt_after
+            and end not in interrupt_before
+            and end not in interrupt_after
+            and a.retry_policy == b.retry_policy
+            and a.cache_policy is None
+            and b.cache_policy is None
+            and a.max_concurrency == b.max_concurrency
+            and a.pool is None
+            and b.pool is None
+            and not a.batch
+            and not b.batch
+            and find_subgraph_pregel(a.runnable) is None
+            and find_subgraph_pregel(b.runnable) is None
+        )
+
+    next_nodes = {
+        start: end
+        for start, end in builder.edges
+        if start != START and end != END and can_fuse(start, end)
+    }
+    chains: list[list[str]] = []
+    for start in next_nodes:
+        if start in next_nodes.values():
+            continue
+        chain = [start]
+        while chain[-1] in next_nodes:
+            chain.append(next_nodes[chain[-1]])
+        chains.append(chain)
+    return chains
+
 
 def _get_state_reader(
-    builder: StateGraph, schema: Type[Any]
+    builder: StateGraph, schema: Type[Any], *, trusted: bool = False
 ) -> Callable[[RunnableConfig], Any]:
     state_keys = list(builder.channels)
     select = list(builder.schemas[schema])
@@ -695,6 +902,8 @@ def _get_state_reader(
         mapper=(
             None
             if state_keys == ["__root__"] or issubclass(schema, dict)
+            else _get_state_constructor(schema)
+            if trusted
             else partial(_coerce_state, schema)
         ),
     )
@@ -704,6 +913,117 @@ def _coerce_state(schema: Type[Any], input: dict[str, Any]) -> dict[str, Any]:
     return schema(**input)
 
 
+def _get_state_constructor(schema: Type[Any]) -> Callable[[dict[str, Any]], Any]:
+    """Get a function building instances of a state schema from channel values
+    without validating them, for graphs compiled with trusted state."""
+    if issubclass(schema, BaseModel):
+        required = frozenset(
+            k for k, f in schema.model_fields.items() if f.is_required()
+        )
+        construct: Callable[..., Any] = schema.model_construct
+    elif issubclass(schema, BaseModelV1):
+        required = frozenset(k for k, f in schema.__fields__.items() if f.required)
+        construct = schema.construct
+    elif dataclasses.is_dataclass(schema):
+        fields = dataclasses.fields(schema)
+        required = frozenset(
+            f.name
+            for f in fields
+            if f.init
+            and f.default is dataclasses.MISSING
+            and f.default_factory is dataclasses.MISSING
+        )
+        construct = partial(_construct_dataclass, schema, fields)
+    else:
+        return partial(_coerce_state, schema)
+    return partial(_construct_state, schema, required, construct)
+
+
+def _construct_state(
+    schema: Type[Any],
+    required: frozenset[str],
+    construct: Callable[..., Any],
+    input: dict[str, Any],
+) -> Any:
+    if required.issubset(input):
+        return construct(**input)
+    else:
+        # let the schema raise the usual error for missing values
+        return schema(**input)
+
+
+def _construct_dataclass(
+    schema: Type[Any], fields: tuple[dataclasses.Field, ...], **input: Any
+) -> Any:
+    """Build a dataclass instance like its __init__ would, with default values
+    for missing fields, but without calling __post_init__."""
+    obj = object.__new__(schema)
+    for f in fields:
+        if f.name in input:
+            value = input[f.name]
+        elif f.default is not dataclasses.MISSING:
+            value = f.default
+        elif f.default_factory is not dataclasses.MISSING:
+            value = f.default_factory()
+        else:
+            continue
+        # bypasses __setattr__ of frozen dataclasses
+        object.__setattr__(obj, f.name, value)
+    return obj
+
+
+def _get_state_validator(
+    schema: Type[Any], channels: dict[str, BaseChannel]
+) -> Optional[Callable[[list[tuple[str, Any]]], list[tuple[str, Any]]]]:
+    """Get a function validating the updates of state keys without a reducer,
+    for graphs compiled with trusted state. Updates of keys with a reducer may not
+    be of the type of the key, so they are left unvalidated."""
+    if not isclass(schema):
+        return None
+    elif issubclass(schema, BaseModel):
+        keys = frozenset(
+            k for k in schema.model_fields if type(channels.get(k)) is LastValue
+        )
+        return partial(_validate_updates, schema, keys) if keys else None
+    elif issubclass(schema, BaseModelV1):
+        keys = frozenset(
+            k for k in schema.__fields__ if type(channels.get(k)) is LastValue
+        )
+        return partial(_validate_updates_v1, schema, keys) if keys else None
+    else:
+        return None
+
+
+def _validate_updates(
+    schema: Type[BaseModel], keys: frozenset[str], updates: list[tuple[str, Any]]
+) -> list[tuple[str, Any]]:
+    """Validate the updates as assignments to an instance of the model, which
+    runs its field and model validators, not only the field annotations."""
+    obj: Optional[BaseModel] = None
+    validated: list[tuple[str, Any]] = []
+    for k, v in updates:
+        if k in keys:
+            if obj is None:
+                obj = schema.model_construct()
+            schema.__pydantic_validator__.validate_assignment(obj, k, v)
+            v = getattr(obj, k)
+        validated.append((k, v))
+    return validated
+
+
+def _validate_updates_v1(
+    schema: Type[BaseModelV1], keys: frozenset[str], updates: list[tuple[str, Any]]
+) -> list[tuple[str, Any]]:
+    validated: list[tuple[str, Any]] = []
+    for k, v in updates:
+        if k in keys:
+            v, errors = schema.__fields__[k].validate(v, {}, loc=k, cls=schema)
+            if errors:
+                raise ValidationErrorV1([errors], schema)
+        validated.append((k, v))
+    return validated
+
+
 def _get_channels(
     schema: Type[dict],
 ) -> tuple[dict[str, BaseChannel], dict[str, ManagedValueSpec]]:
@@ -772,6 +1092,10 @@ def _is_field_binop(typ: Type[Any]) -> Optional[BinaryOperatorAggregate]:
             if len(params) == 2 and all(
                 p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in params
             ):
+                if meta[0] is _add_messages():
+                    return IndexedMessages(typ, meta[0])
+                if meta[0] is operator.add and _is_array_type(typ):
+                    return ArrayAggregate(typ, "sum")
                 return BinaryOperatorAggregate(typ, meta[0])
             else:
                 raise ValueError(
@@ -780,6 +1104,13 @@ def _is_field_binop(typ: Type[Any]) -> Optional[BinaryOperatorAggregate]:
     return None
 
 
+def _add_messages() -> Callable:
+    # imported here, as langgraph.graph.message depends on this module
+    from langgraph.graph.message import add_messages
+
+    return add_messages
+
+
 def _is_field_managed_value(name: str, typ: Type[Any]) -> Optional[ManagedValueSpec]:
     if hasattr(typ, "__metadata__"):
         meta = typ.__metadata__
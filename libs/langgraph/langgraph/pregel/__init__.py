@@ -42,6 +42,7 @@ from langchain_core.tracers._streaming import _StreamingCallbackHandler
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from langgraph.cache.base import BaseCache
 from langgraph.channels.base import (
     BaseChannel,
 )
@@ -54,8 +55,10 @@ from langgraph.checkpoint.base import (
 )
 from langgraph.constants import (
     CONF,
+    CONFIG_KEY_CACHE,
     CONFIG_KEY_CHECKPOINT_NS,
     CONFIG_KEY_CHECKPOINTER,
+    CONFIG_KEY_DURABILITY,
     CONFIG_KEY_READ,
     CONFIG_KEY_RESUMING,
     CONFIG_KEY_SEND,
@@ -84,11 +87,22 @@ from langgraph.pregel.messages import StreamMessagesHandler
 from langgraph.pregel.read import PregelNode
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.pregel.runner import PregelRunner
-from langgraph.pregel.utils import find_subgraph_pregel, get_new_channel_versions
+from langgraph.pregel.utils import (
+    find_subgraph_pregel,
+    get_new_channel_versions,
+    get_trigger_to_nodes,
+)
 from langgraph.pregel.validate import validate_graph, validate_keys
 from langgraph.pregel.write import ChannelWrite, ChannelWriteEntry
 from langgraph.store.base import BaseStore
-from langgraph.types import All, Checkpointer, LoopProtocol, StateSnapshot, StreamMode
+from langgraph.types import (
+    All,
+    Checkpointer,
+    Durability,
+    LoopProtocol,
+    StateSnapshot,
+    StreamMode,
+)
 from langgraph.utils.config import (
     ensure_config,
     merge_configs,
@@ -203,6 +217,9 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
     store: Optional[BaseStore] = None
     """Memory store to use for SharedValues. Defaults to None."""
 
+    cache: Optional[BaseCache] = None
+    """Cache to use for storing the results of nodes with a cache policy. Defaults to None."""
+
     retry_policy: Optional[RetryPolicy] = None
     """Retry policy to use when running tasks. Set to None to disable."""
 
@@ -212,6 +229,11 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
 
     name: str = "LangGraph"
 
+    trigger_to_nodes: Optional[Mapping[str, Mapping[str, int]]] = None
+    """Mapping from channel name to the names of the nodes it triggers, each with
+    the index at which the node was defined. Built by `validate()`, used to skip
+    nodes that can't run in the next step."""
+
     def __init__(
         self,
         *,
@@ -228,10 +250,12 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
         debug: Optional[bool] = None,
         checkpointer: Optional[BaseCheckpointSaver] = None,
         store: Optional[BaseStore] = None,
+        cache: Optional[BaseCache] = None,
         retry_policy: Optional[RetryPolicy] = None,
         config_type: Optional[Type[Any]] = None,
         config: Optional[RunnableConfig] = None,
         name: str = "LangGraph",
+        trigger_to_nodes: Optional[Mapping[str, Mapping[str, int]]] = None,
     ) -> None:
         self.nodes = nodes
         self.channels = channels or {}
@@ -245,10 +269,12 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
         self.debug = debug if debug is not None else get_debug()
         self.checkpointer = checkpointer
         self.store = store
+        self.cache = cache
         self.retry_policy = retry_policy
         self.config_type = config_type
         self.config = config
         self.name = name
+        self.trigger_to_nodes = trigger_to_nodes
         if auto_validate:
             self.validate()
 
@@ -271,6 +297,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
             self.interrupt_after_nodes,
             self.interrupt_before_nodes,
         )
+        self.trigger_to_nodes = get_trigger_to_nodes(self.nodes)
         return self
 
     @property
@@ -894,7 +921,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
             if saved:
                 checkpointer.put_writes(checkpoint_config, task.writes, task_id)
             # apply to checkpoint and save
-            mv_writes = apply_writes(
+            mv_writes, _ = apply_writes(
                 checkpoint, channels, [task], checkpointer.get_next_version
             )
             assert not mv_writes, "Can't write to SharedValues from update_state"
@@ -1044,7 +1071,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
             if saved:
                 await checkpointer.aput_writes(checkpoint_config, writes, task_id)
             # apply to checkpoint and save
-            mv_writes = apply_writes(
+            mv_writes, _ = apply_writes(
                 checkpoint, channels, [task], checkpointer.get_next_version
             )
             assert not mv_writes, "Can't write to SharedValues from update_state"
@@ -1073,6 +1100,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
         interrupt_before: Optional[Union[All, Sequence[str]]],
         interrupt_after: Optional[Union[All, Sequence[str]]],
         debug: Optional[bool],
+        durability: Optional[Durability] = None,
     ) -> tuple[
         bool,
         set[StreamMode],
@@ -1081,6 +1109,8 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
         Union[All, Sequence[str]],
         Optional[BaseCheckpointSaver],
         Optional[BaseStore],
+        Optional[BaseCache],
+        Durability,
     ]:
         if config["recursion_limit"] < 1:
             raise ValueError("recursion_limit must be at least 1")
@@ -1111,6 +1141,12 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
             store: Optional[BaseStore] = config[CONF][CONFIG_KEY_STORE]
         else:
             store = self.store
+        if CONFIG_KEY_CACHE in config.get(CONF, {}):
+            cache: Optional[BaseCache] = config[CONF][CONFIG_KEY_CACHE]
+        else:
+            cache = self.cache
+        if durability is None:
+            durability = config.get(CONF, {}).get(CONFIG_KEY_DURABILITY, "async")
         return (
             debug,
             set(stream_mode),
@@ -1119,6 +1155,8 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
             interrupt_after,
             checkpointer,
             store,
+            cache,
+            durability,
         )
 
     def stream(
@@ -1132,6 +1170,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
         subgraphs: bool = False,
+        durability: Optional[Durability] = None,
     ) -> Iterator[Union[dict[str, Any], Any]]:
         """Stream graph steps for a single input.
 
@@ -1149,6 +1188,12 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
             interrupt_after: Nodes to interrupt after, defaults to all nodes in the graph.
             debug: Whether to print debug information during execution, defaults to False.
             subgraphs: Whether to stream subgraphs, defaults to False.
+            durability: When to persist checkpoints, defaults to "async".
+                Options are 'sync', 'async', and 'exit'.
+                sync: Save each checkpoint before starting the next step.
+                async: Save each checkpoint in the background, while the next step runs.
+                exit: Save only the last checkpoint, when the run finishes, is interrupted or fails.
+                See `langgraph.types.Durability` for what is lost in a crash.
 
         Yields:
             The output of each step in the graph. The output shape depends on the stream_mode.
@@ -1236,6 +1281,8 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
                 interrupt_after_,
                 checkpointer,
                 store,
+                cache,
+                durability_,
             ) = self._defaults(
                 config,
                 stream_mode=stream_mode,
@@ -1243,6 +1290,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
                 interrupt_before=interrupt_before,
                 interrupt_after=interrupt_after,
                 debug=debug,
+                durability=durability,
             )
             # set up messages stream mode
             if "messages" in stream_modes:
@@ -1261,6 +1309,9 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
                 store=store,
                 checkpointer=checkpointer,
                 nodes=self.nodes,
+                trigger_to_nodes=self.trigger_to_nodes,
+                cache=cache,
+                durability=durability_,
                 specs=self.channels,
                 output_keys=output_keys,
                 stream_keys=self.stream_channels_asis,
@@ -1270,10 +1321,16 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
                 runner = PregelRunner(
                     submit=loop.submit,
                     put_writes=loop.put_writes,
+                    timings=loop.task_timings,
                 )
                 # enable subgraph streaming
                 if subgraphs:
                     loop.config[CONF][CONFIG_KEY_STREAM] = loop.stream
+                # make cache available to subgraphs
+                if cache is not None:
+                    loop.config[CONF][CONFIG_KEY_CACHE] = cache
+                # subgraphs persist their checkpoints like their parent
+                loop.config[CONF][CONFIG_KEY_DURABILITY] = durability_
                 # enable concurrent streaming
                 if subgraphs or "messages" in stream_modes or "custom" in stream_modes:
                     # we are careful to have a single waiter live at any one time
@@ -1304,6 +1361,12 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
                     interrupt_after=interrupt_after_,
                     manager=run_manager,
                 ):
+                    # wait for the previous step to be saved
+                    if durability_ == "sync":
+                        loop.flush_puts()
+                    # replay cached writes, skipping execution of those tasks
+                    for task in loop.match_cached_writes():
+                        runner.commit(task, None)
                     for _ in runner.tick(
                         loop.tasks.values(),
                         timeout=self.step_timeout,
@@ -1338,6 +1401,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
         subgraphs: bool = False,
+        durability: Optional[Durability] = None,
     ) -> AsyncIterator[Union[dict[str, Any], Any]]:
         """Stream graph steps for a single input.
 
@@ -1355,6 +1419,12 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
             interrupt_after: Nodes to interrupt after, defaults to all nodes in the graph.
             debug: Whether to print debug information during execution, defaults to False.
             subgraphs: Whether to stream subgraphs, defaults to False.
+            durability: When to persist checkpoints, defaults to "async".
+                Options are 'sync', 'async', and 'exit'.
+                sync: Save each checkpoint before starting the next step.
+                async: Save each checkpoint in the background, while the next step runs.
+                exit: Save only the last checkpoint, when the run finishes, is interrupted or fails.
+                See `langgraph.types.Durability` for what is lost in a crash.
 
         Yields:
             The output of each step in the graph. The output shape depends on the stream_mode.
@@ -1452,6 +1522,8 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
                 interrupt_after_,
                 checkpointer,
                 store,
+                cache,
+                durability_,
             ) = self._defaults(
                 config,
                 stream_mode=stream_mode,
@@ -1459,6 +1531,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
                 interrupt_before=interrupt_before,
                 interrupt_after=interrupt_after,
                 debug=debug,
+                durability=durability,
             )
             # set up messages stream mode
             if "messages" in stream_modes:
@@ -1477,6 +1550,9 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
                 store=store,
                 checkpointer=checkpointer,
                 nodes=self.nodes,
+                trigger_to_nodes=self.trigger_to_nodes,
+                cache=cache,
+                durability=durability_,
                 specs=self.channels,
                 output_keys=output_keys,
                 stream_keys=self.stream_channels_asis,
@@ -1486,10 +1562,16 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
                     submit=loop.submit,
                     put_writes=loop.put_writes,
                     use_astream=do_stream is not None,
+                    timings=loop.task_timings,
                 )
                 # enable subgraph streaming
                 if subgraphs:
                     loop.config[CONF][CONFIG_KEY_STREAM] = loop.stream
+                # make cache available to subgraphs
+                if cache is not None:
+                    loop.config[CONF][CONFIG_KEY_CACHE] = cache
+                # subgraphs persist their checkpoints like their parent
+                loop.config[CONF][CONFIG_KEY_DURABILITY] = durability_
                 # enable concurrent streaming
                 if subgraphs or "messages" in stream_modes or "custom" in stream_modes:
 
@@ -1508,6 +1590,12 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
                     interrupt_after=interrupt_after_,
                     manager=run_manager,
                 ):
+                    # wait for the previous step to be saved
+                    if durability_ == "sync":
+                        await loop.aflush_puts()
+                    # replay cached writes, skipping execution of those tasks
+                    for task in await loop.amatch_cached_writes():
+                        runner.commit(task, None)
                     async for _ in runner.atick(
                         loop.tasks.values(),
                         timeout=self.step_timeout,
@@ -1543,6 +1631,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
         interrupt_before: Optional[Union[All, Sequence[str]]] = None,
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
+        durability: Optional[Durability] = None,
         **kwargs: Any,
     ) -> Union[dict[str, Any], Any]:
         """Run the graph with a single input and config.
@@ -1555,6 +1644,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
             interrupt_before: Optional. The nodes to interrupt the graph run before.
             interrupt_after: Optional. The nodes to interrupt the graph run after.
             debug: Optional. Enable debug mode for the graph run.
+            durability: Optional. When to persist checkpoints, see `stream`. Default is "async".
             **kwargs: Additional keyword arguments to pass to the graph run.
 
         Returns:
@@ -1574,6 +1664,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
             interrupt_before=interrupt_before,
             interrupt_after=interrupt_after,
             debug=debug,
+            durability=durability,
             **kwargs,
         ):
             if stream_mode == "values":
@@ -1595,6 +1686,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
         interrupt_before: Optional[Union[All, Sequence[str]]] = None,
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
+        durability: Optional[Durability] = None,
         **kwargs: Any,
     ) -> Union[dict[str, Any], Any]:
         """Asynchronously invoke the graph on a single input.
@@ -1607,6 +1699,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
             interrupt_before: Optional. The nodes to interrupt before. Default is None.
             interrupt_after: Optional. The nodes to interrupt after. Default is None.
             debug: Optional. Whether to enable debug mode. Default is None.
+            durability: Optional. When to persist checkpoints, see `astream`. Default is "async".
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -1627,6 +1720,7 @@ class Pregel(Runnable[Union[dict[str, Any], Any], Union[dict[str, Any], Any]]):
             interrupt_before=interrupt_before,
             interrupt_after=interrupt_after,
             debug=debug,
+            durability=durability,
             **kwargs,
         ):
             if stream_mode == "values":
@@ -4,6 +4,7 @@ from hashlib import sha1
 from typing import (
     Any,
     Callable,
+    Hashable,
     Iterable,
     Iterator,
     Literal,
@@ -26,7 +27,6 @@ from langgraph.checkpoint.base import (
     BaseCheckpointSaver,
     Checkpoint,
     V,
-    copy_checkpoint,
 )
 from langgraph.constants import (
     CONF,
@@ -38,7 +38,9 @@ from langgraph.constants import (
     CONFIG_KEY_SEND,
     CONFIG_KEY_STORE,
     CONFIG_KEY_TASK_ID,
+    EMPTY_MAP,
     EMPTY_SEQ,
+    FUSED,
     INTERRUPT,
     NO_WRITES,
     NS_END,
@@ -52,12 +54,19 @@ from langgraph.constants import (
 )
 from langgraph.errors import EmptyChannelError, InvalidUpdateError
 from langgraph.managed.base import ManagedValueMapping
-from langgraph.pregel.io import read_channel, read_channels
+from langgraph.pregel.io import LazyState, read_channel, read_channels
 from langgraph.pregel.log import logger
 from langgraph.pregel.manager import ChannelsManager
 from langgraph.pregel.read import PregelNode
 from langgraph.store.base import BaseStore
-from langgraph.types import All, LoopProtocol, PregelExecutableTask, PregelTask
+from langgraph.types import (
+    All,
+    CacheKey,
+    CachePolicy,
+    LoopProtocol,
+    PregelExecutableTask,
+    PregelTask,
+)
 from langgraph.utils.config import merge_configs, patch_config
 
 GetNextVersion = Callable[[Optional[V], BaseChannel], V]
@@ -128,10 +137,14 @@ def local_read(
     config: RunnableConfig,
     select: Union[list[str], str],
     fresh: bool = False,
+    writes: Optional[Sequence[tuple[str, Any]]] = None,
 ) -> Union[dict[str, Any], Any]:
     """Function injected under CONFIG_KEY_READ in task config, to read current state.
     Used by conditional edges to read a copy of the state with reflecting the writes
-    from that node only."""
+    from that node only. Fused chains of nodes pass the `writes` of the nodes which
+    ran so far, to be reflected instead of the writes of the task."""
+    if writes is not None:
+        task = PregelTaskWrites(task.name, writes, task.triggers)
     if isinstance(select, str):
         managed_keys = []
         for c, _ in task.writes:
@@ -151,7 +164,7 @@ def local_read(
             LoopProtocol(config=config, step=step, stop=step + 1),
             skip_context=True,
         ) as (local_channels, _):
-            apply_writes(copy_checkpoint(checkpoint), local_channels, [task], None)
+            apply_writes(checkpoint.copy(), local_channels, [task], None)
             values = read_channels({**channels, **local_channels}, select)
     else:
         values = read_channels(channels, select)
@@ -181,31 +194,53 @@ def increment(current: Optional[int], channel: BaseChannel) -> int:
     return current + 1 if current is not None else 1
 
 
+def step_sensitive_channels(channels: Mapping[str, BaseChannel]) -> list[str]:
+    """Names of the channels to notify of each new step, see `step_sensitive`."""
+    return [chan for chan, channel in channels.items() if channel.step_sensitive]
+
+
 def apply_writes(
     checkpoint: Checkpoint,
     channels: Mapping[str, BaseChannel],
     tasks: Iterable[WritesProtocol],
     get_next_version: Optional[GetNextVersion],
-) -> dict[str, list[Any]]:
+    step_sensitive: Optional[Sequence[str]] = None,
+) -> tuple[dict[str, list[Any]], set[str]]:
     """Apply writes from a set of tasks (usually the tasks from a Pregel step)
     to the checkpoint and channels, and return managed values writes to be applied
-    externally."""
+    externally, along with the set of channels that were updated in this step.
+
+    `step_sensitive` is the result of `step_sensitive_channels` for the channels,
+    which callers applying writes to the same channels repeatedly compute once.
+
+    The checkpoint is updated copy-on-write: nested containers are replaced rather
+    than mutated in place, as they may be shared with snapshots of previous
+    checkpoints (see `create_checkpoint`)."""
+    channel_versions = checkpoint["channel_versions"].copy()
+    checkpoint["channel_versions"] = channel_versions
+
     # update seen versions
+    versions_seen = checkpoint["versions_seen"].copy()
     for task in tasks:
-        checkpoint["versions_seen"].setdefault(task.name, {}).update(
-            {
-                chan: checkpoint["channel_versions"][chan]
+        versions_seen[task.name] = {
+            **versions_seen.get(task.name, EMPTY_MAP),
+            **{
+                chan: channel_versions[chan]
                 for chan in task.triggers
-                if chan in checkpoint["channel_versions"]
-            }
-        )
+                if chan in channel_versions
+            },
+        }
+    checkpoint["versions_seen"] = versions_seen
 
     # Find the highest version of all channels
-    if checkpoint["channel_versions"]:
-        max_version = max(checkpoint["channel_versions"].values())
+    if channel_versions:
+        max_version = max(channel_versions.values())
     else:
         max_version = None
 
+    # Channels updated in this step, either by writes, consumption or new step
+    updated_channels: set[str] = set()
+
     # Consume all channels that were read
     for chan in {
         chan
@@ -214,57 +249,64 @@ def apply_writes(
         if chan not in RESERVED and chan in channels
     }:
         if channels[chan].consume() and get_next_version is not None:
-            checkpoint["channel_versions"][chan] = get_next_version(
+            channel_versions[chan] = get_next_version(
                 max_version,
                 channels[chan],
             )
+            updated_channels.add(chan)
 
     # clear pending sends
-    if checkpoint["pending_sends"]:
-        checkpoint["pending_sends"].clear()
+    pending_sends: list[Any] = []
+    checkpoint["pending_sends"] = pending_sends
 
     # Group writes by channel
     pending_writes_by_channel: dict[str, list[Any]] = defaultdict(list)
     pending_writes_by_managed: dict[str, list[Any]] = defaultdict(list)
     for task in tasks:
         for chan, val in task.writes:
-            if chan == NO_WRITES:
+            if chan == NO_WRITES or chan == FUSED:
                 pass
             elif chan == TASKS:
-                checkpoint["pending_sends"].append(val)
+                pending_sends.append(val)
             elif chan in channels:
                 pending_writes_by_channel[chan].append(val)
             else:
                 pending_writes_by_managed[chan].append(val)
 
     # Find the highest version of all channels
-    if checkpoint["channel_versions"]:
-        max_version = max(checkpoint["channel_versions"].values())
+    if channel_versions:
+        max_version = max(channel_versions.values())
     else:
         max_version = None
 
     # Apply writes to channels
-    updated_channels: set[str] = set()
+    written_channels: set[str] = set()
     for chan, vals in pending_writes_by_channel.items():
         if chan in channels:
             if channels[chan].update(vals) and get_next_version is not None:
-                checkpoint["channel_versions"][chan] = get_next_version(
+                channel_versions[chan] = get_next_version(
                     max_version,
                     channels[chan],
                 )
-            updated_channels.add(chan)
-
-    # Channels that weren't updated in this step are notified of a new step
-    for chan in channels:
-        if chan not in updated_channels:
-            if channels[chan].update([]) and get_next_version is not None:
-                checkpoint["channel_versions"][chan] = get_next_version(
+            written_channels.add(chan)
+    updated_channels.update(written_channels)
+
+    # Channels that weren't updated in this step are notified of a new step,
+    # skipping those for which an empty update is a no-op
+    if step_sensitive is None:
+        step_sensitive = step_sensitive_channels(channels)
+    for chan in step_sensitive:
+        if chan not in written_channels:
+            channel = channels[chan]
+            if channel.update([]) and get_next_version is not None:
+                channel_versions[chan] = get_next_version(
                     max_version,
-                    channels[chan],
+                    channel,
                 )
+                updated_channels.add(chan)
 
     # Return managed values writes to be applied externally
-    return pending_writes_by_managed
+    return pending_writes_by_managed, updated_channels
 
 
 @overload
@@ -280,6 +322,8 @@ def prepare_next_tasks(
     store: Literal[None] = None,
     checkpointer: Literal[None] = None,
     manager: Literal[None] = None,
+    trigger_to_nodes: Optional[Mapping[str, Mapping[str, int]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> dict[str, PregelTask]: ...
 
 
@@ -296,6 +340,8 @@ def prepare_next_tasks(
     store: Optional[BaseStore],
     checkpointer: Optional[BaseCheckpointSaver],
     manager: Union[None, ParentRunManager, AsyncParentRunManager],
+    trigger_to_nodes: Optional[Mapping[str, Mapping[str, int]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> dict[str, PregelExecutableTask]: ...
 
 
@@ -311,10 +357,16 @@ def prepare_next_tasks(
     store: Optional[BaseStore] = None,
     checkpointer: Optional[BaseCheckpointSaver] = None,
     manager: Union[None, ParentRunManager, AsyncParentRunManager] = None,
+    trigger_to_nodes: Optional[Mapping[str, Mapping[str, int]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> Union[dict[str, PregelTask], dict[str, PregelExecutableTask]]:
     """Prepare the set of tasks that will make up the next Pregel step.
     This is the union of all PUSH tasks (Sends) and PULL tasks (nodes triggered
-    by edges)."""
+    by edges).
+
+    When both `trigger_to_nodes` and `updated_channels` are passed, only nodes
+    subscribed to a channel updated in the previous step are considered as
+    candidates for PULL tasks, instead of checking every node in the graph."""
     tasks: dict[str, Union[PregelTask, PregelExecutableTask]] = {}
     # Consume pending packets
     for idx, _ in enumerate(checkpoint["pending_sends"]):
@@ -335,7 +387,7 @@ def prepare_next_tasks(
             tasks[task.id] = task
     # Check if any processes should be run in next step
     # If so, prepare the values to be passed to them
-    for name in processes:
+    for name in _candidate_nodes(processes, trigger_to_nodes, updated_channels):
         if task := prepare_single_task(
             (PULL, name),
             None,
@@ -354,6 +406,23 @@ def prepare_next_tasks(
     return tasks
 
 
+def _candidate_nodes(
+    processes: Mapping[str, PregelNode],
+    trigger_to_nodes: Optional[Mapping[str, Mapping[str, int]]],
+    updated_channels: Optional[set[str]],
+) -> Iterable[str]:
+    """Return the names of nodes that could be triggered in the next step."""
+    if trigger_to_nodes is None or updated_channels is None:
+        return processes
+    candidates: dict[str, int] = {}
+    for chan in updated_channels:
+        if nodes := trigger_to_nodes.get(chan):
+            candidates.update(nodes)
+    # in the order nodes were defined, as when checking every node, which is
+    # the order their writes are applied to reducers
+    return sorted(candidates, key=candidates.__getitem__)
+
+
 def prepare_single_task(
     task_path: tuple[str, Union[int, str]],
     task_id_checksum: Optional[str],
@@ -464,9 +533,14 @@ def prepare_single_task(
                     ),
                     triggers,
                     proc.retry_policy,
-                    None,
+                    proc.cache_policy,
                     task_id,
                     task_path,
+                    cache_key=_cache_key(
+                        proc.cache_policy, parent_ns, packet.node, packet.arg
+                    ),
+                    limits=_concurrency_limits(proc),
+                    batch=proc.bound if proc.batched else None,
                 )
 
         else:
@@ -572,9 +646,12 @@ def prepare_single_task(
                         ),
                         triggers,
                         proc.retry_policy,
-                        None,
+                        proc.cache_policy,
                         task_id,
                         task_path,
+                        cache_key=_cache_key(proc.cache_policy, parent_ns, name, val),
+                        limits=_concurrency_limits(proc),
+                        batch=proc.bound if proc.batched else None,
                     )
             else:
                 return PregelTask(task_id, name, task_path)
@@ -590,21 +667,30 @@ def _proc_input(
     """Prepare input for a PULL task, based on the process's channels and triggers."""
     # If all trigger channels subscribed by this process are not empty
     # then invoke the process with the values of all non-empty channels
-    if isinstance(proc.channels, dict):
+    if isinstance(proc.channels, dict) and proc.lazy:
         try:
-            val: dict[str, Any] = {}
+            for chan in proc.channels.values():
+                if chan in proc.triggers:
+                    read_channel(channels, chan, catch=False)
+        except EmptyChannelError:
+            return
+        val: Any = LazyState(channels, managed, proc.channels)
+    elif isinstance(proc.channels, dict):
+        try:
+            values: dict[str, Any] = {}
             for k, chan in proc.channels.items():
                 if chan in proc.triggers:
-                    val[k] = read_channel(channels, chan, catch=False)
+                    values[k] = read_channel(channels, chan, catch=False)
                 elif chan in channels:
                     try:
-                        val[k] = read_channel(channels, chan, catch=False)
+                        values[k] = read_channel(channels, chan, catch=False)
                     except EmptyChannelError:
                         continue
                 else:
-                    val[k] = managed[k]()
+                    values[k] = managed[k]()
         except EmptyChannelError:
             return
+        val = values
     elif isinstance(proc.channels, list):
         for chan in proc.channels:
             try:
@@ -626,6 +712,37 @@ def _proc_input(
     yield val
 
 
+def _cache_key(
+    policy: Optional[CachePolicy], parent_ns: str, name: str, input: Any
+) -> Optional[CacheKey]:
+    """Compute the cache key of a task, namespaced by the path of its node,
+    excluding task ids, so that results are shared across runs and threads."""
+    if policy is None:
+        return None
+    key = policy.key_func(input)
+    return CacheKey(
+        (
+            *(part.split(NS_END)[0] for part in parent_ns.split(NS_SEP) if part),
+            name,
+        ),
+        sha1(
+            key.encode() if isinstance(key, str) else key, usedforsecurity=False
+        ).hexdigest(),
+        policy.ttl,
+    )
+
+
+def _concurrency_limits(proc: PregelNode) -> tuple[tuple[Hashable, int], ...]:
+    """Get the (key, max concurrency) pairs limiting how many tasks of a node can
+    run at once. Node limits are keyed by the node itself, pools by their name."""
+    limits: tuple[tuple[Hashable, int], ...] = ()
+    if proc.max_concurrency is not None:
+        limits += ((proc, proc.max_concurrency),)
+    if proc.pool is not None:
+        limits += ((proc.pool.name, proc.pool.max_concurrency),)
+    return limits
+
+
 def _uuid5_str(namespace: bytes, *parts: str) -> str:
     """Generate a UUID from the SHA-1 hash of a namespace UUID and a name."""
 
@@ -29,7 +29,7 @@ from langgraph.constants import (
     NS_SEP,
     TAG_HIDDEN,
 )
-from langgraph.pregel.io import read_channels
+from langgraph.pregel.io import LazyState, read_channels
 from langgraph.pregel.utils import find_subgraph_pregel
 from langgraph.types import PregelExecutableTask, PregelTask, StateSnapshot
 from langgraph.utils.config import patch_checkpoint_map
@@ -50,6 +50,13 @@ class TaskResultPayload(TypedDict):
     result: list[tuple[str, Any]]
 
 
+class TaskCachePayload(TypedDict):
+    id: str
+    name: str
+    key: str
+    hit: bool
+
+
 class CheckpointTask(TypedDict):
     id: str
     name: str
@@ -82,12 +89,22 @@ class DebugOutputTaskResult(DebugOutputBase):
     payload: TaskResultPayload
 
 
+class DebugOutputTaskCache(DebugOutputBase):
+    type: Literal["task_cache"]
+    payload: TaskCachePayload
+
+
 class DebugOutputCheckpoint(DebugOutputBase):
     type: Literal["checkpoint"]
     payload: CheckpointPayload
 
 
-DebugOutput = Union[DebugOutputTask, DebugOutputTaskResult, DebugOutputCheckpoint]
+DebugOutput = Union[
+    DebugOutputTask,
+    DebugOutputTaskResult,
+    DebugOutputTaskCache,
+    DebugOutputCheckpoint,
+]
 
 
 TASK_NAMESPACE = UUID("6ba7b831-9dad-11d1-80b4-00c04fd430c8")
@@ -109,7 +126,11 @@ def map_debug_tasks(
             "payload": {
                 "id": task.id,
                 "name": task.name,
-                "input": task.input,
+                "input": (
+                    dict(task.input)
+                    if isinstance(task.input, LazyState)
+                    else task.input
+                ),
                 "triggers": task.triggers,
             },
         }
@@ -139,6 +160,30 @@ def map_debug_task_results(
     }
 
 
+def map_debug_task_cache(
+    step: int, task_hits: Iterable[tuple[PregelExecutableTask, bool]]
+) -> Iterator[DebugOutputTaskCache]:
+    """Produce "task_cache" events for stream_mode=debug, one per cache lookup."""
+    ts = datetime.now(timezone.utc).isoformat()
+    for task, hit in task_hits:
+        if task.cache_key is None:
+            continue
+        if task.config is not None and TAG_HIDDEN in task.config.get("tags", []):
+            continue
+
+        yield {
+            "type": "task_cache",
+            "timestamp": ts,
+            "step": step,
+            "payload": {
+                "id": task.id,
+                "name": task.name,
+                "key": task.cache_key.key,
+                "hit": hit,
+            },
+        }
+
+
 def map_debug_checkpoint(
     step: int,
     config: RunnableConfig,
@@ -0,0 +1,129 @@
+from typing import Any, Callable, Optional, Sequence, Union
+
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from langgraph.constants import CONF, CONFIG_KEY_READ, CONFIG_KEY_SEND, FUSED
+from langgraph.pregel.read import PregelNode
+from langgraph.utils.config import merge_configs, patch_config
+from langgraph.utils.runnable import RunnableCallable
+
+
+class FusedWrites:
+    """Collects the writes of the nodes of a fused chain, as if each node had
+    run in its own step: writes to `replaced` channels, which only keep the
+    values written in the last step, replace those of earlier nodes."""
+
+    __slots__ = ("replaced", "previous", "current", "nodes")
+
+    def __init__(self, replaced: frozenset[str]) -> None:
+        self.replaced = replaced
+        # writes of the nodes which already ran
+        self.previous: list[tuple[str, Any]] = []
+        # writes of the node running
+        self.current: list[tuple[str, Any]] = []
+        # writes of each node, by name
+        self.nodes: list[tuple[str, list[tuple[str, Any]]]] = []
+
+    def start(self, name: str) -> None:
+        self.previous = self.merged()
+        self.current = []
+        self.nodes.append((name, self.current))
+
+    def write(self, writes: Sequence[tuple[str, Any]]) -> None:
+        self.current.extend(writes)
+
+    def merged(self) -> list[tuple[str, Any]]:
+        if replaced := {c for c, _ in self.current if c in self.replaced}:
+            return [w for w in self.previous if w[0] not in replaced] + self.current
+        return self.previous + self.current
+
+    def read(
+        self,
+        read: Callable[..., Any],
+        select: Union[str, list[str]],
+        fresh: bool = False,
+    ) -> Any:
+        return read(select, fresh, writes=self.merged())
+
+
+def fuse_chain(
+    nodes: Sequence[tuple[str, PregelNode]], replaced: frozenset[str]
+) -> Runnable:
+    """Build a runnable running a chain of nodes one after the other in a
+    single task, each node reading the state updated by the nodes before it.
+
+    The task writes the combined updates of the nodes, followed by the writes
+    of each node under the FUSED key, to output them as separate updates."""
+
+    def configure(
+        config: RunnableConfig, name: str, node: PregelNode, writes: FusedWrites
+    ) -> RunnableConfig:
+        read = config[CONF][CONFIG_KEY_READ]
+        return patch_config(
+            merge_configs(
+                config,
+                RunnableConfig(
+                    metadata={"langgraph_node": name, **(node.metadata or {})},
+                    tags=node.tags or [],
+                ),
+            ),
+            run_name=name,
+            configurable={
+                CONFIG_KEY_SEND: writes.write,
+                CONFIG_KEY_READ: lambda select, fresh=False: writes.read(
+                    read, select, fresh
+                ),
+            },
+        )
+
+    def read_input(
+        config: RunnableConfig, node: PregelNode, writes: FusedWrites
+    ) -> Any:
+        read = config[CONF][CONFIG_KEY_READ]
+        if isinstance(node.channels, list):
+            value = writes.read(read, node.channels[0], fresh=True)
+        else:
+            value = writes.read(read, list(node.channels.values()), fresh=True)
+            value = {
+                k: value[chan] for k, chan in node.channels.items() if chan in value
+            }
+        return node.mapper(value) if node.mapper is not None else value
+
+    def commit(config: RunnableConfig, writes: FusedWrites) -> None:
+        config[CONF][CONFIG_KEY_SEND](
+            [*writes.merged(), *((FUSED, node) for node in writes.nodes)]
+        )
+
+    def run(input: Any, config: RunnableConfig) -> Any:
+        writes = FusedWrites(replaced)
+        output: Optional[Any] = None
+        for i, (name, node) in enumerate(nodes):
+            if i:
+                input = read_input(config, node, writes)
+            writes.start(name)
+            if proc := node.node:
+                output = proc.invoke(input, configure(config, name, node, writes))
+        commit(config, writes)
+        return output
+
+    async def arun(input: Any, config: RunnableConfig) -> Any:
+        writes = FusedWrites(replaced)
+        output: Optional[Any] = None
+        for i, (name, node) in enumerate(nodes):
+            if i:
+                input = read_input(config, node, writes)
+            writes.start(name)
+            if proc := node.node:
+                output = await proc.ainvoke(
+                    input, configure(config, name, node, writes)
+                )
+        commit(config, writes)
+        return output
+
+    return RunnableCallable(
+        run,
+        arun,
+        name="+".join(name for name, _ in nodes),
+        trace=False,
+        recurse=False,
+    )
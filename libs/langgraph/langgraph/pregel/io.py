@@ -1,9 +1,20 @@
-from typing import Any, Iterator, Literal, Mapping, Optional, Sequence, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
 from langchain_core.runnables.utils import AddableDict
 
 from langgraph.channels.base import BaseChannel, EmptyChannelError
-from langgraph.constants import EMPTY_SEQ, ERROR, INTERRUPT, TAG_HIDDEN
+from langgraph.checkpoint.serde.offload import OffloadedValue
+from langgraph.constants import EMPTY_SEQ, ERROR, FUSED, INTERRUPT, TAG_HIDDEN
 from langgraph.pregel.log import logger
 from langgraph.types import PregelExecutableTask
 
@@ -16,7 +27,7 @@ def read_channel(
     return_exception: bool = False,
 ) -> Any:
     try:
-        return channels[chan].get()
+        value = channels[chan].get()
     except EmptyChannelError as exc:
         if return_exception:
             return exc
@@ -24,6 +35,8 @@ def read_channel(
             return None
         else:
             raise
+    # offloaded values are loaded when first read
+    return value.load() if type(value) is OffloadedValue else value
 
 
 def read_channels(
@@ -44,6 +57,59 @@ def read_channels(
         return values
 
 
+class LazyState(Mapping[str, Any]):
+    """Read-only mapping of state keys to the values of their channels, read
+    from the channels on first access and cached for the lifetime of the task.
+
+    Passed to nodes with a lazy input, instead of a dict with the values of all
+    state keys, for nodes which only read a few keys of a wide state. Compares
+    equal to, and pickles as, the dict of all non-empty keys. Keys first read
+    after the task ended may return values written by later steps."""
+
+    __slots__ = ("_channels", "_managed", "_select", "_cache")
+
+    def __init__(
+        self,
+        channels: Mapping[str, BaseChannel],
+        managed: Mapping[str, Callable[[], Any]],
+        select: Mapping[str, str],
+    ) -> None:
+        self._channels = channels
+        self._managed = managed
+        self._select = select
+        self._cache: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        chan = self._select[key]
+        if chan in self._channels:
+            try:
+                value = self._channels[chan].get()
+                if type(value) is OffloadedValue:
+                    value = value.load()
+            except EmptyChannelError:
+                raise KeyError(key) from None
+        else:
+            value = self._managed[key]()
+        self._cache[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (k for k in self._select if k in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+
 def map_input(
     input_channels: Union[str, Sequence[str]],
     chunk: Optional[Union[dict[str, Any], Any]],
@@ -54,7 +120,7 @@ def map_input(
     elif isinstance(input_channels, str):
         yield (input_channels, chunk)
     else:
-        if not isinstance(chunk, dict):
+        if not isinstance(chunk, (dict, LazyState)):
             raise TypeError(f"Expected chunk to be a dict, got {type(chunk).__name__}")
         for k in chunk:
             if k in input_channels:
@@ -112,23 +178,31 @@ def map_output_updates(
     ]
     if not output_tasks:
         return
+    # tasks running a fused chain of nodes output the writes of each node
+    output_nodes = [
+        node
+        for t, ww in output_tasks
+        for node in (
+            [v for c, v in ww if c == FUSED] if ww[-1][0] == FUSED else [(t.name, ww)]
+        )
+    ]
     if isinstance(output_channels, str):
         updated = (
-            (task.name, value)
-            for task, writes in output_tasks
+            (name, value)
+            for name, writes in output_nodes
             for chan, value in writes
             if chan == output_channels
         )
     else:
         updated = (
             (
-                task.name,
+                name,
                 {chan: value for chan, value in writes if chan in output_channels},
             )
-            for task, writes in output_tasks
+            for name, writes in output_nodes
             if any(chan in output_channels for chan, _ in writes)
         )
-    grouped: dict[str, list[Any]] = {t.name: [] for t, _ in output_tasks}
+    grouped: dict[str, list[Any]] = {name: [] for name, _ in output_nodes}
     for node, value in updated:
         grouped[node].append(value)
     for node, value in grouped.items():
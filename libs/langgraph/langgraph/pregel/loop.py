@@ -1,5 +1,7 @@
 import asyncio
 import concurrent.futures
+import threading
+import time
 from collections import deque
 from contextlib import AsyncExitStack, ExitStack
 from types import TracebackType
@@ -24,6 +26,7 @@ from langchain_core.callbacks import AsyncParentRunManager, ParentRunManager
 from langchain_core.runnables import RunnableConfig
 from typing_extensions import ParamSpec, Self
 
+from langgraph.cache.base import BaseCache, FullKey
 from langgraph.channels.base import BaseChannel
 from langgraph.checkpoint.base import (
     BaseCheckpointSaver,
@@ -32,7 +35,6 @@ from langgraph.checkpoint.base import (
     CheckpointMetadata,
     CheckpointTuple,
     PendingWrite,
-    copy_checkpoint,
     create_checkpoint,
     empty_checkpoint,
 )
@@ -49,8 +51,10 @@ from langgraph.constants import (
     CONFIG_KEY_TASK_ID,
     EMPTY_SEQ,
     ERROR,
+    FUSED,
     INPUT,
     INTERRUPT,
+    NO_WRITES,
     NS_SEP,
     SCHEDULED,
     TAG_HIDDEN,
@@ -75,9 +79,11 @@ from langgraph.pregel.algo import (
     increment,
     prepare_next_tasks,
     should_interrupt,
+    step_sensitive_channels,
 )
 from langgraph.pregel.debug import (
     map_debug_checkpoint,
+    map_debug_task_cache,
     map_debug_task_results,
     map_debug_tasks,
     print_step_checkpoint,
@@ -97,10 +103,23 @@ from langgraph.pregel.io import (
     single,
 )
 from langgraph.pregel.manager import AsyncChannelsManager, ChannelsManager
+from langgraph.pregel.metrics import (
+    StepMetrics,
+    TaskTimings,
+    map_task_metrics,
+    measure_put,
+    measure_serializer,
+)
 from langgraph.pregel.read import PregelNode
 from langgraph.pregel.utils import get_new_channel_versions
 from langgraph.store.base import BaseStore
-from langgraph.types import All, LoopProtocol, PregelExecutableTask, StreamProtocol
+from langgraph.types import (
+    All,
+    Durability,
+    LoopProtocol,
+    PregelExecutableTask,
+    StreamProtocol,
+)
 from langgraph.utils.config import patch_configurable
 
 V = TypeVar("V")
@@ -121,34 +140,60 @@ def DuplexStream(*streams: StreamProtocol) -> StreamProtocol:
     return StreamProtocol(__call__, {mode for s in streams for mode in s.modes})
 
 
+def _writes_batch_method(
+    checkpointer: BaseCheckpointSaver, single: str, batch: str
+) -> Callable[[RunnableConfig, Sequence[tuple[str, Sequence[tuple[str, Any]]]]], Any]:
+    """Get the method used to save the writes of several tasks at once. Falls back
+    to the default implementation, which saves each task separately, if a subclass
+    overrides the single-task method but not the batch one."""
+    mro = type(checkpointer).__mro__
+
+    def owner(name: str) -> int:
+        return next(i for i, cls in enumerate(mro) if name in cls.__dict__)
+
+    if owner(single) < owner(batch):
+        return getattr(BaseCheckpointSaver, batch).__get__(checkpointer)
+    return getattr(checkpointer, batch)
+
+
 class PregelLoop(LoopProtocol):
     input: Optional[Any]
     checkpointer: Optional[BaseCheckpointSaver]
     nodes: Mapping[str, PregelNode]
+    trigger_to_nodes: Optional[Mapping[str, Mapping[str, int]]]
     specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]]
     output_keys: Union[str, Sequence[str]]
     stream_keys: Union[str, Sequence[str]]
     skip_done_tasks: bool
     is_nested: bool
+    cache: Optional[BaseCache]
+    durability: Durability
 
     checkpointer_get_next_version: GetNextVersion
     checkpointer_put_writes: Optional[
-        Callable[[RunnableConfig, Sequence[tuple[str, Any]], str], Any]
+        Callable[[RunnableConfig, Sequence[tuple[str, Sequence[tuple[str, Any]]]]], Any]
     ]
+    cache_put_writes: Callable[[Mapping[FullKey, tuple[Any, Optional[float]]]], Any]
     _checkpointer_put_after_previous: Optional[
         Callable[
             [
+                Optional[concurrent.futures.Future],
                 Optional[concurrent.futures.Future],
                 RunnableConfig,
-                Sequence[tuple[str, Any]],
-                str,
+                Checkpoint,
+                CheckpointMetadata,
                 ChannelVersions,
+                Optional[StepMetrics],
             ],
             Any,
         ]
     ]
+    _checkpointer_put_writes_after_previous: Callable[
+        [Optional[concurrent.futures.Future]], Any
+    ]
     submit: Submit
     channels: Mapping[str, BaseChannel]
+    step_sensitive: list[str]
     managed: ManagedValueMapping
     checkpoint: Checkpoint
     checkpoint_ns: tuple[str, ...]
@@ -157,6 +202,13 @@ class PregelLoop(LoopProtocol):
     checkpoint_pending_writes: List[PendingWrite]
     checkpoint_previous_versions: dict[str, Union[str, float, int]]
     prev_checkpoint_config: Optional[RunnableConfig]
+    checkpoint_id_saved: str
+    updated_channels: Optional[set[str]] = None
+    pending_puts: list[Any]
+    cache_hits: set[str]
+    step_timings: dict[str, float]
+    task_timings: Optional[TaskTimings] = None
+    tasks_ready_at: float = 0.0
 
     status: Literal[
         "pending", "done", "interrupt_before", "interrupt_after", "out_of_steps"
@@ -180,6 +232,9 @@ class PregelLoop(LoopProtocol):
         stream_keys: Union[str, Sequence[str]],
         check_subgraphs: bool = True,
         debug: bool = False,
+        trigger_to_nodes: Optional[Mapping[str, Mapping[str, int]]] = None,
+        cache: Optional[BaseCache] = None,
+        durability: Durability = "async",
     ) -> None:
         super().__init__(
             step=0,
@@ -191,6 +246,17 @@ class PregelLoop(LoopProtocol):
         self.input = input
         self.checkpointer = checkpointer
         self.nodes = nodes
+        self.trigger_to_nodes = trigger_to_nodes
+        self.cache = cache
+        self.cache_hits = set()
+        self.durability = durability
+        self.pending_puts = []
+        self.step_timings = {}
+        self.put_writes_lock = threading.Lock()
+        self.put_writes_buffer: list[
+            tuple[RunnableConfig, str, Sequence[tuple[str, Any]]]
+        ] = []
+        self._put_writes_fut: Optional[concurrent.futures.Future] = None
         self.specs = specs
         self.output_keys = output_keys
         self.stream_keys = stream_keys
@@ -202,6 +268,11 @@ class PregelLoop(LoopProtocol):
         self.debug = debug
         if self.stream is not None and CONFIG_KEY_STREAM in config[CONF]:
             self.stream = DuplexStream(self.stream, config[CONF][CONFIG_KEY_STREAM])
+        if self.stream is not None and "metrics" in self.stream.modes:
+            # filled in by the runner with the start and end time of each task
+            self.task_timings = {}
+            if checkpointer is not None:
+                measure_serializer(checkpointer)
         if not self.is_nested and config[CONF].get(CONFIG_KEY_CHECKPOINT_NS):
             self.config = patch_configurable(
                 self.config,
@@ -238,26 +309,57 @@ class PregelLoop(LoopProtocol):
         """Put writes for a task, to be read by the next tick."""
         if not writes:
             return
+        # the writes of each node of a fused chain, which follow the writes of
+        # the chain, are only kept in memory, to output an update per node
+        saved = (
+            [w for w in writes if w[0] != FUSED] or [(NO_WRITES, None)]
+            if writes[-1][0] == FUSED
+            else writes
+        )
         # save writes
-        self.checkpoint_pending_writes.extend((task_id, k, v) for k, v in writes)
-        if self.checkpointer_put_writes is not None:
+        self.checkpoint_pending_writes.extend((task_id, k, v) for k, v in saved)
+        if self.checkpointer_put_writes is not None and self.durability != "exit":
+            self._put_writes(task_id, saved)
+        # save writes to cache
+        if (
+            self.cache is not None
+            and task_id not in self.cache_hits
+            and writes[0][0] != ERROR
+            and writes[0][0] != INTERRUPT
+            and (task := self.tasks.get(task_id))
+            and task.cache_key is not None
+        ):
             self.submit(
-                self.checkpointer_put_writes,
+                self.cache_put_writes,
                 {
-                    **self.checkpoint_config,
-                    CONF: {
-                        **self.checkpoint_config[CONF],
-                        CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
-                            CONFIG_KEY_CHECKPOINT_NS, ""
-                        ),
-                        CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
-                    },
+                    (task.cache_key.ns, task.cache_key.key): (
+                        list(writes),
+                        task.cache_key.ttl,
+                    )
                 },
-                writes,
-                task_id,
             )
         # output writes
-        self._output_writes(task_id, writes)
+        self._output_writes(task_id, writes, cached=task_id in self.cache_hits)
+
+    def match_cached_writes(self) -> Sequence[PregelExecutableTask]:
+        """Look up cached writes for tasks of the current step with a cache policy.
+        Returns the tasks that hit the cache, with their writes filled in,
+        to be committed without being executed."""
+        if self.cache is None:
+            return ()
+        if pending := self._pending_cache_lookups():
+            return self._apply_cached_writes(pending, self.cache.get(tuple(pending)))
+        return ()
+
+    async def amatch_cached_writes(self) -> Sequence[PregelExecutableTask]:
+        """Async version of `match_cached_writes`."""
+        if self.cache is None:
+            return ()
+        if pending := self._pending_cache_lookups():
+            return self._apply_cached_writes(
+                pending, await self.cache.aget(tuple(pending))
+            )
+        return ()
 
     def tick(
         self,
@@ -286,12 +388,17 @@ class PregelLoop(LoopProtocol):
                     else self.stream_keys,
                 )
             # all tasks have finished
-            mv_writes = apply_writes(
+            if self.task_timings is not None:
+                start = time.perf_counter()
+            mv_writes, self.updated_channels = apply_writes(
                 self.checkpoint,
                 self.channels,
                 self.tasks.values(),
                 self.checkpointer_get_next_version,
+                self.step_sensitive,
             )
+            if self.task_timings is not None:
+                self.step_timings["apply_writes"] = time.perf_counter() - start
             # apply writes to managed values
             for key, values in mv_writes.items():
                 self._update_mv(key, values)
@@ -326,6 +433,8 @@ class PregelLoop(LoopProtocol):
             return False
 
         # prepare next tasks
+        if self.task_timings is not None:
+            start = time.perf_counter()
         self.tasks = prepare_next_tasks(
             self.checkpoint,
             self.nodes,
@@ -337,7 +446,12 @@ class PregelLoop(LoopProtocol):
             manager=manager,
             store=self.store,
             checkpointer=self.checkpointer,
+            trigger_to_nodes=self.trigger_to_nodes,
+            updated_channels=self.updated_channels,
         )
+        if self.task_timings is not None:
+            self.tasks_ready_at = time.perf_counter()
+            self.step_timings["prepare_next_tasks"] = self.tasks_ready_at - start
 
         # produce debug output
         if self._checkpointer_put_after_previous is not None:
@@ -419,6 +533,37 @@ class PregelLoop(LoopProtocol):
 
     # private
 
+    def _pending_cache_lookups(self) -> dict[FullKey, list[PregelExecutableTask]]:
+        self.cache_hits.clear()
+        pending: dict[FullKey, list[PregelExecutableTask]] = {}
+        for task in self.tasks.values():
+            if task.cache_key is not None and not task.writes:
+                pending.setdefault((task.cache_key.ns, task.cache_key.key), []).append(
+                    task
+                )
+        return pending
+
+    def _apply_cached_writes(
+        self,
+        pending: Mapping[FullKey, list[PregelExecutableTask]],
+        cached: Mapping[FullKey, Sequence[Sequence[Any]]],
+    ) -> list[PregelExecutableTask]:
+        # produce debug output
+        self._emit(
+            "debug",
+            map_debug_task_cache,
+            self.step,
+            [(task, key in cached) for key, tasks in pending.items() for task in tasks],
+        )
+        # fill in writes for cache hits
+        matched: list[PregelExecutableTask] = []
+        for key, writes in cached.items():
+            for task in pending[key]:
+                task.writes.extend((chan, val) for chan, val in writes)
+                self.cache_hits.add(task.id)
+                matched.append(task)
+        return matched
+
     def _first(self, *, input_keys: Union[str, Sequence[str]]) -> None:
         # resuming from previous checkpoint requires
         # - finding a previous checkpoint
@@ -430,11 +575,17 @@ class PregelLoop(LoopProtocol):
 
         # proceed past previous checkpoint
         if is_resuming:
-            self.checkpoint["versions_seen"].setdefault(INTERRUPT, {})
-            for k in self.channels:
-                if k in self.checkpoint["channel_versions"]:
-                    version = self.checkpoint["channel_versions"][k]
-                    self.checkpoint["versions_seen"][INTERRUPT][k] = version
+            self.checkpoint["versions_seen"] = {
+                **self.checkpoint["versions_seen"],
+                INTERRUPT: {
+                    **self.checkpoint["versions_seen"].get(INTERRUPT, {}),
+                    **{
+                        k: self.checkpoint["channel_versions"][k]
+                        for k in self.channels
+                        if k in self.checkpoint["channel_versions"]
+                    },
+                },
+            }
             # produce values output
             self._emit(
                 "values", map_output_values, self.output_keys, True, self.channels
@@ -465,11 +616,12 @@ class PregelLoop(LoopProtocol):
                 manager=None,
             )
             # apply input writes
-            mv_writes = apply_writes(
+            mv_writes, self.updated_channels = apply_writes(
                 self.checkpoint,
                 self.channels,
                 [*discard_tasks.values(), PregelTaskWrites(INPUT, input_writes, [])],
                 self.checkpointer_get_next_version,
+                self.step_sensitive,
             )
             assert not mv_writes, "Can't write to SharedValues in graph input"
             # save input checkpoint
@@ -484,25 +636,96 @@ class PregelLoop(LoopProtocol):
                 self.config, {CONFIG_KEY_RESUMING: is_resuming}
             )
 
-    def _put_checkpoint(self, metadata: CheckpointMetadata) -> None:
-        # assign step and parents
-        metadata["step"] = self.step
-        metadata["parents"] = self.config[CONF].get(CONFIG_KEY_CHECKPOINT_MAP, {})
-        # debug flag
-        if self.debug:
-            print_step_checkpoint(
-                metadata,
-                self.channels,
-                [self.stream_keys]
-                if isinstance(self.stream_keys, str)
-                else self.stream_keys,
+    def _put_writes(self, task_id: str, writes: Sequence[tuple[str, Any]]) -> None:
+        config: RunnableConfig = {
+            **self.checkpoint_config,
+            CONF: {
+                **self.checkpoint_config[CONF],
+                CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
+                    CONFIG_KEY_CHECKPOINT_NS, ""
+                ),
+                CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
+            },
+        }
+        # writes of tasks finishing close together are saved in a single call
+        # if the buffer wasn't empty, a save is already scheduled, which will
+        # include these writes, otherwise schedule one after the previous save,
+        # under the lock so that tasks finishing concurrently chain their saves
+        with self.put_writes_lock:
+            self.put_writes_buffer.append((config, task_id, writes))
+            if len(self.put_writes_buffer) > 1:
+                return
+            self._put_writes_fut = self.submit(
+                self._checkpointer_put_writes_after_previous, self._put_writes_fut
             )
-        # create new checkpoint
-        self.checkpoint = create_checkpoint(self.checkpoint, self.channels, self.step)
-        # bail if no checkpointer
-        if self._checkpointer_put_after_previous is not None:
-            self.checkpoint_metadata = metadata
+            if self.durability == "sync":
+                self.pending_puts.append(self._put_writes_fut)
+
+    def _take_put_writes(
+        self,
+    ) -> list[tuple[RunnableConfig, list[tuple[str, Sequence[tuple[str, Any]]]]]]:
+        """Take the buffered writes, grouped by the checkpoint they belong to."""
+        with self.put_writes_lock:
+            buffer, self.put_writes_buffer = self.put_writes_buffer, []
+        batches: dict[Any, tuple[RunnableConfig, list]] = {}
+        for config, task_id, writes in buffer:
+            checkpoint_id = config[CONF][CONFIG_KEY_CHECKPOINT_ID]
+            if checkpoint_id not in batches:
+                batches[checkpoint_id] = (config, [])
+            batches[checkpoint_id][1].append((task_id, writes))
+        return list(batches.values())
 
+    def _put_exit_checkpoint(self) -> None:
+        """Save the last checkpoint and its pending writes, if not saved yet
+        because of "exit" durability."""
+        if self.durability != "exit" or self._checkpointer_put_after_previous is None:
+            return
+        if self.checkpoint["id"] != self.checkpoint_id_saved:
+            self._put_checkpoint(self.checkpoint_metadata, exiting=True)
+        writes_by_task: dict[str, list[tuple[str, Any]]] = {}
+        for task_id, k, v in self.checkpoint_pending_writes:
+            writes_by_task.setdefault(task_id, []).append((k, v))
+        for task_id, writes in writes_by_task.items():
+            self._put_writes(task_id, writes)
+
+    def _put_checkpoint(
+        self, metadata: CheckpointMetadata, *, exiting: bool = False
+    ) -> None:
+        # when exiting, save the current checkpoint instead of creating a new one
+        if not exiting:
+            # assign step and parents
+            metadata["step"] = self.step
+            metadata["parents"] = self.config[CONF].get(CONFIG_KEY_CHECKPOINT_MAP, {})
+            # debug flag
+            if self.debug:
+                print_step_checkpoint(
+                    metadata,
+                    self.channels,
+                    [self.stream_keys]
+                    if isinstance(self.stream_keys, str)
+                    else self.stream_keys,
+                )
+            # create new checkpoint
+            if self.task_timings is not None:
+                start = time.perf_counter()
+            self.checkpoint = create_checkpoint(
+                self.checkpoint, self.channels, self.step
+            )
+            if self.task_timings is not None:
+                self.step_timings["create_checkpoint"] = time.perf_counter() - start
+            self.checkpoint_metadata = metadata
+        # collect metrics of steps which ran tasks, if requested
+        metrics = (
+            self._step_metrics()
+            if self.task_timings is not None
+            and not exiting
+            and metadata.get("source") == "loop"
+            else None
+        )
+        # bail if no checkpointer, or only saving on exit
+        if self._checkpointer_put_after_previous is not None and (
+            exiting or self.durability != "exit"
+        ):
             self.prev_checkpoint_config = (
                 self.checkpoint_config
                 if CONFIG_KEY_CHECKPOINT_ID in self.checkpoint_config[CONF]
@@ -519,7 +742,9 @@ class PregelLoop(LoopProtocol):
                 },
             }
 
-            channel_versions = self.checkpoint["channel_versions"].copy()
+            # checkpoints are updated copy-on-write, so the checkpoint handed to
+            # the checkpointer can share its nested values with the live one
+            channel_versions = self.checkpoint["channel_versions"]
             new_versions = get_new_channel_versions(
                 self.checkpoint_previous_versions, channel_versions
             )
@@ -528,14 +753,19 @@ class PregelLoop(LoopProtocol):
             # save it, without blocking
             # if there's a previous checkpoint save in progress, wait for it
             # ensuring checkpointers receive checkpoints in order
+            # and wait for the writes it was created from to be saved
             self._put_checkpoint_fut = self.submit(
                 self._checkpointer_put_after_previous,
                 getattr(self, "_put_checkpoint_fut", None),
+                self._put_writes_fut,
                 self.checkpoint_config,
-                copy_checkpoint(self.checkpoint),
+                self.checkpoint.copy(),
                 self.checkpoint_metadata,
                 new_versions,
+                metrics,
             )
+            if self.durability == "sync":
+                self.pending_puts.append(self._put_checkpoint_fut)
             self.checkpoint_config = {
                 **self.checkpoint_config,
                 CONF: {
@@ -543,12 +773,37 @@ class PregelLoop(LoopProtocol):
                     CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
                 },
             }
-        # increment step
-        self.step += 1
+            self.checkpoint_id_saved = self.checkpoint["id"]
+        elif metrics is not None:
+            self._emit_metrics(metrics)
+        if not exiting:
+            # increment step
+            self.step += 1
 
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         raise NotImplementedError
 
+    def _step_metrics(self) -> StepMetrics:
+        timings = cast(TaskTimings, self.task_timings)
+        metrics: StepMetrics = {
+            "step": self.step,
+            "tasks": len(self.tasks),
+            "prepare_next_tasks": self.step_timings.get("prepare_next_tasks", 0.0),
+            "apply_writes": self.step_timings.get("apply_writes", 0.0),
+            "create_checkpoint": self.step_timings.get("create_checkpoint", 0.0),
+            "serialize": None,
+            "checkpoint_size": None,
+            "checkpointer_put": None,
+            "task_timings": map_task_metrics(
+                list(self.tasks.values()), timings, self.tasks_ready_at
+            ),
+        }
+        timings.clear()
+        return metrics
+
+    def _emit_metrics(self, metrics: StepMetrics) -> None:
+        self._emit("metrics", lambda: iter([metrics]))
+
     def _suppress_interrupt(
         self,
         exc_type: Optional[Type[BaseException]],
@@ -590,13 +845,19 @@ class PregelLoop(LoopProtocol):
             ):
                 return
             if writes[0][0] != ERROR and writes[0][0] != INTERRUPT:
-                self._emit(
-                    "updates",
-                    map_output_updates,
-                    self.output_keys,
-                    [(task, writes)],
-                    cached,
-                )
+                # tasks running a fused chain of nodes output an update per node
+                for task_, writes_ in (
+                    [(task._replace(name=v[0]), v[1]) for c, v in writes if c == FUSED]
+                    if writes[-1][0] == FUSED
+                    else [(task, writes)]
+                ):
+                    self._emit(
+                        "updates",
+                        map_output_updates,
+                        self.output_keys,
+                        [(task_, writes_)],
+                        cached,
+                    )
             if not cached:
                 self._emit(
                     "debug",
@@ -622,6 +883,9 @@ class SyncPregelLoop(PregelLoop, ContextManager):
         stream_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         check_subgraphs: bool = True,
         debug: bool = False,
+        trigger_to_nodes: Optional[Mapping[str, Mapping[str, int]]] = None,
+        cache: Optional[BaseCache] = None,
+        durability: Durability = "async",
     ) -> None:
         super().__init__(
             input,
@@ -635,35 +899,67 @@ class SyncPregelLoop(PregelLoop, ContextManager):
             stream_keys=stream_keys,
             check_subgraphs=check_subgraphs,
             debug=debug,
+            trigger_to_nodes=trigger_to_nodes,
+            cache=cache,
+            durability=durability,
         )
         self.stack = ExitStack()
         if checkpointer:
             self.checkpointer_get_next_version = checkpointer.get_next_version
-            self.checkpointer_put_writes = checkpointer.put_writes
+            self.checkpointer_put_writes = _writes_batch_method(
+                checkpointer, "put_writes", "put_writes_batch"
+            )
         else:
             self.checkpointer_get_next_version = increment
             self._checkpointer_put_after_previous = None  # type: ignore[assignment]
             self.checkpointer_put_writes = None
+        if cache:
+            self.cache_put_writes = cache.set
 
     def _checkpointer_put_after_previous(
         self,
         prev: Optional[concurrent.futures.Future],
+        prev_writes: Optional[concurrent.futures.Future],
         config: RunnableConfig,
         checkpoint: Checkpoint,
         metadata: CheckpointMetadata,
         new_versions: ChannelVersions,
+        metrics: Optional[StepMetrics] = None,
     ) -> RunnableConfig:
         try:
             if prev is not None:
                 prev.result()
+            if prev_writes is not None:
+                prev_writes.result()
         finally:
-            cast(BaseCheckpointSaver, self.checkpointer).put(
-                config, checkpoint, metadata, new_versions
-            )
+            checkpointer = cast(BaseCheckpointSaver, self.checkpointer)
+            if metrics is None:
+                checkpointer.put(config, checkpoint, metadata, new_versions)
+            else:
+                with measure_put(metrics):
+                    checkpointer.put(config, checkpoint, metadata, new_versions)
+                self._emit_metrics(metrics)
+
+    def _checkpointer_put_writes_after_previous(
+        self, prev: Optional[concurrent.futures.Future]
+    ) -> None:
+        try:
+            if prev is not None:
+                prev.result()
+        finally:
+            for config, task_writes in self._take_put_writes():
+                cast(Callable, self.checkpointer_put_writes)(config, task_writes)
 
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         return self.submit(cast(WritableManagedValue, self.managed[key]).update, values)
 
+    def flush_puts(self) -> None:
+        """Wait for checkpoints and writes submitted so far to be saved,
+        used with "sync" durability before starting the next step."""
+        puts, self.pending_puts = self.pending_puts, []
+        for fut in puts:
+            fut.result()
+
     # context manager
 
     def __enter__(self) -> Self:
@@ -704,6 +1000,7 @@ class SyncPregelLoop(PregelLoop, ContextManager):
         }
         self.prev_checkpoint_config = saved.parent_config
         self.checkpoint = saved.checkpoint
+        self.checkpoint_id_saved = saved.checkpoint["id"]
         self.checkpoint_metadata = saved.metadata
         self.checkpoint_pending_writes = (
             [(str(tid), k, v) for tid, k, v in saved.pending_writes]
@@ -715,6 +1012,7 @@ class SyncPregelLoop(PregelLoop, ContextManager):
         self.channels, self.managed = self.stack.enter_context(
             ChannelsManager(self.specs, self.checkpoint, self)
         )
+        self.step_sensitive = step_sensitive_channels(self.channels)
         self.stack.push(self._suppress_interrupt)
         self.status = "pending"
         self.step = self.checkpoint_metadata["step"] + 1
@@ -729,6 +1027,8 @@ class SyncPregelLoop(PregelLoop, ContextManager):
         exc_value: Optional[BaseException],
         traceback: Optional[TracebackType],
     ) -> Optional[bool]:
+        # save the last checkpoint, if only saving on exit
+        self._put_exit_checkpoint()
         # unwind stack
         return self.stack.__exit__(exc_type, exc_value, traceback)
 
@@ -748,6 +1048,9 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         stream_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         check_subgraphs: bool = True,
         debug: bool = False,
+        trigger_to_nodes: Optional[Mapping[str, Mapping[str, int]]] = None,
+        cache: Optional[BaseCache] = None,
+        durability: Durability = "async",
     ) -> None:
         super().__init__(
             input,
@@ -761,37 +1064,68 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
             stream_keys=stream_keys,
             check_subgraphs=check_subgraphs,
             debug=debug,
+            trigger_to_nodes=trigger_to_nodes,
+            cache=cache,
+            durability=durability,
         )
         self.stack = AsyncExitStack()
         if checkpointer:
             self.checkpointer_get_next_version = checkpointer.get_next_version
-            self.checkpointer_put_writes = checkpointer.aput_writes
+            self.checkpointer_put_writes = _writes_batch_method(
+                checkpointer, "aput_writes", "aput_writes_batch"
+            )
         else:
             self.checkpointer_get_next_version = increment
             self._checkpointer_put_after_previous = None  # type: ignore[assignment]
             self.checkpointer_put_writes = None
+        if cache:
+            self.cache_put_writes = cache.aset
 
     async def _checkpointer_put_after_previous(
         self,
         prev: Optional[asyncio.Task],
+        prev_writes: Optional[asyncio.Task],
         config: RunnableConfig,
         checkpoint: Checkpoint,
         metadata: CheckpointMetadata,
         new_versions: ChannelVersions,
+        metrics: Optional[StepMetrics] = None,
     ) -> RunnableConfig:
         try:
             if prev is not None:
                 await prev
+            if prev_writes is not None:
+                await prev_writes
         finally:
-            await cast(BaseCheckpointSaver, self.checkpointer).aput(
-                config, checkpoint, metadata, new_versions
-            )
+            checkpointer = cast(BaseCheckpointSaver, self.checkpointer)
+            if metrics is None:
+                await checkpointer.aput(config, checkpoint, metadata, new_versions)
+            else:
+                with measure_put(metrics):
+                    await checkpointer.aput(config, checkpoint, metadata, new_versions)
+                self._emit_metrics(metrics)
+
+    async def _checkpointer_put_writes_after_previous(
+        self, prev: Optional[asyncio.Task]
+    ) -> None:
+        try:
+            if prev is not None:
+                await prev
+        finally:
+            for config, task_writes in self._take_put_writes():
+                await cast(Callable, self.checkpointer_put_writes)(config, task_writes)
 
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         return self.submit(
             cast(WritableManagedValue, self.managed[key]).aupdate, values
         )
 
+    async def aflush_puts(self) -> None:
+        """Async version of `flush_puts`."""
+        puts, self.pending_puts = self.pending_puts, []
+        for fut in puts:
+            await fut
+
     # context manager
 
     async def __aenter__(self) -> Self:
@@ -832,6 +1166,7 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         }
         self.prev_checkpoint_config = saved.parent_config
         self.checkpoint = saved.checkpoint
+        self.checkpoint_id_saved = saved.checkpoint["id"]
         self.checkpoint_metadata = saved.metadata
         self.checkpoint_pending_writes = (
             [(str(tid), k, v) for tid, k, v in saved.pending_writes]
@@ -843,6 +1178,7 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         self.channels, self.managed = await self.stack.enter_async_context(
             AsyncChannelsManager(self.specs, self.checkpoint, self)
         )
+        self.step_sensitive = step_sensitive_channels(self.channels)
         self.stack.push(self._suppress_interrupt)
         self.status = "pending"
         self.step = self.checkpoint_metadata["step"] + 1
@@ -858,6 +1194,8 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         exc_value: Optional[BaseException],
         traceback: Optional[TracebackType],
     ) -> Optional[bool]:
+        # save the last checkpoint, if only saving on exit
+        self._put_exit_checkpoint()
         # unwind stack
         return await asyncio.shield(
             self.stack.__aexit__(exc_type, exc_value, traceback)
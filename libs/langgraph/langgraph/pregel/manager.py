@@ -1,9 +1,12 @@
 import asyncio
 from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
-from typing import AsyncIterator, Iterator, Mapping, Union
+from typing import Any, AsyncIterator, Iterator, Mapping, Union
 
+from langgraph.channels.any_value import AnyValue
 from langgraph.channels.base import BaseChannel
+from langgraph.channels.last_value import LastValue
 from langgraph.checkpoint.base import Checkpoint
+from langgraph.checkpoint.serde.offload import OffloadedValue
 from langgraph.managed.base import (
     ConfiguredManagedValue,
     ManagedValueMapping,
@@ -36,7 +39,7 @@ def ChannelsManager(
     with ExitStack() as stack:
         yield (
             {
-                k: v.from_checkpoint(checkpoint["channel_values"].get(k))
+                k: v.from_checkpoint(_restore(v, checkpoint["channel_values"].get(k)))
                 for k, v in channel_specs.items()
             },
             ManagedValueMapping(
@@ -90,7 +93,7 @@ async def AsyncChannelsManager(
         yield (
             # channels: enter each channel with checkpoint
             {
-                k: v.from_checkpoint(checkpoint["channel_values"].get(k))
+                k: v.from_checkpoint(_restore(v, checkpoint["channel_values"].get(k)))
                 for k, v in channel_specs.items()
             },
             # managed: build mapping from spec to result
@@ -98,6 +101,14 @@ async def AsyncChannelsManager(
         )
 
 
+def _restore(channel: BaseChannel, value: Any) -> Any:
+    """Load offloaded values, except those of channels which only ever replace
+    their value, which keep them until read."""
+    if type(value) is OffloadedValue and not isinstance(channel, (LastValue, AnyValue)):
+        return value.load()
+    return value
+
+
 @contextmanager
 def noop_context() -> Iterator[None]:
     yield None
@@ -0,0 +1,167 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+    Optional,
+    Sequence,
+    TypedDict,
+    TypeVar,
+)
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.types import PregelExecutableTask
+
+T = TypeVar("T")
+
+TaskTimings = dict[str, tuple[float, float]]
+"""Start and end time of each task of the current step, by task id."""
+
+
+class TaskMetrics(TypedDict):
+    id: str
+    name: str
+    queue: float
+    """Seconds between the task being prepared and starting to run."""
+    run: float
+    """Seconds spent running the task, including retries."""
+
+
+class StepMetrics(TypedDict):
+    step: int
+    tasks: int
+    """Number of tasks of the step, including those with cached writes."""
+    prepare_next_tasks: float
+    apply_writes: float
+    create_checkpoint: float
+    serialize: Optional[float]
+    """Seconds the checkpointer spent serializing while saving the checkpoint,
+    None if not saved during the step, or not serialized with its `serde`."""
+    checkpoint_size: Optional[int]
+    """Total size in bytes of what the checkpointer serialized while saving the
+    checkpoint, None if not saved during the step, or not serialized with its
+    `serde`."""
+    checkpointer_put: Optional[float]
+    """Seconds spent saving the checkpoint, None if not saved during the step."""
+    task_timings: list[TaskMetrics]
+
+
+def map_task_metrics(
+    tasks: Sequence[PregelExecutableTask], timings: TaskTimings, ready: float
+) -> list[TaskMetrics]:
+    """Produce the timings of the tasks which ran in a step, in the order
+    they were prepared."""
+    return [
+        {
+            "id": task.id,
+            "name": task.name,
+            "queue": timings[task.id][0] - ready,
+            "run": timings[task.id][1] - timings[task.id][0],
+        }
+        for task in tasks
+        if task.id in timings
+    ]
+
+
+# seconds spent and bytes serialized by the checkpointer put being measured
+_MEASURED: ContextVar[Optional[list]] = ContextVar("measured", default=None)
+
+
+class MeasuredSerializer(SerializerProtocol):
+    """Wraps the serializer of a checkpointer to measure the values it
+    serializes while saving a checkpoint in `measure_put`, in the same thread
+    or task. Other calls are passed through as is."""
+
+    def __init__(self, serde: SerializerProtocol) -> None:
+        self.serde = serde
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.serde.dumps(obj)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        if (measured := _MEASURED.get()) is None:
+            return self.serde.dumps_typed(obj)
+        start = time.perf_counter()
+        typed = self.serde.dumps_typed(obj)
+        measured[0] += time.perf_counter() - start
+        measured[1] += len(typed[1])
+        return typed
+
+    def loads(self, data: bytes) -> Any:
+        return self.serde.loads(data)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        return self.serde.loads_typed(data)
+
+    def __getattr__(self, name: str) -> Any:
+        # eg. loads_typed_lazy of an OffloadSerializer
+        if name == "serde":  # not set yet while unpickling
+            raise AttributeError(name)
+        return getattr(self.serde, name)
+
+
+def measure_serializer(checkpointer: BaseCheckpointSaver) -> None:
+    """Wrap the serializer of the checkpointer, once, for `measure_put`."""
+    if not isinstance(checkpointer.serde, MeasuredSerializer):
+        checkpointer.serde = MeasuredSerializer(checkpointer.serde)
+
+
+@contextmanager
+def measure_put(metrics: StepMetrics) -> Iterator[None]:
+    """Record the time spent saving a checkpoint in the block, and the time
+    spent and bytes serialized by a checkpointer set up by `measure_serializer`
+    meanwhile."""
+    measured = [0.0, 0]
+    token = _MEASURED.set(measured)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics["checkpointer_put"] = time.perf_counter() - start
+        _MEASURED.reset(token)
+        if measured[1]:
+            metrics["serialize"] = measured[0]
+            metrics["checkpoint_size"] = measured[1]
+
+
+def timed(
+    func: Callable[..., T],
+    timings: TaskTimings,
+    tasks: Sequence[PregelExecutableTask],
+) -> Callable[..., T]:
+    """Wrap the function running a task, or a batch of tasks, to record
+    the start and end time of the tasks."""
+
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            for task in tasks:
+                timings[task.id] = (start, end)
+
+    return wrapper
+
+
+def atimed(
+    func: Callable[..., Awaitable[T]],
+    timings: TaskTimings,
+    tasks: Sequence[PregelExecutableTask],
+) -> Callable[..., Awaitable[T]]:
+    """Async version of `timed`."""
+
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            for task in tasks:
+                timings[task.id] = (start, end)
+
+    return wrapper
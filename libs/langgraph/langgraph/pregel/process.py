@@ -0,0 +1,120 @@
+import asyncio
+import atexit
+import concurrent.futures
+import inspect
+import multiprocessing
+import pickle
+import threading
+from typing import Any, Callable, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.constants import CONF, CONFIG_KEY_CHECKPOINTER
+from langgraph.errors import GraphInterrupt
+from langgraph.utils.runnable import KWARGS_CONFIG_KEYS, RunnableCallable
+
+_DEFAULT_SERDE = JsonPlusSerializer()
+
+_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_process_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Get the process pool shared by all process nodes, creating it on first use.
+
+    Workers are started with the "spawn" method, as forking a process that runs
+    other nodes in threads isn't safe. Therefore node functions must be importable,
+    ie. defined at the top level of a module."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = concurrent.futures.ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(shutdown_process_pool)
+        return _POOL
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the process pool shared by all process nodes, if started,
+    waiting for its workers to exit. Called on interpreter exit, a new pool is
+    started if process nodes run again."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+        atexit.unregister(shutdown_process_pool)
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _get_serde(config: RunnableConfig) -> SerializerProtocol:
+    """Serializer of the checkpointer of the graph, or the default one."""
+    checkpointer = config.get(CONF, {}).get(CONFIG_KEY_CHECKPOINTER)
+    if isinstance(checkpointer, BaseCheckpointSaver):
+        return checkpointer.serde
+    return _DEFAULT_SERDE
+
+
+def run_in_process(
+    func: Callable[[Any], Any], *, name: Optional[str] = None
+) -> RunnableCallable:
+    """Wrap a node function so that it runs in the shared process pool.
+
+    Useful for CPU-bound nodes, which would otherwise hold the GIL and serialize
+    with all other nodes of the step. The node input and output are shipped with
+    the serializer of the checkpointer of the graph, which must be picklable, or
+    the default checkpoint serializer without a checkpointer. Sync and async functions are supported, but they
+    can only accept the node input, not `config`, `writer` or `store`.
+
+    Args:
+        func: The node function, must be picklable.
+        name: The name of the node, defaults to the name of the function.
+
+    Returns:
+        A runnable that submits the function to the process pool, and returns its output.
+    """
+    name = name or getattr(func, "__name__", None)
+    params = inspect.signature(func).parameters
+    if "config" in params or any(kw in params for kw, *_ in KWARGS_CONFIG_KEYS):
+        raise ValueError(
+            f"Node '{name}' runs in a process, so it can only accept the node input."
+        )
+    try:
+        pickle.dumps(func)
+    except Exception as exc:
+        raise ValueError(
+            f"Node '{name}' runs in a process, so its function must be picklable, "
+            "ie. defined at the top level of a module."
+        ) from exc
+
+    def _invoke(input: Any, config: RunnableConfig) -> Any:
+        serde = _get_serde(config)
+        fut = get_process_pool().submit(_run, func, serde, serde.dumps_typed(input))
+        return serde.loads_typed(fut.result())
+
+    async def _ainvoke(input: Any, config: RunnableConfig) -> Any:
+        serde = _get_serde(config)
+        fut = get_process_pool().submit(_run, func, serde, serde.dumps_typed(input))
+        return serde.loads_typed(await asyncio.wrap_future(fut))
+
+    return RunnableCallable(_invoke, _ainvoke, name=name)
+
+
+def _run(
+    func: Callable[[Any], Any],
+    serde: SerializerProtocol,
+    input: tuple[str, bytes],
+) -> tuple[str, bytes]:
+    """Run a node function in a worker process."""
+    try:
+        if inspect.iscoroutinefunction(func):
+            output = asyncio.run(func(serde.loads_typed(input)))
+        else:
+            output = func(serde.loads_typed(input))
+    except GraphInterrupt as exc:
+        # subclasses such as NodeInterrupt don't round-trip through pickle
+        raise GraphInterrupt(exc.args[0]) from None
+    return serde.dumps_typed(output)
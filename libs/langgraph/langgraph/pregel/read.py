@@ -24,6 +24,7 @@ from langchain_core.runnables.utils import ConfigurableFieldSpec
 from langgraph.constants import CONF, CONFIG_KEY_READ
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.pregel.write import ChannelWrite
+from langgraph.types import CachePolicy, ResourcePool
 from langgraph.utils.config import merge_configs
 from langgraph.utils.runnable import RunnableCallable, RunnableSeq
 
@@ -139,6 +140,23 @@ class PregelNode(Runnable):
     retry_policy: Optional[RetryPolicy]
     """The retry policy to use when invoking the node."""
 
+    cache_policy: Optional[CachePolicy]
+    """The cache policy to use when invoking the node."""
+
+    max_concurrency: Optional[int]
+    """Maximum number of tasks for this node that can run at the same time."""
+
+    pool: Optional[ResourcePool]
+    """A resource pool whose concurrency limit this node shares with other nodes."""
+
+    batched: bool
+    """Whether `bound` is called once per step with a list of the inputs of all
+    tasks of this node, returning a list of outputs in the same order."""
+
+    lazy: bool
+    """Whether, when `channels` is a dict, `bound` is passed a mapping reading
+    the channels on first access, instead of a dict of all their values."""
+
     tags: Optional[Sequence[str]]
     """Tags to attach to the node for tracing."""
 
@@ -156,6 +174,11 @@ class PregelNode(Runnable):
         metadata: Optional[Mapping[str, Any]] = None,
         bound: Optional[Runnable[Any, Any]] = None,
         retry_policy: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        max_concurrency: Optional[int] = None,
+        pool: Optional[ResourcePool] = None,
+        batched: bool = False,
+        lazy: bool = False,
     ) -> None:
         self.channels = channels
         self.triggers = list(triggers)
@@ -163,6 +186,11 @@ class PregelNode(Runnable):
         self.writers = writers or []
         self.bound = bound if bound is not None else DEFAULT_BOUND
         self.retry_policy = retry_policy
+        self.cache_policy = cache_policy
+        self.max_concurrency = max_concurrency
+        self.pool = pool
+        self.batched = batched
+        self.lazy = lazy
         self.tags = tags
         self.metadata = metadata
 
@@ -191,9 +219,14 @@ class PregelNode(Runnable):
 
     @cached_property
     def node(self) -> Optional[Runnable[Any, Any]]:
-        """Get a runnable that combines `bound` and `writers`."""
+        """Get a runnable that combines `bound` and `writers`.
+        For batched nodes `bound` is called separately, so only the writers."""
         writers = self.flat_writers
-        if self.bound is DEFAULT_BOUND and not writers:
+        if self.batched:
+            if len(writers) == 1:
+                return writers[0]
+            return RunnableSeq(*writers) if writers else DEFAULT_BOUND
+        elif self.bound is DEFAULT_BOUND and not writers:
             return None
         elif self.bound is DEFAULT_BOUND and len(writers) == 1:
             return writers[0]
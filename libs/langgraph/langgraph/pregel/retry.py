@@ -2,12 +2,21 @@ import asyncio
 import logging
 import random
 import time
-from typing import Optional, Sequence
+from collections import deque
+from typing import Any, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
 
 from langgraph.constants import CONF, CONFIG_KEY_CHECKPOINT_NS, CONFIG_KEY_RESUMING
-from langgraph.errors import _SEEN_CHECKPOINT_NS, GraphInterrupt
+from langgraph.errors import (
+    _SEEN_CHECKPOINT_NS,
+    GraphDelegate,
+    GraphInterrupt,
+    InvalidUpdateError,
+)
 from langgraph.types import PregelExecutableTask, RetryPolicy
 from langgraph.utils.config import patch_configurable
+from langgraph.utils.runnable import RunnableCallable
 
 logger = logging.getLogger(__name__)
 
@@ -151,3 +160,115 @@ async def arun_with_retry(
             # clear checkpoint_ns seen (for subgraph detection)
             if checkpoint_ns := config[CONF].get(CONFIG_KEY_CHECKPOINT_NS):
                 _SEEN_CHECKPOINT_NS.discard(checkpoint_ns)
+
+
+def run_batch_with_retry(
+    tasks: Sequence[PregelExecutableTask],
+    retry_policy: Optional[RetryPolicy],
+) -> list[Optional[Exception]]:
+    """Run the tasks of a batched node with retries, calling the batch function
+    of the node once with the inputs of all tasks, then the writers of each task
+    with its own output. If that still fails, the tasks not done yet are run one
+    at a time, with their own retry policy, so that an input failing only fails
+    its own task. Returns the error each task failed with, if any."""
+    done: set[str] = set()
+    if len(tasks) > 1:
+        try:
+            run_with_retry(_batch_task(tasks, done), retry_policy)
+            return [None] * len(tasks)
+        except (GraphInterrupt, GraphDelegate):
+            raise
+        except Exception as exc:
+            _log_batch_failure(tasks, exc)
+    errors: list[Optional[Exception]] = []
+    for t in tasks:
+        try:
+            if t.id not in done:
+                run_with_retry(_batch_task((t,)), retry_policy)
+            errors.append(None)
+        except Exception as exc:
+            errors.append(exc)
+    return errors
+
+
+async def arun_batch_with_retry(
+    tasks: Sequence[PregelExecutableTask],
+    retry_policy: Optional[RetryPolicy],
+    stream: bool = False,
+) -> list[Optional[Exception]]:
+    """Run the tasks of a batched node asynchronously, as `run_batch_with_retry`."""
+    done: set[str] = set()
+    if len(tasks) > 1:
+        try:
+            await arun_with_retry(_batch_task(tasks, done), retry_policy, stream=stream)
+            return [None] * len(tasks)
+        except (GraphInterrupt, GraphDelegate):
+            raise
+        except Exception as exc:
+            _log_batch_failure(tasks, exc)
+    errors: list[Optional[Exception]] = []
+    for t in tasks:
+        try:
+            if t.id not in done:
+                await arun_with_retry(_batch_task((t,)), retry_policy, stream=stream)
+            errors.append(None)
+        except Exception as exc:
+            errors.append(exc)
+    return errors
+
+
+def _log_batch_failure(tasks: Sequence[PregelExecutableTask], exc: Exception) -> None:
+    logger.info(
+        f"Running the {len(tasks)} tasks of batched node {tasks[0].name} one at a time after {exc.__class__.__name__} {exc}",
+        exc_info=exc,
+    )
+
+
+def _batch_task(
+    tasks: Sequence[PregelExecutableTask], done: Optional[set[str]] = None
+) -> PregelExecutableTask:
+    """Combine the tasks of a batched node into a single task, which runs with
+    the config and retry policy of the first task. The ids of the tasks whose
+    writers ran in the last attempt are kept in `done`, if given."""
+    first = tasks[0]
+    assert first.batch is not None, "Task is not batched"
+    batch = first.batch
+
+    def invoke(inputs: list[Any], config: RunnableConfig) -> None:
+        for t in tasks:
+            t.writes.clear()
+        if done is not None:
+            done.clear()
+        outputs = _check_outputs(first.name, batch.invoke(inputs, config), tasks)
+        for t, output in zip(tasks, outputs):
+            t.proc.invoke(output, t.config)
+            if done is not None:
+                done.add(t.id)
+
+    async def ainvoke(inputs: list[Any], config: RunnableConfig) -> None:
+        for t in tasks:
+            t.writes.clear()
+        if done is not None:
+            done.clear()
+        outputs = _check_outputs(first.name, await batch.ainvoke(inputs, config), tasks)
+        for t, output in zip(tasks, outputs):
+            await t.proc.ainvoke(output, t.config)
+            if done is not None:
+                done.add(t.id)
+
+    return first._replace(
+        input=[t.input for t in tasks],
+        proc=RunnableCallable(invoke, ainvoke, name=first.name),
+        writes=deque(),
+    )
+
+
+def _check_outputs(
+    name: str, outputs: Any, tasks: Sequence[PregelExecutableTask]
+) -> Sequence[Any]:
+    if not isinstance(outputs, (list, tuple)) or len(outputs) != len(tasks):
+        raise InvalidUpdateError(
+            f"Batched node '{name}' must return a list with one result per input, "
+            f"expected {len(tasks)} results"
+        )
+    return outputs
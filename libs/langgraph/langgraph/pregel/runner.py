@@ -1,10 +1,14 @@
 import asyncio
 import concurrent.futures
+import threading
 import time
+from collections import deque
+from functools import partial
 from typing import (
     Any,
     AsyncIterator,
     Callable,
+    Hashable,
     Iterable,
     Iterator,
     Optional,
@@ -17,10 +21,64 @@ from typing import (
 from langgraph.constants import ERROR, INTERRUPT, NO_WRITES
 from langgraph.errors import GraphDelegate, GraphInterrupt
 from langgraph.pregel.executor import Submit
-from langgraph.pregel.retry import arun_with_retry, run_with_retry
+from langgraph.pregel.metrics import TaskTimings, atimed, timed
+from langgraph.pregel.retry import (
+    arun_batch_with_retry,
+    arun_with_retry,
+    run_batch_with_retry,
+    run_with_retry,
+)
 from langgraph.types import PregelExecutableTask, RetryPolicy
 
 
+class ConcurrencyLimiter:
+    """Tracks how many tasks are running for each concurrency limit key,
+    ie. each node with `max_concurrency` and each resource pool.
+    Shared by all runners in the process, so that limits apply across
+    concurrent runs and subgraphs."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.running: dict[Hashable, int] = {}
+        self.waiters: list[concurrent.futures.Future[None]] = []
+
+    def acquire(self, limits: Sequence[tuple[Hashable, int]]) -> bool:
+        """Take a slot for each of the limits, if all have one free."""
+        with self.lock:
+            if any(self.running.get(key, 0) >= max_ for key, max_ in limits):
+                return False
+            for key, _ in limits:
+                self.running[key] = self.running.get(key, 0) + 1
+            return True
+
+    def release(self, limits: Sequence[tuple[Hashable, int]]) -> None:
+        """Free the slots taken by `acquire`, and wake up all waiters."""
+        with self.lock:
+            for key, _ in limits:
+                if count := self.running[key] - 1:
+                    self.running[key] = count
+                else:
+                    del self.running[key]
+            waiters, self.waiters = self.waiters, []
+        for waiter in waiters:
+            if waiter.set_running_or_notify_cancel():
+                waiter.set_result(None)
+
+    def wait(self) -> concurrent.futures.Future[None]:
+        """Get a future that resolves the next time a slot is released."""
+        waiter: concurrent.futures.Future[None] = concurrent.futures.Future()
+        with self.lock:
+            self.waiters.append(waiter)
+        return waiter
+
+
+LIMITER = ConcurrencyLimiter()
+
+
+def _release(limits: Sequence[tuple[Hashable, int]], _: Any) -> None:
+    LIMITER.release(limits)
+
+
 class PregelRunner:
     """Responsible for executing a set of Pregel tasks concurrently, committing
     their writes, yielding control to caller when there is output to emit, and
@@ -32,10 +90,12 @@ class PregelRunner:
         submit: Submit,
         put_writes: Callable[[str, Sequence[tuple[str, Any]]], None],
         use_astream: bool = False,
+        timings: Optional[TaskTimings] = None,
     ) -> None:
         self.submit = submit
         self.put_writes = put_writes
         self.use_astream = use_astream
+        self.timings = timings
 
     def tick(
         self,
@@ -46,14 +106,24 @@ class PregelRunner:
         retry_policy: Optional[RetryPolicy] = None,
         get_waiter: Optional[Callable[[], concurrent.futures.Future[None]]] = None,
     ) -> Iterator[None]:
-        tasks = tuple(tasks)
+        tasks = tuple(t for t in tasks if not t.writes)
         # give control back to the caller
         yield
-        # fast path if single task with no timeout and no waiter
-        if len(tasks) == 1 and timeout is None and get_waiter is None:
+        # fast path if single task with no timeout, no waiter and no limits
+        if (
+            len(tasks) == 1
+            and timeout is None
+            and get_waiter is None
+            and not tasks[0].limits
+        ):
             t = tasks[0]
             try:
-                run_with_retry(t, retry_policy)
+                if t.batch is not None:
+                    errors = self._timed(run_batch_with_retry, (t,))((t,), retry_policy)
+                    if errors[0] is not None:
+                        raise errors[0]
+                else:
+                    self._timed(run_with_retry, (t,))(t, retry_policy)
                 self.commit(t, None)
             except Exception as exc:
                 self.commit(t, exc)
@@ -70,26 +140,42 @@ class PregelRunner:
         # execute tasks, and wait for one to fail or all to finish.
         # each task is independent from all other concurrent tasks
         # yield updates/debug output as each task finishes
-        for t in tasks:
-            if not t.writes:
-                futures[
-                    self.submit(
-                        run_with_retry,
-                        t,
-                        retry_policy,
-                        __reraise_on_exit__=reraise,
-                    )
-                ] = t
+        # tasks of batched nodes are started together, as a single call
+        # tasks over a concurrency limit are queued until a slot frees up
+        queued: deque[tuple[PregelExecutableTask, ...]] = deque()
+        for batch in _batches(tasks):
+            if futs := self._submit(batch, retry_policy, reraise):
+                futures.update(zip(futs, batch))
+            else:
+                queued.append(batch)
         all_futures = futures.copy()
         end_time = timeout + time.monotonic() if timeout else None
-        while len(futures) > (1 if get_waiter is not None else 0):
+        while len(futures) > (1 if get_waiter is not None else 0) or queued:
+            # start queued tasks, or wait for a slot to free up
+            slot_waiter: Optional[concurrent.futures.Future] = None
+            if queued:
+                slot_waiter = LIMITER.wait()
+                for _ in range(len(queued)):
+                    batch = queued.popleft()
+                    if futs := self._submit(batch, retry_policy, reraise):
+                        futures.update(zip(futs, batch))
+                        all_futures.update(zip(futs, batch))
+                    else:
+                        queued.append(batch)
             done, inflight = concurrent.futures.wait(
-                futures,
+                (*futures, slot_waiter) if slot_waiter and queued else futures,
                 return_when=concurrent.futures.FIRST_COMPLETED,
                 timeout=(max(0, end_time - time.monotonic()) if end_time else None),
             )
-            if not done:
+            if slot_waiter is not None:
+                slot_waiter.cancel()
+                done.discard(slot_waiter)
+            elif not done:
                 break  # timed out
+            if not done:
+                if end_time and time.monotonic() >= end_time:
+                    break  # timed out
+                continue  # a slot freed up, start queued tasks
             for fut in done:
                 task = futures.pop(fut)
                 if task is None:
@@ -120,14 +206,28 @@ class PregelRunner:
         get_waiter: Optional[Callable[[], asyncio.Future[None]]] = None,
     ) -> AsyncIterator[None]:
         loop = asyncio.get_event_loop()
-        tasks = tuple(tasks)
+        tasks = tuple(t for t in tasks if not t.writes)
         # give control back to the caller
         yield
-        # fast path if single task with no waiter and no timeout
-        if len(tasks) == 1 and get_waiter is None and timeout is None:
+        # fast path if single task with no waiter, no timeout and no limits
+        if (
+            len(tasks) == 1
+            and get_waiter is None
+            and timeout is None
+            and not tasks[0].limits
+        ):
             t = tasks[0]
             try:
-                await arun_with_retry(t, retry_policy, stream=self.use_astream)
+                if t.batch is not None:
+                    errors = await self._atimed(arun_batch_with_retry, (t,))(
+                        (t,), retry_policy, stream=self.use_astream
+                    )
+                    if errors[0] is not None:
+                        raise errors[0]
+                else:
+                    await self._atimed(arun_with_retry, (t,))(
+                        t, retry_policy, stream=self.use_astream
+                    )
                 self.commit(t, None)
             except Exception as exc:
                 self.commit(t, exc)
@@ -144,32 +244,42 @@ class PregelRunner:
         # execute tasks, and wait for one to fail or all to finish.
         # each task is independent from all other concurrent tasks
         # yield updates/debug output as each task finishes
-        for t in tasks:
-            if not t.writes:
-                futures[
-                    cast(
-                        asyncio.Future,
-                        self.submit(
-                            arun_with_retry,
-                            t,
-                            retry_policy,
-                            stream=self.use_astream,
-                            __name__=t.name,
-                            __cancel_on_exit__=True,
-                            __reraise_on_exit__=reraise,
-                        ),
-                    )
-                ] = t
+        # tasks of batched nodes are started together, as a single call
+        # tasks over a concurrency limit are queued until a slot frees up
+        queued: deque[tuple[PregelExecutableTask, ...]] = deque()
+        for batch in _batches(tasks):
+            if afuts := self._asubmit(batch, retry_policy, reraise):
+                futures.update(zip(afuts, batch))
+            else:
+                queued.append(batch)
         all_futures = futures.copy()
         end_time = timeout + loop.time() if timeout else None
-        while len(futures) > (1 if get_waiter is not None else 0):
+        while len(futures) > (1 if get_waiter is not None else 0) or queued:
+            # start queued tasks, or wait for a slot to free up
+            slot_waiter: Optional[asyncio.Future] = None
+            if queued:
+                slot_waiter = asyncio.wrap_future(LIMITER.wait())
+                for _ in range(len(queued)):
+                    batch = queued.popleft()
+                    if afuts := self._asubmit(batch, retry_policy, reraise):
+                        futures.update(zip(afuts, batch))
+                        all_futures.update(zip(afuts, batch))
+                    else:
+                        queued.append(batch)
             done, inflight = await asyncio.wait(
-                futures,
+                (*futures, slot_waiter) if slot_waiter and queued else futures,
                 return_when=asyncio.FIRST_COMPLETED,
                 timeout=(max(0, end_time - loop.time()) if end_time else None),
             )
-            if not done:
+            if slot_waiter is not None:
+                slot_waiter.cancel()
+                done.discard(slot_waiter)
+            elif not done:
                 break  # timed out
+            if not done:
+                if end_time and loop.time() >= end_time:
+                    break  # timed out
+                continue  # a slot freed up, start queued tasks
             for fut in done:
                 task = futures.pop(fut)
                 if task is None:
@@ -195,6 +305,94 @@ class PregelRunner:
             all_futures, timeout_exc_cls=asyncio.TimeoutError, panic=reraise
         )
 
+    def _submit(
+        self,
+        tasks: tuple[PregelExecutableTask, ...],
+        retry_policy: Optional[RetryPolicy],
+        reraise: bool,
+    ) -> Optional[list[concurrent.futures.Future]]:
+        """Start a task, or a batch of tasks of the same node, if its concurrency
+        limits allow it, otherwise return None. Returns one future per task."""
+        task = tasks[0]
+        if task.limits and not LIMITER.acquire(task.limits):
+            return None
+        if task.batch is None:
+            fut = self.submit(
+                self._timed(run_with_retry, tasks),
+                task,
+                retry_policy,
+                __reraise_on_exit__=reraise,
+            )
+        else:
+            fut = self.submit(
+                self._timed(run_batch_with_retry, tasks),
+                tasks,
+                retry_policy,
+                __reraise_on_exit__=reraise,
+            )
+        if task.limits:
+            fut.add_done_callback(partial(_release, task.limits))
+        if task.batch is None:
+            return [fut]
+        children: list[concurrent.futures.Future] = [
+            concurrent.futures.Future() for _ in tasks
+        ]
+        _link_batch(fut, children)
+        return children
+
+    def _asubmit(
+        self,
+        tasks: tuple[PregelExecutableTask, ...],
+        retry_policy: Optional[RetryPolicy],
+        reraise: bool,
+    ) -> Optional[list[asyncio.Future]]:
+        """Start a task, or a batch of tasks of the same node, if its concurrency
+        limits allow it, otherwise return None. Returns one future per task."""
+        task = tasks[0]
+        if task.limits and not LIMITER.acquire(task.limits):
+            return None
+        if task.batch is None:
+            fut = self.submit(
+                self._atimed(arun_with_retry, tasks),
+                task,
+                retry_policy,
+                stream=self.use_astream,
+                __name__=task.name,
+                __cancel_on_exit__=True,
+                __reraise_on_exit__=reraise,
+            )
+        else:
+            fut = self.submit(
+                self._atimed(arun_batch_with_retry, tasks),
+                tasks,
+                retry_policy,
+                stream=self.use_astream,
+                __name__=task.name,
+                __cancel_on_exit__=True,
+                __reraise_on_exit__=reraise,
+            )
+        afut = cast(asyncio.Future, fut)
+        if task.limits:
+            afut.add_done_callback(partial(_release, task.limits))
+        if task.batch is None:
+            return [afut]
+        loop = asyncio.get_running_loop()
+        children = [loop.create_future() for _ in tasks]
+        _link_batch(afut, children)
+        return children
+
+    def _timed(
+        self, func: Callable[..., Any], tasks: Sequence[PregelExecutableTask]
+    ) -> Callable[..., Any]:
+        """Record the start and end time of the tasks, if collecting metrics."""
+        return func if self.timings is None else timed(func, self.timings, tasks)
+
+    def _atimed(
+        self, func: Callable[..., Any], tasks: Sequence[PregelExecutableTask]
+    ) -> Callable[..., Any]:
+        """Async version of `_timed`."""
+        return func if self.timings is None else atimed(func, self.timings, tasks)
+
     def commit(
         self, task: PregelExecutableTask, exception: Optional[BaseException]
     ) -> None:
@@ -216,6 +414,55 @@ class PregelRunner:
             self.put_writes(task.id, task.writes)
 
 
+def _batches(
+    tasks: Sequence[PregelExecutableTask],
+) -> list[tuple[PregelExecutableTask, ...]]:
+    """Group the tasks of each batched node together, other tasks run alone."""
+    batches: dict[Any, list[PregelExecutableTask]] = {}
+    for t in tasks:
+        if t.batch is None:
+            batches[t.id] = [t]
+        else:
+            batches.setdefault(t.batch, []).append(t)
+    return [tuple(batch) for batch in batches.values()]
+
+
+def _link_batch(
+    fut: Union[concurrent.futures.Future[Any], asyncio.Future[Any]],
+    children: Union[
+        Sequence[concurrent.futures.Future[Any]], Sequence[asyncio.Future[Any]]
+    ],
+) -> None:
+    """Resolve the future of each task in a batch with the error it failed with,
+    returned by the batch, or with the error of the batch as a whole, and cancel
+    the batch if any of the tasks is cancelled."""
+
+    def resolve(fut: Any) -> None:
+        exc = _exception(fut)
+        errors = [exc] * len(children) if exc is not None else fut.result()
+        for child, error in zip(cast(Sequence[Any], children), errors):
+            if isinstance(child, asyncio.Future):
+                if child.done():
+                    continue
+                elif fut.cancelled():
+                    child.cancel()
+                    continue
+            elif not child.set_running_or_notify_cancel():
+                continue
+            if error is None:
+                child.set_result(None)
+            else:
+                child.set_exception(error)
+
+    def cancel(child: Any) -> None:
+        if child.cancelled():
+            fut.cancel()
+
+    fut.add_done_callback(resolve)
+    for child in children:
+        child.add_done_callback(cancel)
+
+
 def _should_stop_others(
     done: Union[set[concurrent.futures.Future[Any]], set[asyncio.Future[Any]]],
 ) -> bool:
@@ -1,4 +1,5 @@
-from typing import Optional
+from collections import defaultdict
+from typing import TYPE_CHECKING, Mapping, Optional
 
 from langchain_core.runnables import RunnableLambda, RunnableSequence
 from langchain_core.runnables.utils import get_function_nonlocals
@@ -6,6 +7,9 @@ from langchain_core.runnables.utils import get_function_nonlocals
 from langgraph.checkpoint.base import ChannelVersions
 from langgraph.utils.runnable import Runnable, RunnableCallable, RunnableSeq
 
+if TYPE_CHECKING:
+    from langgraph.pregel.read import PregelNode
+
 
 def get_new_channel_versions(
     previous_versions: ChannelVersions, current_versions: ChannelVersions
@@ -25,6 +29,19 @@ def get_new_channel_versions(
     return new_versions
 
 
+def get_trigger_to_nodes(
+    nodes: Mapping[str, "PregelNode"],
+) -> dict[str, Mapping[str, int]]:
+    """Build a mapping from channel name to the names of the nodes triggered
+    by that channel, in node definition order, each with its index in that
+    order."""
+    trigger_to_nodes: defaultdict[str, dict[str, int]] = defaultdict(dict)
+    for index, (name, node) in enumerate(nodes.items()):
+        for trigger in node.triggers:
+            trigger_to_nodes[trigger][name] = index
+    return dict(trigger_to_nodes)
+
+
 def find_subgraph_pregel(candidate: Runnable) -> Optional[Runnable]:
     from langgraph.pregel import Pregel
 
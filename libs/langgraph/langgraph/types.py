@@ -1,9 +1,12 @@
+import json
+import pickle
 from collections import deque
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Hashable,
     Literal,
     NamedTuple,
     Optional,
@@ -15,6 +18,7 @@ from typing import (
 from langchain_core.runnables import Runnable, RunnableConfig
 
 from langgraph.checkpoint.base import BaseCheckpointSaver, CheckpointMetadata
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
 if TYPE_CHECKING:
     from langgraph.store.base import BaseStore
@@ -26,7 +30,7 @@ Checkpointer = Union[None, Literal[False], BaseCheckpointSaver]
 """Type of the checkpointer to use for a subgraph. False disables checkpointing,
 even if the parent graph has a checkpointer. None inherits checkpointer."""
 
-StreamMode = Literal["values", "updates", "debug", "messages", "custom"]
+StreamMode = Literal["values", "updates", "debug", "messages", "custom", "metrics"]
 """How the stream method should emit outputs.
 
 - 'values': Emit all values of the state for each step.
@@ -35,6 +39,21 @@ StreamMode = Literal["values", "updates", "debug", "messages", "custom"]
 - 'debug': Emit debug events for each step.
 - 'messages': Emit LLM messages token-by-token.
 - 'custom': Emit custom output `write: StreamWriter` kwarg of each node.
+- 'metrics': Emit timings of each step, broken down into the preparation of tasks,
+    the execution of each task, and the creation and saving of the checkpoint.
+    See `langgraph.pregel.metrics.StepMetrics` for the fields.
+"""
+
+Durability = Literal["sync", "async", "exit"]
+"""When the checkpoints and task writes of a run are persisted by the checkpointer.
+
+- 'sync': Persisted at every step, before the next step starts. A crash loses
+    at most the writes of tasks still running in the current step.
+- 'async': Persisted at every step, in the background while the next step runs.
+    A crash can also lose the checkpoint of the previous step, if it was still
+    being saved, in which case the run resumes from the one before it.
+- 'exit': Persisted only when the run exits, ie. when it finishes, is
+    interrupted or fails. A crash loses all progress since the run started.
 """
 
 StreamWriter = Callable[[Any], None]
@@ -93,10 +112,74 @@ class RetryPolicy(NamedTuple):
     """List of exception classes that should trigger a retry, or a callable that returns True for exceptions that should trigger a retry."""
 
 
+class _CacheKeySerializer(JsonPlusSerializer):
+    """Encodes equal values as the same JSON in any process, with dict keys and
+    set items sorted."""
+
+    def _default(self, obj: Any) -> Union[str, dict[str, Any], list[Any]]:
+        if isinstance(obj, (set, frozenset)):
+            return self._encode_constructor_args(
+                type(obj), args=(sorted(obj, key=self.dumps),)
+            )
+        return super()._default(obj)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj,
+            default=self._default,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode()
+
+
+_CACHE_KEY_SERDE = _CacheKeySerializer()
+
+
+def default_cache_key(input: Any) -> bytes:
+    """Default cache key function, which encodes the node input as JSON, with
+    dict keys and set items sorted, and models encoded as their fields, so that
+    equal inputs have the same key in any process, eg. for persistent caches.
+
+    Inputs which can't be encoded as JSON, eg. dicts with tuple keys, are
+    pickled instead, which may give different keys in other processes."""
+    try:
+        return _CACHE_KEY_SERDE.dumps(input)
+    except (TypeError, ValueError):
+        return pickle.dumps(input, protocol=5)
+
+
 class CachePolicy(NamedTuple):
     """Configuration for caching nodes."""
 
-    pass
+    key_func: Callable[[Any], Union[str, bytes]] = default_cache_key
+    """Function to generate a cache key from the node input. Defaults to `default_cache_key`."""
+    ttl: Optional[float] = None
+    """Time to live for the cache entry, in seconds. If None, the entry never expires."""
+
+
+class CacheKey(NamedTuple):
+    """Cache key of a task, computed from its node's cache policy and input."""
+
+    ns: tuple[str, ...]
+    """Namespace of the cache entry, the path of the node in the graph."""
+    key: str
+    """Hash of the node input."""
+    ttl: Optional[float]
+    """Time to live for the cache entry, in seconds."""
+
+
+class ResourcePool(NamedTuple):
+    """A named pool of concurrency slots, shared by all nodes that use it,
+    in any graph or subgraph running in the same process.
+
+    Tasks wait for a free slot before starting. A node holding a slot should
+    not invoke a subgraph whose nodes use the same pool, as that can deadlock."""
+
+    name: str
+    """Name of the pool, nodes declaring pools with the same name share them."""
+    max_concurrency: int
+    """Maximum number of tasks using this pool that can run at the same time."""
 
 
 @dataclass
@@ -127,6 +210,9 @@ class PregelExecutableTask(NamedTuple):
     id: str
     path: tuple[Union[str, int], ...]
     scheduled: bool = False
+    cache_key: Optional[CacheKey] = None
+    limits: tuple[tuple[Hashable, int], ...] = ()
+    batch: Optional[Runnable] = None
 
 
 class StateSnapshot(NamedTuple):
@@ -0,0 +1,20 @@
+"""Node functions for tests of nodes that run in worker processes,
+which must be importable from those processes."""
+
+import os
+
+from langgraph.errors import NodeInterrupt
+
+
+def square(state: dict) -> dict:
+    return {"results": [state["item"] ** 2], "pids": [os.getpid()]}
+
+
+async def asquare(state: dict) -> dict:
+    return {"results": [state["item"] ** 2], "pids": [os.getpid()]}
+
+
+def fail_or_interrupt(state: dict) -> dict:
+    if state["item"] < 0:
+        raise NodeInterrupt("negative item")
+    raise ValueError(f"bad item {state['item']}")
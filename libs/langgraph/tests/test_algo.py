@@ -1,5 +1,21 @@
-from langgraph.checkpoint.base import empty_checkpoint
-from langgraph.pregel.algo import prepare_next_tasks
+import pytest
+
+from langgraph.channels.ephemeral_value import EphemeralValue
+from langgraph.channels.last_value import LastValue
+from langgraph.checkpoint.base import (
+    copy_checkpoint,
+    create_checkpoint,
+    empty_checkpoint,
+)
+from langgraph.constants import TASKS, Send
+from langgraph.errors import EmptyChannelError
+from langgraph.pregel import Channel, Pregel
+from langgraph.pregel.algo import (
+    PregelTaskWrites,
+    apply_writes,
+    prepare_next_tasks,
+    step_sensitive_channels,
+)
 from langgraph.pregel.manager import ChannelsManager
 
 
@@ -32,3 +48,127 @@ def test_prepare_next_tasks() -> None:
         )
 
         # TODO: add more tests
+
+
+def test_prepare_next_tasks_trigger_to_nodes() -> None:
+    app = Pregel(
+        nodes={
+            "one": Channel.subscribe_to("a") | Channel.write_to("c"),
+            "two": Channel.subscribe_to("b") | Channel.write_to("c"),
+            "three": Channel.subscribe_to(["a", "b"]) | Channel.write_to("c"),
+        },
+        channels={"a": LastValue(int), "b": LastValue(int), "c": LastValue(int)},
+        input_channels=["a", "b"],
+        output_channels="c",
+    )
+    assert app.trigger_to_nodes == {
+        "a": {"one": 0, "three": 2},
+        "b": {"two": 1, "three": 2},
+    }
+
+    config = {}
+    checkpoint = empty_checkpoint()
+    with ChannelsManager(app.channels, checkpoint, config) as (channels, managed):
+        _, updated_channels = apply_writes(
+            checkpoint,
+            channels,
+            [PregelTaskWrites("__input__", [("b", 1)], [])],
+            lambda v, _: (v or 0) + 1,
+        )
+        assert updated_channels == {"b"}
+
+        full = prepare_next_tasks(
+            checkpoint, app.nodes, channels, managed, config, 0, for_execution=False
+        )
+        indexed = prepare_next_tasks(
+            checkpoint,
+            app.nodes,
+            channels,
+            managed,
+            config,
+            0,
+            for_execution=False,
+            trigger_to_nodes=app.trigger_to_nodes,
+            updated_channels=updated_channels,
+        )
+        assert [t.name for t in full.values()] == ["two"]
+        assert indexed == full
+        # nodes not subscribed to any updated channel are skipped
+        assert (
+            prepare_next_tasks(
+                checkpoint,
+                app.nodes,
+                channels,
+                managed,
+                config,
+                0,
+                for_execution=False,
+                trigger_to_nodes=app.trigger_to_nodes,
+                updated_channels={"c"},
+            )
+            == {}
+        )
+
+
+def test_apply_writes_step_sensitive_channels() -> None:
+    checkpoint = empty_checkpoint()
+    channels = {"last": LastValue(int), "ephemeral": EphemeralValue(int)}
+    with ChannelsManager(channels, checkpoint, {}) as (channels, _):
+        _, updated_channels = apply_writes(
+            checkpoint,
+            channels,
+            [PregelTaskWrites("__input__", [("last", 1), ("ephemeral", 2)], [])],
+            lambda v, _: (v or 0) + 1,
+        )
+        assert updated_channels == {"last", "ephemeral"}
+        versions = checkpoint["channel_versions"].copy()
+
+        # next step without writes clears the ephemeral channel only
+        _, updated_channels = apply_writes(
+            checkpoint, channels, [], lambda v, _: (v or 0) + 1
+        )
+        assert updated_channels == {"ephemeral"}
+        assert checkpoint["channel_versions"]["last"] == versions["last"]
+        assert checkpoint["channel_versions"]["ephemeral"] > versions["ephemeral"]
+        assert channels["last"].get() == 1
+        with pytest.raises(EmptyChannelError):
+            channels["ephemeral"].get()
+
+        # only the channels precomputed as step sensitive are notified
+        step_sensitive = step_sensitive_channels(channels)
+        assert step_sensitive == ["ephemeral"]
+        apply_writes(
+            checkpoint,
+            channels,
+            [PregelTaskWrites("__input__", [("ephemeral", 3)], [])],
+            lambda v, _: (v or 0) + 1,
+            step_sensitive,
+        )
+        _, updated_channels = apply_writes(
+            checkpoint, channels, [], lambda v, _: (v or 0) + 1, []
+        )
+        assert updated_channels == set()
+        assert channels["ephemeral"].get() == 3
+
+
+def test_apply_writes_copy_on_write() -> None:
+    checkpoint = empty_checkpoint()
+    channels = {"a": LastValue(int), "b": LastValue(int)}
+    with ChannelsManager(channels, checkpoint, {}) as (channels, _):
+        apply_writes(
+            checkpoint,
+            channels,
+            [PregelTaskWrites("__input__", [("a", 1), (TASKS, Send("one", 1))], [])],
+            lambda v, _: (v or 0) + 1,
+        )
+        snapshot = create_checkpoint(checkpoint, channels, 0)
+        expected = copy_checkpoint(snapshot)
+
+        # writes applied to the live checkpoint don't leak into the snapshot
+        apply_writes(
+            snapshot.copy(),
+            channels,
+            [PregelTaskWrites("one", [("b", 2)], ["a"])],
+            lambda v, _: (v or 0) + 1,
+        )
+        assert snapshot == expected
@@ -1,11 +1,15 @@
+import functools
 import operator
 from typing import Sequence, Union
 
 import pytest
 
-from langgraph.channels.binop import BinaryOperatorAggregate
+from langgraph.channels.array import ArrayAggregate
+from langgraph.channels.binop import BinaryOperatorAggregate, register_bulk_reducer
 from langgraph.channels.last_value import LastValue
 from langgraph.channels.topic import Topic
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.serde.types import ListSegment, SavedSegment
 from langgraph.errors import EmptyChannelError, InvalidUpdateError
 
 pytestmark = pytest.mark.anyio
@@ -15,6 +19,7 @@ def test_last_value() -> None:
     channel = LastValue(int).from_checkpoint(None)
     assert channel.ValueType is int
     assert channel.UpdateType is int
+    assert not channel.step_sensitive
 
     with pytest.raises(EmptyChannelError):
         channel.get()
@@ -34,6 +39,7 @@ def test_topic() -> None:
     channel = Topic(str).from_checkpoint(None)
     assert channel.ValueType is Sequence[str]
     assert channel.UpdateType is Union[str, list[str]]
+    assert channel.step_sensitive
 
     assert channel.update(["a", "b"])
     assert channel.get() == ["a", "b"]
@@ -58,6 +64,7 @@ def test_topic_accumulate() -> None:
     channel = Topic(str, accumulate=True).from_checkpoint(None)
     assert channel.ValueType is Sequence[str]
     assert channel.UpdateType is Union[str, list[str]]
+    assert not channel.step_sensitive
 
     assert channel.update(["a", "b"])
     assert channel.get() == ["a", "b"]
@@ -72,10 +79,47 @@ def test_topic_accumulate() -> None:
     assert channel.get() == ["a", "b", "b", "c", "d", "d", "e"]
 
 
+def test_topic_views_and_checkpoints() -> None:
+    channel = Topic(str, accumulate=True).from_checkpoint(None)
+    assert channel.update(["a", "b"])
+    values = channel.values
+    view = channel.get()
+    checkpoint = channel.checkpoint()
+    assert channel.update([["c"]])
+    # checkpoints don't copy the values, even on later updates
+    assert channel.values is values
+    # reads and checkpoints aren't affected by later updates
+    assert view == ["a", "b"]
+    assert checkpoint == ["a", "b"]
+    assert channel.get() == ["a", "b", "c"]
+    assert channel.get() != view
+    with pytest.raises(AttributeError):
+        view.append("d")  # type: ignore[attr-defined]
+    # values written in an update with no values don't count as an update
+    assert not channel.update([[]])
+
+    # checkpoints restored from aren't modified
+    restored = Topic(str, accumulate=True).from_checkpoint(checkpoint)
+    assert restored.update(["d"])
+    assert restored.get() == ["a", "b", "d"]
+    assert checkpoint == ["a", "b"]
+    assert channel.get() == ["a", "b", "c"]
+
+    # checkpoints are saved as lists of the values they show
+    serde = JsonPlusSerializer()
+    assert serde.loads_typed(serde.dumps_typed({"a": checkpoint})) == {"a": ["a", "b"]}
+    assert serde.loads(serde.dumps(checkpoint)) == ["a", "b"]
+
+    # older checkpoints also stored the values seen
+    restored = Topic(str, accumulate=True).from_checkpoint(({"x"}, ["a", "b"]))
+    assert restored.get() == ["a", "b"]
+
+
 def test_binop() -> None:
     channel = BinaryOperatorAggregate(int, operator.add).from_checkpoint(None)
     assert channel.ValueType is int
     assert channel.UpdateType is int
+    assert not channel.step_sensitive
 
     assert channel.get() == 0
 
@@ -86,3 +130,174 @@ def test_binop() -> None:
     checkpoint = channel.checkpoint()
     channel = BinaryOperatorAggregate(int, operator.add).from_checkpoint(checkpoint)
     assert channel.get() == 10
+
+
+def test_binop_bulk() -> None:
+    def concat(left: list, right: list) -> list:
+        return left + right
+
+    calls: list[int] = []
+
+    def concat_bulk(left: list, updates: Sequence[list]) -> list:
+        calls.append(len(updates))
+        return [*left, *(item for update in updates for item in update)]
+
+    register_bulk_reducer(concat, concat_bulk)
+    channel = BinaryOperatorAggregate(list, concat).from_checkpoint(None)
+    channel.update([[1], [2, 3], [4]])
+    assert channel.get() == [1, 2, 3, 4]
+    # a single update is folded with the reducer
+    channel.update([[5]])
+    assert channel.get() == [1, 2, 3, 4, 5]
+    assert calls == [3]
+
+    # built-in bulk reducers match folding one update at a time
+    for typ, op, updates in [
+        (list, operator.add, [[1], [2, 3], []]),
+        (tuple, operator.add, [(1,), (2, 3)]),
+        (str, operator.add, ["a", "bc"]),
+        (int, operator.add, [1, 2, 3]),
+        (float, operator.add, [0.1, 0.2, 0.3]),
+        (list, operator.add, [[1], (2,), [3]]),
+        (dict, operator.or_, [{"a": 1}, {"b": 2}, {"a": 3}]),
+        (set, operator.or_, [{1}, {2}, {1, 3}]),
+    ]:
+        channel = BinaryOperatorAggregate(typ, op).from_checkpoint(None)
+        try:
+            channel.update(updates)
+        except TypeError:
+            with pytest.raises(TypeError):
+                functools.reduce(op, updates, typ())
+        else:
+            assert channel.get() == functools.reduce(op, updates, typ())
+            assert type(channel.get()) is typ
+
+
+def test_binop_list_segments() -> None:
+    channel = BinaryOperatorAggregate(list, operator.add).from_checkpoint(None)
+    channel.update([[1]])
+    first = channel.checkpoint()
+    assert isinstance(first, ListSegment)
+    assert first.prefix is None
+    # unchanged values are checkpointed as the same segment
+    assert channel.checkpoint() is first
+    # appended values extend the last checkpoint
+    channel.update([[2], [3]])
+    second = channel.checkpoint()
+    assert isinstance(second, ListSegment)
+    assert second.prefix is first.ref
+    assert second == [1, 2, 3]
+    assert first == [1]
+
+    # segments loaded by a checkpointer are only assembled when read
+    serde = JsonPlusSerializer()
+    loaded = ListSegment.load_segments(
+        serde,
+        [serde.dumps_typed([1]), serde.dumps_typed([2, 3])],
+        SavedSegment(None, "thread", "", "channel", "2", ("1",)),
+    )
+    channel = BinaryOperatorAggregate(list, operator.add).from_checkpoint(loaded)
+    assert channel.checkpoint() is loaded
+    assert loaded.ref.length is None
+    channel.update([[4]])
+    assert loaded.ref.length == 3
+    third = channel.checkpoint()
+    assert isinstance(third, ListSegment)
+    assert third.prefix is loaded.ref
+    assert third == [1, 2, 3, 4]
+
+    # other operators and values are checkpointed as is
+    channel = BinaryOperatorAggregate(list, lambda a, b: a + b).from_checkpoint(None)
+    channel.update([[1]])
+    assert type(channel.checkpoint()) is list
+    channel = BinaryOperatorAggregate(tuple, operator.add).from_checkpoint(None)
+    channel.update([(1,)])
+    assert channel.checkpoint() == (1,)
+
+
+def test_topic_segments() -> None:
+    channel = Topic(str, accumulate=True).from_checkpoint(None)
+    channel.update(["a"])
+    first = channel.checkpoint()
+    assert isinstance(first, ListSegment)
+    assert channel.checkpoint() is first
+    channel.update(["b"])
+    second = channel.checkpoint()
+    assert isinstance(second, ListSegment)
+    assert second.prefix is first.ref
+    # and so do channels restored from a checkpoint
+    channel = Topic(str, accumulate=True).from_checkpoint(second)
+    channel.update(["c"])
+    third = channel.checkpoint()
+    assert isinstance(third, ListSegment)
+    assert third.prefix is second.ref
+    assert third == ["a", "b", "c"]
+
+    # topics emptied every step don't extend earlier checkpoints
+    channel = Topic(str).from_checkpoint(None)
+    channel.update(["a"])
+    first = channel.checkpoint()
+    channel.update(["b"])
+    assert isinstance(first, ListSegment)
+    assert channel.checkpoint().prefix is None  # type: ignore[attr-defined]
+
+
+def test_array_aggregate() -> None:
+    np = pytest.importorskip("numpy")
+
+    channel = ArrayAggregate(np.ndarray, "sum").from_checkpoint(None)
+    assert not channel.step_sensitive
+    with pytest.raises(EmptyChannelError):
+        channel.get()
+    update = np.ones(3)
+    assert channel.update([update, np.arange(3), [1, 1, 1]])
+    value = channel.get()
+    assert value.tolist() == [2, 3, 4]
+    assert update.tolist() == [1, 1, 1]
+    # values read or saved are not changed by later updates
+    checkpoint = channel.checkpoint()
+    channel.update([np.ones(3)])
+    assert value.tolist() == [2, 3, 4]
+    assert checkpoint.tolist() == [2, 3, 4]
+    # later updates in the same step are applied in place
+    value = channel.value
+    channel.update([np.ones(3), np.ones(3)])
+    assert channel.value is value
+    assert channel.get().tolist() == [5, 6, 7]
+    # results of another shape or dtype replace the value
+    channel.update([np.full((2, 3), 0.5)])
+    assert channel.get().tolist() == [[5.5, 6.5, 7.5]] * 2
+    with pytest.raises(InvalidUpdateError):
+        channel.update([np.ones(4)])
+
+    channel = ArrayAggregate(np.ndarray, "max").from_checkpoint(np.array([1, 5]))
+    channel.update([np.array([3, 2]), np.array([0, 7])])
+    assert channel.get().tolist() == [3, 7]
+
+    channel = ArrayAggregate(np.ndarray, "concat").from_checkpoint(None)
+    channel.update([np.zeros((1, 2)), np.ones((2, 2)), np.full(2, 2)])
+    value = channel.get()
+    assert value.tolist() == [[0, 0], [1, 1], [1, 1], [2, 2]]
+    for i in range(100):
+        channel.update([np.full((1, 2), i)])
+    # appended rows don't change the values read earlier
+    assert value.tolist() == [[0, 0], [1, 1], [1, 1], [2, 2]]
+    assert channel.get().shape == (104, 2)
+    assert len(channel.value) < 2 * 104
+    with pytest.raises(InvalidUpdateError):
+        channel.update([np.ones(3)])
+
+    # checkpoints loaded as read-only arrays are copied before updating
+    restored = ArrayAggregate(np.ndarray, "concat").from_checkpoint(
+        np.frombuffer(np.arange(4.0).tobytes()).reshape(2, 2)
+    )
+    restored.update([np.ones(2)])
+    assert restored.get().tolist() == [[0, 1], [2, 3], [1, 1]]
+    restored = ArrayAggregate(np.ndarray, "sum").from_checkpoint(
+        np.frombuffer(np.arange(2.0).tobytes())
+    )
+    restored.update([np.ones(2)])
+    assert restored.get().tolist() == [1, 2]
+
+    with pytest.raises(ValueError, match="Unknown reducer"):
+        ArrayAggregate(np.ndarray, "prod")  # type: ignore[arg-type]
@@ -12,6 +12,9 @@ from langchain_core.messages import (
 from pydantic import BaseModel
 from pydantic.v1 import BaseModel as BaseModelV1
 
+from langgraph.channels.messages import IndexedMessages
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.serde.types import ListSegment
 from langgraph.graph import add_messages
 from langgraph.graph.message import MessagesState
 from langgraph.graph.state import END, START, StateGraph
@@ -145,6 +148,94 @@ def test_delete_all():
     assert result == expected_result
 
 
+def test_indexed_messages_channel():
+    channel = IndexedMessages(list[AnyMessage], add_messages)
+    assert channel.get() == []
+
+    updates = [
+        [HumanMessage(content="Hello", id="1"), AIMessage(content="Hi!", id="2")],
+        [AIMessage(content="Hi there!", id="2"), ("user", "How are you?")],
+        [RemoveMessage(id="1"), SystemMessage(content="New message", id="3")],
+        SystemMessage(content="Updated message", id="3"),
+        # appending the same id twice keeps both, and removes both later
+        [AIMessage(content="Once", id="4"), AIMessage(content="Twice", id="4")],
+        [RemoveMessage(id="4")],
+    ]
+    expected: list = []
+    for update in updates:
+        expected = add_messages(expected, update)
+        assert channel.update([update])
+        assert [(m.content, m.type) for m in channel.get()] == [
+            (m.content, m.type) for m in expected
+        ]
+        # restoring from a checkpoint keeps merging the same way
+        channel = channel.from_checkpoint(channel.checkpoint())
+
+    with pytest.raises(
+        ValueError, match="Attempting to delete a message with an ID that doesn't exist"
+    ):
+        channel.update([[HumanMessage(content="Bye", id="5"), RemoveMessage(id="1")]])
+    # failed updates leave the channel untouched, including earlier values
+    assert [m.content for m in channel.get()] == [m.content for m in expected]
+    with pytest.raises(ValueError, match="doesn't exist"):
+        channel.update([[HumanMessage(content="Bye", id="5")], [RemoveMessage(id="1")]])
+    assert [m.content for m in channel.get()] == [m.content for m in expected]
+    assert channel.update([AIMessage(content="Later", id="6")])
+    assert [m.content for m in channel.get()] == [
+        *(m.content for m in expected),
+        "Later",
+    ]
+    # while later values can remove messages appended by earlier ones
+    value = channel.get()
+    assert channel.update(
+        [[HumanMessage(content="Bye", id="5")], RemoveMessage(id="5")]
+    )
+    assert channel.get() == value
+    assert channel.get() is not value
+
+    # checkpoints are saved as plain lists of messages, same as with the reducer
+    serde = JsonPlusSerializer()
+    assert serde.loads_typed(serde.dumps_typed(channel.checkpoint())) == channel.get()
+
+
+def test_indexed_messages_segments():
+    channel = IndexedMessages(list[AnyMessage], add_messages)
+    channel.update([[HumanMessage(content="Hello", id="1")]])
+    first = channel.checkpoint()
+    assert isinstance(first, ListSegment)
+    assert first.prefix is None
+    # unchanged values are checkpointed as the same segment
+    assert channel.checkpoint() is first
+
+    # appended messages extend the last checkpoint
+    channel.update([[AIMessage(content="Hi!", id="2")]])
+    second = channel.checkpoint()
+    assert second.prefix is first.ref
+    assert second == [
+        HumanMessage(content="Hello", id="1"),
+        AIMessage(content="Hi!", id="2"),
+    ]
+    assert first == [HumanMessage(content="Hello", id="1")]
+
+    # and so do channels restored from it
+    channel = channel.from_checkpoint(second)
+    assert channel.checkpoint() is second
+    channel.update([[AIMessage(content="Bye", id="3")]])
+    third = channel.checkpoint()
+    assert third.prefix is second.ref
+    assert [m.content for m in third] == ["Hello", "Hi!", "Bye"]
+
+    # replaced or removed messages start a new list, leaving earlier
+    # checkpoints untouched
+    channel.update([[AIMessage(content="Hi there!", id="2")]])
+    assert channel.checkpoint().prefix is None
+    assert [m.content for m in third] == ["Hello", "Hi!", "Bye"]
+    channel.update([[AIMessage(content="Bye!", id="4")]])
+    assert channel.checkpoint().prefix is not None
+    channel.update([[RemoveMessage(id="1")]])
+    assert channel.checkpoint().prefix is None
+
+
 MESSAGES_STATE_SCHEMAS = [MessagesState]
 if IS_LANGCHAIN_CORE_030_OR_GREATER:
 
@@ -171,6 +262,7 @@ def test_messages_state(state_schema):
     graph.add_node(foo)
 
     app = graph.compile()
+    assert isinstance(app.channels["messages"], IndexedMessages)
 
     assert app.invoke({"messages": [("user", "meow")]}) == {
         "messages": [
@@ -1,7 +1,11 @@
 import enum
 import json
 import operator
+import os
 import re
+import subprocess
+import sys
+import threading
 import time
 import uuid
 import warnings
@@ -12,6 +16,7 @@ from random import randrange
 from typing import (
     Annotated,
     Any,
+    Callable,
     Dict,
     Generator,
     Iterator,
@@ -40,6 +45,7 @@ from pydantic import BaseModel
 from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
@@ -71,10 +77,19 @@ from langgraph.pregel import (
     Pregel,
     StateSnapshot,
 )
+from langgraph.pregel.process import shutdown_process_pool
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.store.base import BaseStore
 from langgraph.store.memory import InMemoryStore
-from langgraph.types import Interrupt, PregelTask, Send, StreamWriter
+from langgraph.types import (
+    CachePolicy,
+    Interrupt,
+    PregelTask,
+    ResourcePool,
+    Send,
+    StreamWriter,
+    default_cache_key,
+)
 from tests.any_str import AnyDict, AnyStr, AnyVersion, FloatBetween, UnsortedSequence
 from tests.conftest import (
     ALL_CHECKPOINTERS_SYNC,
@@ -90,6 +105,7 @@ from tests.messages import (
     _AnyIdHumanMessage,
     _AnyIdToolMessage,
 )
+from tests.process_nodes import fail_or_interrupt, square
 
 
 # define these objects to avoid importing langchain_core.agents
@@ -5815,7 +5831,7 @@ def test_root_graph(
                     content="result for query",
                     name="search_api",
                     tool_call_id="tool_call123",
-                    id="00000000-0000-4000-8000-000000000033",
+                    id="00000000-0000-4000-8000-000000000029",
                 )
             ]
         },
@@ -5838,7 +5854,7 @@ def test_root_graph(
                     content="result for another",
                     name="search_api",
                     tool_call_id="tool_call456",
-                    id="00000000-0000-4000-8000-000000000041",
+                    id="00000000-0000-4000-8000-000000000036",
                 )
             ]
         },
@@ -6438,7 +6454,7 @@ def test_root_graph(
         "__root__": [
             HumanMessage(
                 content="what is weather in sf",
-                id="00000000-0000-4000-8000-000000000070",
+                id="00000000-0000-4000-8000-000000000060",
             ),
             AIMessage(
                 content="",
@@ -6458,7 +6474,7 @@ def test_root_graph(
             ),
             AIMessage(content="answer", id="ai2"),
             AIMessage(
-                content="an extra message", id="00000000-0000-4000-8000-000000000091"
+                content="an extra message", id="00000000-0000-4000-8000-000000000077"
             ),
             HumanMessage(content="what is weather in la"),
         ],
@@ -12009,3 +12025,453 @@ def test_debug_nested_subgraphs():
                 assert stream_task["interrupts"] == history_task.interrupts
                 assert stream_task.get("error") == history_task.error
                 assert stream_task.get("state") == history_task.state
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_node_cache(request: pytest.FixtureRequest, checkpointer_name: str) -> None:
+    checkpointer: BaseCheckpointSaver = request.getfixturevalue(
+        f"checkpointer_{checkpointer_name}"
+    )
+
+    class State(TypedDict):
+        value: int
+        items: Annotated[list[str], operator.add]
+
+    calls: list[int] = []
+
+    def expensive(state: State) -> dict:
+        calls.append(state["value"])
+        return {"items": [f"computed {state['value']}"]}
+
+    def cheap(state: State) -> dict:
+        return {"items": ["cheap"]}
+
+    builder = StateGraph(State)
+    builder.add_node("expensive", expensive, cache=CachePolicy())
+    builder.add_node("cheap", cheap)
+    builder.add_edge(START, "expensive")
+    builder.add_edge("expensive", "cheap")
+    graph = builder.compile(checkpointer=checkpointer, cache=InMemoryCache())
+
+    expected = {"value": 1, "items": ["computed 1", "cheap"]}
+    assert graph.invoke({"value": 1}, {"configurable": {"thread_id": "1"}}) == expected
+    assert calls == [1]
+
+    # same input on another thread is served from the cache
+    thread2 = {"configurable": {"thread_id": "2"}}
+    events = [*graph.stream({"value": 1}, thread2, stream_mode=["updates", "debug"])]
+    assert calls == [1]
+    assert graph.get_state(thread2).values == expected
+    assert [p for m, p in events if m == "updates"] == [
+        {
+            "expensive": {"items": ["computed 1"]},
+            "__metadata__": {"cached": True},
+        },
+        {"cheap": {"items": ["cheap"]}},
+    ]
+    assert [
+        (p["payload"]["name"], p["payload"]["hit"])
+        for m, p in events
+        if m == "debug" and p["type"] == "task_cache"
+    ] == [("expensive", True)]
+
+    # different input is a cache miss
+    assert graph.invoke({"value": 2}, {"configurable": {"thread_id": "3"}}) == {
+        "value": 2,
+        "items": ["computed 2", "cheap"],
+    }
+    assert calls == [1, 2]
+
+    # clearing the cache re-runs the node
+    graph.cache.clear()
+    graph.invoke({"value": 1}, {"configurable": {"thread_id": "4"}})
+    assert calls == [1, 2, 1]
+
+
+def test_node_cache_key_func_and_ttl(mocker: MockerFixture) -> None:
+    class State(TypedDict):
+        value: int
+        tag: str
+
+    calls: list[int] = []
+
+    def node(state: State) -> dict:
+        calls.append(state["value"])
+        return {"value": state["value"] * 10}
+
+    now = mocker.patch("time.time", return_value=1000.0)
+
+    builder = StateGraph(State)
+    builder.add_node(
+        "node",
+        node,
+        cache=CachePolicy(key_func=lambda state: str(state["value"]), ttl=5),
+    )
+    builder.add_edge(START, "node")
+    graph = builder.compile(cache=InMemoryCache())
+
+    assert graph.invoke({"value": 1, "tag": "a"}) == {"value": 10, "tag": "a"}
+    # key func ignores "tag", so this is a cache hit
+    assert graph.invoke({"value": 1, "tag": "b"}) == {"value": 10, "tag": "b"}
+    assert calls == [1]
+
+    # entry expires after ttl
+    now.return_value = 1006.0
+    assert graph.invoke({"value": 1, "tag": "c"}) == {"value": 10, "tag": "c"}
+    assert calls == [1, 1]
+
+
+def test_default_cache_key() -> None:
+    class Model(BaseModel):
+        a: int
+        b: int = 0
+
+    # equal inputs have the same key, regardless of the fields set explicitly
+    # or the order of dict keys
+    assert default_cache_key(Model(a=1)) == default_cache_key(Model(a=1, b=0))
+    assert default_cache_key({"x": 1, "y": [1]}) == default_cache_key(
+        {"y": [1], "x": 1}
+    )
+    assert default_cache_key({"x": 1}) != default_cache_key({"x": 2})
+    # inputs which can't be encoded as JSON are pickled
+    assert default_cache_key({(1, 2): 3}) == default_cache_key({(1, 2): 3})
+
+    # and in other processes, where sets of strings are iterated in other orders
+    code = (
+        "import sys; from langgraph.types import default_cache_key; "
+        "sys.stdout.buffer.write(default_cache_key({'a', 'b', 'c', 'd', 'e'}))"
+    )
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONHASHSEED": str(seed)},
+            capture_output=True,
+            check=True,
+        ).stdout
+        for seed in range(3)
+    }
+    assert keys == {default_cache_key({"e", "d", "c", "b", "a"})}
+
+
+def test_process_nodes() -> None:
+    class State(TypedDict):
+        items: list[int]
+        results: Annotated[list[int], operator.add]
+        pids: Annotated[list[int], operator.add]
+
+    def fan_out(node: str) -> Callable[[State], list[Send]]:
+        return lambda state: [Send(node, {"item": i}) for i in state["items"]]
+
+    # one item at a time, so that the pool only starts a single worker
+    builder = StateGraph(State)
+    builder.add_node("square", square, executor="process")
+    builder.add_conditional_edges(START, fan_out("square"))
+    graph = builder.compile()
+
+    result = graph.invoke({"items": [2]})
+    assert result["results"] == [4]
+    assert os.getpid() not in result["pids"]
+
+    # shipped with the serializer of the checkpointer, errors and interrupts
+    # raised in the worker process are handled as usual
+    builder = StateGraph(State)
+    builder = StateGraph(State)
+    builder.add_node("fail", fail_or_interrupt, executor="process")
+    builder.add_conditional_edges(START, fan_out("fail"))
+    graph = builder.compile(checkpointer=MemorySaver())
+    with pytest.raises(ValueError, match="bad item 1"):
+        graph.invoke({"items": [1]}, {"configurable": {"thread_id": "1"}})
+
+    graph.invoke({"items": [-1]}, {"configurable": {"thread_id": "2"}})
+    assert graph.get_state({"configurable": {"thread_id": "2"}}).tasks == (
+        PregelTask(
+            AnyStr(),
+            "fail",
+            (PUSH, 0),
+            interrupts=(Interrupt("negative item"),),
+        ),
+    )
+
+    shutdown_process_pool()
+
+
+def test_process_nodes_invalid() -> None:
+    class State(TypedDict):
+        value: int
+
+    def local(state: State) -> State:
+        return state
+
+    def with_config(state: State, config: RunnableConfig) -> State:
+        return state
+
+    builder = StateGraph(State)
+    with pytest.raises(ValueError, match="must be picklable"):
+        builder.add_node("local", local, executor="process")
+    with pytest.raises(ValueError, match="only accept the node input"):
+        builder.add_node("with_config", with_config, executor="process")
+    with pytest.raises(ValueError, match="must be a function"):
+        builder.add_node("runnable", RunnableLambda(square), executor="process")
+
+
+def test_node_max_concurrency_and_pools() -> None:
+    class State(TypedDict):
+        items: list[int]
+        results: Annotated[list[int], operator.add]
+
+    running: Counter[str] = Counter()
+    max_running: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    def tracked(key: str, state: dict) -> dict:
+        with lock:
+            running[key] += 1
+            max_running[key] = max(max_running[key], running[key])
+        time.sleep(0.05)
+        with lock:
+            running[key] -= 1
+        return {"results": [state["item"]]}
+
+    def fan_out(state: State) -> list[Send]:
+        return [Send("work", {"item": item}) for item in state["items"]]
+
+    builder = StateGraph(State)
+    builder.add_node("work", lambda s: tracked("work", s), max_concurrency=2)
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile()
+
+    result = graph.invoke({"items": list(range(6))})
+    assert sorted(result["results"]) == list(range(6))
+    assert max_running["work"] == 2
+
+    # a pool is shared by all nodes using it
+    pool = ResourcePool("api", max_concurrency=1)
+
+    def tracked_pool(state: dict) -> dict:
+        return tracked("pool", state)
+
+    builder = StateGraph(State)
+    builder.add_node("a", tracked_pool, pool=pool)
+    builder.add_node("b", tracked_pool, pool=pool)
+    builder.add_conditional_edges(
+        START,
+        lambda s: [Send("a", {"item": i}) for i in s["items"]]
+        + [Send("b", {"item": -i}) for i in s["items"]],
+    )
+    graph = builder.compile()
+
+    result = graph.invoke({"items": [1, 2]})
+    assert sorted(result["results"]) == [-2, -1, 1, 2]
+    assert max_running["pool"] == 1
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        StateGraph(State).add_node("bad", tracked_pool, max_concurrency=0)
+
+
+def test_batched_node() -> None:
+    class State(TypedDict):
+        items: list[int]
+        results: Annotated[list[int], operator.add]
+
+    calls: list[list[int]] = []
+    attempts = 0
+
+    def embed(states: list[dict]) -> list[dict]:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ConnectionError("flaky")
+        calls.append([s["item"] for s in states])
+        return [{"results": [s["item"] * 10]} for s in states]
+
+    def fan_out(state: State) -> list[Send]:
+        return [Send("embed", {"item": item}) for item in state["items"]]
+
+    builder = StateGraph(State)
+    builder.add_node(
+        "embed",
+        embed,
+        batch=True,
+        retry=RetryPolicy(initial_interval=0.01, jitter=False),
+    )
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile(checkpointer=MemorySaver())
+    config = {"configurable": {"thread_id": "1"}}
+
+    assert graph.invoke({"items": [1, 2, 3]}, config) == {
+        "items": [1, 2, 3],
+        "results": [10, 20, 30],
+    }
+    assert calls == [[1, 2, 3]]
+    # each task still saves its own writes
+    history = list(graph.get_state_history(config))
+    assert [len(s.tasks) for s in history] == [0, 3, 1]
+
+    # a plain edge runs the node as a batch of one
+    builder = StateGraph(State)
+    builder.add_node("embed", lambda states: [{"results": [len(states)]}], batch=True)
+    builder.add_edge(START, "embed")
+    graph = builder.compile()
+    assert graph.invoke({"items": []}) == {"items": [], "results": [1]}
+
+    # must return one result per input
+    builder = StateGraph(State)
+    builder.add_node("embed", lambda states: [], batch=True)
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile()
+    with pytest.raises(InvalidUpdateError, match="one result per input"):
+        graph.invoke({"items": [1, 2]})
+
+    # when the batch fails, the inputs are run one at a time, so that only the
+    # tasks of failing inputs fail, and the others keep their writes
+    calls.clear()
+    bad = {2}
+
+    def embed_or_fail(states: list[dict]) -> list[dict]:
+        calls.append([s["item"] for s in states])
+        if any(s["item"] in bad for s in states):
+            raise ValueError("bad item")
+        return [{"results": [s["item"] * 10]} for s in states]
+
+    builder = StateGraph(State)
+    builder.add_node("embed", embed_or_fail, batch=True)
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile(checkpointer=MemorySaver())
+    config = {"configurable": {"thread_id": "2"}}
+    with pytest.raises(ValueError, match="bad item"):
+        graph.invoke({"items": [1, 2, 3]}, config)
+    assert calls == [[1, 2, 3], [1], [2], [3]]
+    assert [(t.result, t.error is not None) for t in graph.get_state(config).tasks] == [
+        ({"results": [10]}, False),
+        (None, True),
+        ({"results": [30]}, False),
+    ]
+    # resuming only runs the failed task
+    calls.clear()
+    bad.clear()
+    assert graph.invoke(None, config) == {
+        "items": [1, 2, 3],
+        "results": [10, 20, 30],
+    }
+    assert calls == [[2]]
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_durability(request: pytest.FixtureRequest, checkpointer_name: str) -> None:
+    checkpointer: BaseCheckpointSaver = request.getfixturevalue(
+        f"checkpointer_{checkpointer_name}"
+    )
+
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+
+    def fail_on_c(state: State) -> State:
+        if "fail" in state["items"]:
+            raise ValueError("failed")
+        return {"items": ["c"]}
+
+    builder = StateGraph(State)
+    builder.add_node("a", lambda _: {"items": ["a"]})
+    builder.add_node("b", lambda _: {"items": ["b"]})
+    builder.add_node("c", fail_on_c)
+    builder.add_edge(START, "a")
+    builder.add_edge("a", "b")
+    builder.add_edge("b", "c")
+    graph = builder.compile(checkpointer=checkpointer, interrupt_before=["c"])
+
+    def history(thread_id: str) -> list[StateSnapshot]:
+        return list(graph.get_state_history({"configurable": {"thread_id": thread_id}}))
+
+    for durability in ("sync", "async"):
+        config = {"configurable": {"thread_id": durability}}
+        graph.invoke({"items": ["x"]}, config, durability=durability)
+        graph.invoke(None, config, durability=durability)
+        assert graph.get_state(config).values == {"items": ["x", "a", "b", "c"]}
+        assert len(history(durability)) == 5
+
+    # only the interrupt and final checkpoints are saved
+    config = {"configurable": {"thread_id": "exit"}}
+    graph.invoke({"items": ["x"]}, config, durability="exit")
+    state = graph.get_state(config)
+    assert state.values == {"items": ["x", "a", "b"]}
+    assert state.next == ("c",)
+    assert len(history("exit")) == 1
+    graph.invoke(None, config, durability="exit")
+    assert graph.get_state(config).values == {"items": ["x", "a", "b", "c"]}
+    assert [s.metadata["step"] for s in history("exit")] == [3, 2]
+
+    # on failure, the last checkpoint is saved with the error
+    config = {"configurable": {"thread_id": "fail"}}
+    graph.invoke({"items": ["fail"]}, config, durability="exit")
+    with pytest.raises(ValueError, match="failed"):
+        graph.invoke(None, config, durability="exit")
+    state = graph.get_state(config)
+    assert state.next == ("c",)
+    assert state.tasks[0].error is not None
+    assert len(history("fail")) == 1
+
+
+def test_stream_metrics() -> None:
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+
+    def slow(state: State) -> State:
+        time.sleep(0.05)
+        return {"items": ["slow"]}
+
+    child = StateGraph(State)
+    child.add_node("inner", slow)
+    child.add_edge(START, "inner")
+
+    builder = StateGraph(State)
+    builder.add_node("outer", slow)
+    builder.add_node("child", child.compile())
+    builder.add_edge(START, "outer")
+    builder.add_edge(START, "child")
+    graph = builder.compile(checkpointer=MemorySaver())
+
+    config = {"configurable": {"thread_id": "1"}}
+    chunks = list(
+        graph.stream({"items": []}, config, stream_mode="metrics", subgraphs=True)
+    )
+    assert [(ns[0].split(":")[0] if ns else "", m["step"]) for ns, m in chunks] == [
+        ("", 0),
+        ("child", 0),
+        ("child", 1),
+        ("", 1),
+    ]
+    ns, metrics = chunks[-1]
+    assert metrics["tasks"] == 2
+    assert sorted(t["name"] for t in metrics["task_timings"]) == ["child", "outer"]
+    assert all(t["run"] >= 0.05 for t in metrics["task_timings"])
+    assert all(t["queue"] >= 0 for t in metrics["task_timings"])
+    assert metrics["checkpoint_size"] > 0
+    assert metrics["serialize"] is not None
+    assert metrics["checkpointer_put"] is not None
+    assert metrics["apply_writes"] > 0
+    assert metrics["create_checkpoint"] > 0
+    assert metrics["prepare_next_tasks"] > 0
+
+    # checkpoint isn't saved during the step
+    config = {"configurable": {"thread_id": "2"}}
+    *_, (mode, metrics) = graph.stream(
+        {"items": []}, config, stream_mode=["updates", "metrics"], durability="exit"
+    )
+    assert mode == "metrics"
+    assert metrics["step"] == 1
+    assert metrics["checkpoint_size"] is None
+    assert metrics["checkpointer_put"] is None
+
+    # only the values the checkpointer saves are measured
+    class BlobState(TypedDict):
+        blob: str
+        items: Annotated[list[str], operator.add]
+
+    builder = StateGraph(BlobState)
+    builder.add_node("outer", slow)
+    builder.add_edge(START, "outer")
+    graph = builder.compile(checkpointer=MemorySaver())
+    config = {"configurable": {"thread_id": "3"}}
+    chunks = list(graph.stream({"blob": "x" * 100_000}, config, stream_mode="metrics"))
+    assert chunks[0]["checkpoint_size"] > 100_000
+    assert 0 < chunks[-1]["checkpoint_size"] < 100_000
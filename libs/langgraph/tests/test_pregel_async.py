@@ -1,5 +1,6 @@
 import asyncio
 import operator
+import os
 import re
 import sys
 import uuid
@@ -37,6 +38,7 @@ from pydantic import BaseModel
 from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
@@ -59,10 +61,18 @@ from langgraph.managed.shared_value import SharedValue
 from langgraph.prebuilt.chat_agent_executor import create_tool_calling_executor
 from langgraph.prebuilt.tool_node import ToolNode
 from langgraph.pregel import Channel, GraphRecursionError, Pregel, StateSnapshot
+from langgraph.pregel.process import shutdown_process_pool
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.store.base import BaseStore
 from langgraph.store.memory import InMemoryStore
-from langgraph.types import Interrupt, PregelTask, Send, StreamWriter
+from langgraph.types import (
+    CachePolicy,
+    Interrupt,
+    PregelTask,
+    ResourcePool,
+    Send,
+    StreamWriter,
+)
 from tests.any_str import AnyDict, AnyStr, AnyVersion, FloatBetween, UnsortedSequence
 from tests.conftest import (
     ALL_CHECKPOINTERS_ASYNC,
@@ -84,6 +94,7 @@ from tests.messages import (
     _AnyIdHumanMessage,
     _AnyIdToolMessage,
 )
+from tests.process_nodes import asquare
 
 pytestmark = pytest.mark.anyio
 
@@ -10226,3 +10237,223 @@ async def test_debug_nested_subgraphs():
                 assert stream_task["interrupts"] == history_task.interrupts
                 assert stream_task.get("error") == history_task.error
                 assert stream_task.get("state") == history_task.state
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_ASYNC)
+async def test_node_cache(checkpointer_name: str) -> None:
+    class State(TypedDict):
+        items: list[int]
+        results: Annotated[list[int], operator.add]
+
+    calls: list[int] = []
+
+    def fan_out(state: State) -> list[Send]:
+        return [Send("square", {"item": item}) for item in state["items"]]
+
+    async def square(state: dict) -> dict:
+        calls.append(state["item"])
+        return {"results": [state["item"] ** 2]}
+
+    builder = StateGraph(State)
+    builder.add_node("square", square, cache=CachePolicy())
+    builder.add_conditional_edges(START, fan_out)
+
+    async with awith_checkpointer(checkpointer_name) as checkpointer:
+        graph = builder.compile(checkpointer=checkpointer, cache=InMemoryCache())
+
+        assert await graph.ainvoke(
+            {"items": [1, 2]}, {"configurable": {"thread_id": "1"}}
+        ) == {"items": [1, 2], "results": [1, 4]}
+        assert sorted(calls) == [1, 2]
+
+        events = [
+            e
+            async for e in graph.astream(
+                {"items": [2, 3]},
+                {"configurable": {"thread_id": "2"}},
+                stream_mode="debug",
+            )
+        ]
+        assert calls.count(2) == 1
+        assert calls.count(3) == 1
+        assert sorted(
+            e["payload"]["hit"] for e in events if e["type"] == "task_cache"
+        ) == [False, True]
+        assert (await graph.aget_state({"configurable": {"thread_id": "2"}})).values[
+            "results"
+        ] == [4, 9]
+
+
+async def test_process_nodes() -> None:
+    class State(TypedDict):
+        items: list[int]
+        results: Annotated[list[int], operator.add]
+        pids: Annotated[list[int], operator.add]
+
+    def fan_out(state: State) -> list[Send]:
+        return [Send("square", {"item": item}) for item in state["items"]]
+
+    builder = StateGraph(State)
+    builder.add_node("square", asquare, executor="process")
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile()
+
+    result = await graph.ainvoke({"items": [2]})
+    assert result["results"] == [4]
+    assert os.getpid() not in result["pids"]
+
+    shutdown_process_pool()
+
+
+async def test_node_max_concurrency_and_pools() -> None:
+    class State(TypedDict):
+        items: list[int]
+        results: Annotated[list[int], operator.add]
+
+    running = 0
+    max_running = 0
+
+    async def work(state: dict) -> dict:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return {"results": [state["item"]]}
+
+    pool = ResourcePool("api", max_concurrency=2)
+    builder = StateGraph(State)
+    builder.add_node("a", work, pool=pool)
+    builder.add_node("b", work, pool=pool, max_concurrency=1)
+    builder.add_conditional_edges(
+        START,
+        lambda s: [Send("a", {"item": i}) for i in s["items"]]
+        + [Send("b", {"item": -i}) for i in s["items"]],
+    )
+    graph = builder.compile()
+
+    result = await graph.ainvoke({"items": [1, 2, 3]})
+    assert sorted(result["results"]) == [-3, -2, -1, 1, 2, 3]
+    assert max_running == 2
+
+
+async def test_batched_node() -> None:
+    class State(TypedDict):
+        items: list[int]
+        results: Annotated[list[int], operator.add]
+
+    calls: list[list[int]] = []
+
+    async def embed(states: list[dict]) -> list[dict]:
+        calls.append([s["item"] for s in states])
+        return [{"results": [s["item"] * 10]} for s in states]
+
+    def fan_out(state: State) -> list[Send]:
+        return [Send("embed", {"item": item}) for item in state["items"]]
+
+    builder = StateGraph(State)
+    builder.add_node("embed", embed, batch=True)
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile()
+
+    updates = [c async for c in graph.astream({"items": [1, 2, 3]})]
+    assert calls == [[1, 2, 3]]
+    assert updates == UnsortedSequence(
+        {"embed": {"results": [10]}},
+        {"embed": {"results": [20]}},
+        {"embed": {"results": [30]}},
+    )
+
+    # when the batch fails, the inputs are run one at a time, so that only the
+    # tasks of failing inputs fail, and the others keep their writes
+    calls.clear()
+
+    async def embed_or_fail(states: list[dict]) -> list[dict]:
+        calls.append([s["item"] for s in states])
+        if any(s["item"] == 2 for s in states):
+            raise ValueError("bad item")
+        return [{"results": [s["item"] * 10]} for s in states]
+
+    builder = StateGraph(State)
+    builder.add_node("embed", embed_or_fail, batch=True)
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile(checkpointer=MemorySaver())
+    config = {"configurable": {"thread_id": "1"}}
+    with pytest.raises(ValueError, match="bad item"):
+        await graph.ainvoke({"items": [1, 2, 3]}, config)
+    assert calls == [[1, 2, 3], [1], [2], [3]]
+    assert [
+        (t.result, t.error is not None) for t in (await graph.aget_state(config)).tasks
+    ] == [({"results": [10]}, False), (None, True), ({"results": [30]}, False)]
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_ASYNC)
+async def test_durability(checkpointer_name: str) -> None:
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+
+    builder = StateGraph(State)
+    builder.add_node("a", lambda _: {"items": ["a"]})
+    builder.add_node("b", lambda _: {"items": ["b"]})
+    builder.add_edge(START, "a")
+    builder.add_edge("a", "b")
+
+    async with awith_checkpointer(checkpointer_name) as checkpointer:
+        graph = builder.compile(checkpointer=checkpointer, interrupt_before=["b"])
+
+        async def history(config: RunnableConfig) -> list[StateSnapshot]:
+            return [s async for s in graph.aget_state_history(config)]
+
+        config = {"configurable": {"thread_id": "sync"}}
+        await graph.ainvoke({"items": ["x"]}, config, durability="sync")
+        await graph.ainvoke(None, config, durability="sync")
+        assert (await graph.aget_state(config)).values == {"items": ["x", "a", "b"]}
+        assert len(await history(config)) == 4
+
+        config = {"configurable": {"thread_id": "exit"}}
+        await graph.ainvoke({"items": ["x"]}, config, durability="exit")
+        assert (await graph.aget_state(config)).next == ("b",)
+        assert len(await history(config)) == 1
+        await graph.ainvoke(None, config, durability="exit")
+        assert (await graph.aget_state(config)).values == {"items": ["x", "a", "b"]}
+        assert len(await history(config)) == 2
+
+
+async def test_stream_metrics() -> None:
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+
+    async def slow(state: State) -> State:
+        await asyncio.sleep(0.05)
+        return {"items": ["slow"]}
+
+    child = StateGraph(State)
+    child.add_node("inner", slow)
+    child.add_edge(START, "inner")
+
+    builder = StateGraph(State)
+    builder.add_node("outer", slow)
+    builder.add_node("child", child.compile())
+    builder.add_edge(START, "outer")
+    builder.add_edge(START, "child")
+    graph = builder.compile(checkpointer=MemorySaver())
+
+    config = {"configurable": {"thread_id": "1"}}
+    chunks = [
+        c
+        async for c in graph.astream(
+            {"items": []}, config, stream_mode="metrics", subgraphs=True
+        )
+    ]
+    assert [(ns[0].split(":")[0] if ns else "", m["step"]) for ns, m in chunks] == [
+        ("", 0),
+        ("child", 0),
+        ("child", 1),
+        ("", 1),
+    ]
+    ns, metrics = chunks[-1]
+    assert metrics["tasks"] == 2
+    assert sorted(t["name"] for t in metrics["task_timings"]) == ["child", "outer"]
+    assert all(t["run"] >= 0.05 for t in metrics["task_timings"])
+    assert metrics["checkpoint_size"] > 0
+    assert metrics["checkpointer_put"] is not None
@@ -1,16 +1,28 @@
 import inspect
+import operator
+import pickle
 import warnings
 from dataclasses import dataclass, field
 from typing import Annotated as Annotated2
 from typing import Any, Optional
 
 import pytest
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel as PydanticModel
+from pydantic import ValidationError as PydanticValidationError
+from pydantic import field_validator, model_validator
 from pydantic.v1 import BaseModel
 from typing_extensions import Annotated, NotRequired, Required, TypedDict
 
-from langgraph.graph.state import StateGraph, _warn_invalid_state_schema
+from langgraph.channels.array import ArrayAggregate
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.offload import FilesystemBlobStore, OffloadSerializer
+from langgraph.constants import FUSED
+from langgraph.errors import InvalidUpdateError
+from langgraph.graph.state import END, START, StateGraph, _warn_invalid_state_schema
 from langgraph.managed.shared_value import SharedValue
+from langgraph.types import RetryPolicy, Send
 
 
 class State(BaseModel):
@@ -261,3 +273,399 @@ def test_raises_invalid_managed():
             match="Invalid managed channels detected in BadOutputState: some_output_channel. Managed channels are not permitted in Input/Output schema.",
         ):
             StateGraph(_state, input=_inp, output=_outp)
+
+
+def test_node_writes_returned_keys():
+    class State(TypedDict):
+        a: int
+        b: Annotated[list, operator.add]
+        c: Optional[str]
+
+    @dataclass
+    class Update:
+        a: Optional[int] = None
+        c: Optional[str] = None
+
+    builder = StateGraph(State)
+    builder.add_node("dict", lambda state: {"b": [1], "c": None, "unknown": 2})
+    builder.add_node("model", lambda state: Update(a=state["a"] + 1))
+    builder.add_edge(START, "dict")
+    builder.add_edge("dict", "model")
+    builder.add_edge("model", END)
+    graph = builder.compile()
+
+    # only the keys returned are written, in the order returned, unknown keys
+    # are ignored, and None values are skipped for models but not for dicts
+    assert [*graph.stream({"a": 1, "c": "x"}, stream_mode="updates")] == [
+        {"dict": {"b": [1], "c": None}},
+        {"model": {"a": 2}},
+    ]
+
+    builder = StateGraph(State)
+    builder.add_node("empty", lambda state: {"unknown": 2})
+    builder.add_edge(START, "empty")
+    with pytest.raises(InvalidUpdateError, match="Must write to at least one of"):
+        builder.compile().invoke({"a": 1})
+
+    builder = StateGraph(State)
+    builder.add_node("invalid", lambda state: 1)
+    builder.add_edge(START, "invalid")
+    with pytest.raises(InvalidUpdateError, match="Expected dict, got 1"):
+        builder.compile().invoke({"a": 1})
+
+
+def test_array_state():
+    np = pytest.importorskip("numpy")
+
+    class State(TypedDict):
+        scores: Annotated[np.ndarray, operator.add]
+        rows: Annotated[np.ndarray, ArrayAggregate(np.ndarray, "concat")]
+
+    builder = StateGraph(State)
+    for i in range(3):
+        builder.add_node(
+            f"node{i}", lambda state, i=i: {"scores": np.ones(2) * i, "rows": [i, i]}
+        )
+        builder.add_edge(START, f"node{i}")
+    graph = builder.compile(checkpointer=MemorySaver())
+    assert isinstance(graph.channels["scores"], ArrayAggregate)
+
+    config = {"configurable": {"thread_id": "1"}}
+    result = graph.invoke({"scores": np.zeros(2), "rows": np.empty((0, 2))}, config)
+    assert result["scores"].tolist() == [3, 3]
+    assert result["rows"].tolist() == [[0, 0], [1, 1], [2, 2]]
+    result = graph.invoke({"scores": np.ones(2)}, config)
+    assert result["scores"].tolist() == [7, 7]
+    assert len(result["rows"]) == 6
+    assert graph.get_state(config).values["scores"].tolist() == [7, 7]
+
+
+def test_lazy_node_input():
+    class State(TypedDict):
+        a: int
+        b: Optional[str]
+        c: Annotated[list, operator.add]
+
+    inputs: list = []
+
+    def node(state: State) -> dict:
+        inputs.append(state)
+        assert state["a"] == 1
+        assert state.get("b") is None
+        assert "b" not in state
+        with pytest.raises(KeyError):
+            state["unknown"]
+        # behaves as the dict of the non-empty keys, without being a dict
+        assert not isinstance(state, dict)
+        assert state == {"a": 1, "c": []}
+        assert dict(state) == {"a": 1, "c": []}
+        assert len(state) == 2
+        assert pickle.loads(pickle.dumps(state)) == {"a": 1, "c": []}
+        return {"c": [state["a"]]}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node, lazy=True)
+    builder.add_edge(START, "node")
+    builder.add_edge("node", END)
+    assert builder.compile().invoke({"a": 1}) == {"a": 1, "c": [1]}
+    assert len(inputs) == 1
+
+    # other schemas are still built eagerly
+    @dataclass
+    @dataclass
+    class DataclassState:
+        a: int
+
+    builder = StateGraph(DataclassState)
+    builder.add_node("node", lambda state: inputs.append(state) or {"a": 2}, lazy=True)
+    builder.add_edge(START, "node")
+    builder.compile().invoke({"a": 1})
+    assert inputs[-1] == DataclassState(a=1)
+
+
+def test_offloaded_values_loaded_when_read(tmp_path) -> None:
+    class CountingStore(FilesystemBlobStore):
+        def __init__(self, path: Any) -> None:
+            super().__init__(path)
+            self.puts = 0
+            self.gets = 0
+
+        def put(self, key: str, data: bytes) -> None:
+            self.puts += 1
+            super().put(key, data)
+
+        def get(self, key: str) -> Any:
+            self.gets += 1
+            return super().get(key)
+
+    class State(TypedDict):
+        doc: str
+        count: int
+
+    store = CountingStore(tmp_path)
+    gets: list[int] = []
+
+    def inc(state: State) -> dict:
+        gets.append(store.gets)
+        return {"count": state["count"] + 1}
+
+    builder = StateGraph(State)
+    builder.add_node("inc", inc, lazy=True)
+    builder.add_edge(START, "inc")
+    builder.add_edge("inc", END)
+    graph = builder.compile(
+        checkpointer=MemorySaver(serde=OffloadSerializer(store, threshold=2000))
+    )
+    config = {"configurable": {"thread_id": "1"}}
+    assert graph.invoke({"doc": "x" * 10_000, "count": 0}, config) == {
+        "doc": "x" * 10_000,
+        "count": 1,
+    }
+
+    # the document isn't saved again, nor loaded for nodes which don't read it
+    store.puts = store.gets = 0
+    assert [*graph.stream({"count": 5}, config, stream_mode="updates")] == [
+        {"inc": {"count": 6}}
+    ]
+    assert gets[-1] == 0
+    assert store.puts == 0
+    assert graph.get_state(config).values == {"doc": "x" * 10_000, "count": 6}
+
+
+def test_fan_out_order_on_resume() -> None:
+    class State(TypedDict):
+        log: Annotated[list, operator.add]
+
+    builder = StateGraph(State)
+    for name in ("start", "zeta", "alpha"):
+        builder.add_node(name, lambda state, name=name: {"log": [name]})
+    builder.add_edge(START, "start")
+    builder.add_edge("start", "zeta")
+    builder.add_edge("start", "alpha")
+    fresh = builder.compile().invoke({"log": []})
+
+    graph = builder.compile(checkpointer=MemorySaver(), interrupt_after=["start"])
+    config = {"configurable": {"thread_id": "1"}}
+    graph.invoke({"log": []}, config)
+    resumed = graph.invoke(None, config)
+
+    # writes reach the reducer in node definition order on both paths
+    assert fresh == resumed == {"log": ["start", "zeta", "alpha"]}
+
+
+def test_trusted_state():
+    class Item(PydanticModel):
+        id: int
+
+    class State(PydanticModel):
+        count: int = 0
+        item: Optional[Item] = None
+        items: Annotated[list, operator.add] = []
+
+    inputs: list = []
+
+    def node(state: State) -> dict:
+        inputs.append(state)
+        return {"count": str(state.count + 1), "items": ["not an item"]}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node)
+    builder.add_edge(START, "node")
+    builder.add_edge("node", END)
+    graph = builder.compile(trusted_state=True)
+
+    # keys without a reducer are validated on input and output, once
+    assert graph.invoke({"count": "1", "item": {"id": "2"}}) == {
+        "count": 2,
+        "item": Item(id=2),
+        "items": ["not an item"],
+    }
+    assert inputs == [State(count=1, item=Item(id=2))]
+    with pytest.raises(PydanticValidationError):
+        graph.invoke({"count": "one"})
+
+    class NamedState(PydanticModel):
+        name: str
+
+        @field_validator("name")
+        @classmethod
+        def upper(cls, value: str) -> str:
+            return value.upper()
+
+        @model_validator(mode="after")
+        def check_name(self) -> "NamedState":
+            if "X" in self.name:
+                raise ValueError("invalid name")
+            return self
+
+    names: list = []
+
+    def named(state: NamedState) -> dict:
+        names.append(state.name)
+        return {"name": state.name + "b"}
+
+    builder = StateGraph(NamedState)
+    builder.add_node("named", named)
+    builder.add_node("again", named)
+    builder.add_edge(START, "named")
+    builder.add_edge("named", "again")
+    builder.add_edge("again", END)
+    # nodes receive the same values as when validating the state
+    for trusted_state in (False, True):
+        names.clear()
+        builder.compile(trusted_state=trusted_state).invoke({"name": "a"})
+        assert names == ["A", "AB"]
+        with pytest.raises(PydanticValidationError, match="invalid name"):
+            builder.compile(trusted_state=trusted_state).invoke({"name": "x"})
+
+    @dataclass
+    class DataclassState:
+        count: int
+        items: list = field(default_factory=list)
+
+        def __post_init__(self) -> None:
+            inputs.append("post init")
+
+    builder = StateGraph(DataclassState)
+    builder.add_node("node", lambda state: inputs.append(state) or {"count": 2})
+    builder.add_edge(START, "node")
+    builder.add_edge("node", END)
+    inputs.clear()
+    assert builder.compile(trusted_state=True).invoke({"count": 1}) == {"count": 2}
+    # the input is built without calling __init__ or __post_init__
+    assert len(inputs) == 1
+    assert (inputs[0].count, inputs[0].items) == (1, [])
+
+    # missing values raise the same error as when validating the state
+    with pytest.raises(TypeError, match="missing 1 required positional argument"):
+        builder.compile(trusted_state=True).invoke({"items": [1]})
+
+
+@pytest.mark.anyio
+async def test_fuse_nodes():
+    class State(TypedDict):
+        text: str
+        seen: Annotated[list, operator.add]
+
+    class Text(PydanticModel):
+        text: str
+        seen: list
+
+    def node(name: str):
+        def run(state: State) -> dict:
+            return {"text": state["text"] + name, "seen": [state["text"]]}
+
+        return run
+
+    builder = StateGraph(State)
+    builder.add_node("a", node("a"))
+    builder.add_node("b", node("b"))
+    builder.add_node("c", lambda state: {"text": state.text + "c"}, input=Text)
+    builder.add_node("d", node("d"))
+    builder.add_edge(START, "a")
+    builder.add_edge("a", "b")
+    builder.add_edge("b", "c")
+    builder.add_conditional_edges(
+        "c",
+        lambda state: [Send("b", {"text": "x"})] if len(state.seen) < 3 else "d",
+        ["d"],
+    )
+    builder.add_edge("d", END)
+
+    graph = builder.compile(checkpointer=MemorySaver())
+    fused = builder.compile(checkpointer=MemorySaver(), fuse_nodes=True)
+    assert fused.nodes["a"].bound.name == "a+b+c"
+    assert fused.nodes["b"].bound.name == "b+c"
+    assert fused.nodes["b"].triggers == []
+
+    # each node reads the state updated by the nodes before it, outputs its
+    # update separately, and can still be sent to
+    config = {"configurable": {"thread_id": "1"}}
+    updates = [*graph.stream({"text": "", "seen": []}, config)]
+    assert [*fused.stream({"text": "", "seen": []}, config)] == updates
+    assert updates == [
+        {"a": {"text": "a", "seen": [""]}},
+        {"b": {"text": "ab", "seen": ["a"]}},
+        {"c": {"text": "abc"}},
+        {"b": {"text": "xb", "seen": ["x"]}},
+        {"c": {"text": "xbc"}},
+        {"d": {"text": "xbcd", "seen": ["xbc"]}},
+    ]
+    assert await fused.ainvoke(
+        {"text": "", "seen": []}, {"configurable": {"thread_id": "2"}}
+    ) == {
+        "text": "xbcd",
+        "seen": ["", "a", "x", "xbc"],
+    }
+    # with fewer steps, and checkpoints
+    assert fused.get_state(config).metadata["step"] == 3
+    assert graph.get_state(config).metadata["step"] == 6
+    # the update of each node is only kept in memory, not saved as a write
+    saved = [
+        fused.checkpointer.get_tuple(s.config) for s in fused.get_state_history(config)
+    ]
+    assert any(t.pending_writes for t in saved)
+    assert all(c != FUSED for t in saved for _, c, _ in t.pending_writes)
+
+    # nodes are not fused with nodes with another retry policy or interrupt
+    builder = StateGraph(State)
+    builder.add_node("a", node("a"))
+    builder.add_node("b", node("b"), retry=RetryPolicy(max_attempts=2))
+    builder.add_node("c", node("c"), retry=RetryPolicy(max_attempts=2))
+    builder.add_node("d", node("d"), retry=RetryPolicy(max_attempts=2))
+    builder.add_edge(START, "a")
+    builder.add_edge("a", "b")
+    builder.add_edge("b", "c")
+    builder.add_edge("c", "d")
+    fused = builder.compile(fuse_nodes=True, interrupt_before=["d"])
+    assert fused.nodes["a"].bound.name == "a"
+    assert fused.nodes["b"].bound.name == "b+c"
+    assert fused.nodes["d"].bound.name == "d"
+
+
+def test_conditional_edge_routing():
+    class State(TypedDict):
+        count: Annotated[int, operator.add]
+        route: list[str]
+
+    def route(state: State) -> str:
+        return "b" if state["count"] < 3 else END
+
+    def route_with_config(state: State, config: RunnableConfig) -> list[str]:
+        assert config["configurable"]["thread_id"] == "1"
+        return state["route"]
+
+    builder = StateGraph(State)
+    builder.add_node("a", lambda state: {"count": 1})
+    builder.add_node("b", lambda state: {"count": 1})
+    builder.add_node("c", lambda state: {"count": 10})
+    builder.add_edge(START, "a")
+    builder.add_conditional_edges("a", route, {"b": "b", END: END})
+    builder.add_conditional_edges("b", route_with_config)
+    graph = builder.compile()
+
+    config = {"configurable": {"thread_id": "1"}}
+    assert graph.invoke({"count": 0, "route": ["a"]}, config) == {
+        "count": 3,
+        "route": ["a"],
+    }
+    assert graph.invoke({"count": 0, "route": ["c"]}, config) == {
+        "count": 12,
+        "route": ["c"],
+    }
+    assert [*graph.stream({"count": 0, "route": [END]}, config)] == [
+        {"a": {"count": 1}},
+        {"b": {"count": 1}},
+    ]
+
+    # routers are traced when there are callback handlers
+    class Handler(BaseCallbackHandler):
+        def __init__(self) -> None:
+            self.names: list[str] = []
+
+        def on_chain_start(self, serialized, inputs, **kwargs):
+            self.names.append(kwargs.get("name"))
+
+    handler = Handler()
+    graph.invoke({"count": 0, "route": [END]}, {**config, "callbacks": [handler]})
+    assert "route" in handler.names